@@ -1,7 +1,16 @@
 import os
 import json
 import traceback
-from flask import Flask, render_template, jsonify, request, abort, send_from_directory
+from flask import (
+    Flask,
+    render_template,
+    jsonify,
+    request,
+    abort,
+    send_from_directory,
+    g,
+    Response,
+)
 from youtube_automation import YouTubeWatchLaterAutomation
 from config import Config, active_config
 import threading
@@ -13,10 +22,27 @@ import time
 from utils.logger import LoggerSetup
 from utils.decorators import handle_ssl_error
 from config import Config
-import isodate
 from datetime import datetime, timedelta
 from utils import format_duration_readable
-
+from video_fetcher import VideoBatchFetcher
+from channel_fetcher import ChannelFetchEngine, TokenBucket, thread_local_http
+from uploads_resolver import UploadsPlaylistResolver
+from http_cache import ETagCacheStore, install_http_cache
+from route_cache import RouteCache
+from response_pipeline import install_response_pipeline
+from list_query import ListIndexCache, parse_list_query
+from event_broadcaster import EventBroadcaster, StatePublisher
+from watermark_store import ChannelWatermarkStore
+from channel_monitor import IncrementalChannelMonitor
+from async_monitor import AsyncChannelMonitor
+from video_store import VideoMetadataStore
+from youtube_standin import build_standin_client
+from quota_ledger import (
+    QuotaLedger,
+    install_quota_accounting,
+    set_caller,
+    reset_caller,
+)
 
 # Initialisation de l'application Flask
 app = Flask(__name__)
@@ -36,11 +62,124 @@ logger = LoggerSetup.setup(
 
 # Initialisation de l'automation YouTube
 automation = YouTubeWatchLaterAutomation(app.config["YOUTUBE_API_KEY"])
+if Config.YOUTUBE_API_ENDPOINT:
+    # Client pointant vers l'API simulée : pas d'authentification OAuth
+    automation.youtube = build_standin_client(Config.YOUTUBE_API_ENDPOINT)
 monitoring_thread = None
 is_monitoring = False
 
-# Cache simple pour les requêtes fréquentes
-cache = {}
+# Cache des réponses des routes en lecture, invalidé par les routes qui
+# modifient les données et par le compteur de version des statistiques.
+# Les mêmes compteurs donnent les ETags des GET conditionnels (304) : sous
+# une route conditionnelle, le cache vérifie la même version que l'ETag.
+route_cache = RouteCache()
+
+
+def statistics_version():
+    return automation.statistics_manager.version
+
+
+def tracked_version():
+    return automation.statistics_manager.tracked_version
+
+
+# Pagination des routes de listes : index triés par collection, reconstruits
+# quand la version change. La playlist et les abonnements changent aussi
+# hors de l'application : leur version expire comme le cache des routes.
+list_indexes = ListIndexCache()
+
+
+def watch_later_list_version():
+    return (
+        route_cache.generation("watch_later"),
+        tracked_version(),
+        int(time.time() // 300),
+    )
+
+
+def subscriptions_list_version():
+    return route_cache.generation("subscriptions", "channels"), int(time.time() // 600)
+
+
+# Limiteur de débit partagé par toutes les requêtes vers l'API YouTube
+api_rate_limiter = TokenBucket(Config.API_RATE_LIMIT)
+
+# Cache persistant des playlists d'uploads des chaînes
+uploads_resolver = UploadsPlaylistResolver()
+
+# Registre du quota API : chaque requête sortante est comptée au coût officiel
+quota_ledger = QuotaLedger()
+automation.quota_ledger = quota_ledger
+
+# Métadonnées des vidéos partagées (durée, Short, statistiques), utilisées
+# aussi par l'automation pour la vérification des Shorts à l'ajout
+video_store = VideoMetadataStore()
+automation.video_store = video_store
+
+# Surveillance incrémentale : marqueur de dernière vidéo vue par chaîne,
+# utilisée par la boucle de surveillance de l'automation
+channel_watermarks = ChannelWatermarkStore()
+
+
+def quota_state():
+    if getattr(automation, "is_loading_subscriptions", False):
+        return {"loading": True, "message": "Chargement des chaînes en cours..."}
+    status = quota_ledger.get_status()
+    # Le détail par appelant change à chaque requête : non diffusé
+    status.pop("by_caller", None)
+    status.pop("by_method", None)
+    return {"loading": False, **status}
+
+
+def monitoring_state():
+    return {
+        "is_monitoring": automation.get_monitoring_status()["is_monitoring"],
+        "last_check": automation.statistics_manager.get_last_check_time(),
+    }
+
+
+def stats_state():
+    stats = automation.statistics_manager.get_current_stats()
+    stats.pop("quota_usage", None)
+    stats["tracked_version"] = automation.statistics_manager.tracked_version
+    return stats
+
+
+# Évènements poussés aux navigateurs : un seul producteur échantillonne le
+# quota, la surveillance et les statistiques et ne diffuse que les
+# changements ; les ajouts et retraits de vidéos sont publiés à la source
+event_broadcaster = EventBroadcaster()
+state_publisher = StatePublisher(
+    event_broadcaster,
+    {"quota": quota_state, "monitoring": monitoring_state, "stats": stats_state},
+)
+automation.statistics_manager.add_listener(event_broadcaster.publish)
+
+
+def create_channel_monitor():
+    """Moteur de surveillance choisi par MONITORING_ENGINE (thread ou asyncio)."""
+    if Config.MONITORING_ENGINE == "asyncio":
+        try:
+            return AsyncChannelMonitor(
+                uploads_resolver,
+                channel_watermarks,
+                store=video_store,
+                ledger=quota_ledger,
+            )
+        except ImportError as e:
+            logger.warning(f"Moteur asyncio indisponible, repli sur les threads: {e}")
+    return IncrementalChannelMonitor(
+        uploads_resolver,
+        channel_watermarks,
+        rate_limiter=api_rate_limiter,
+        store=video_store,
+    )
+
+
+automation.channel_monitor = create_channel_monitor()
+
+# Cache HTTP conditionnel (ETag / If-None-Match) sous le client YouTube
+http_cache_store = ETagCacheStore() if Config.HTTP_CACHE_ENABLED else None
 
 
 # Ajout du décorateur SSL ici
@@ -77,6 +216,8 @@ def handle_ssl_error(func):
 app = Flask(__name__)
 app.config.from_object(active_config)
 Config.init_app(app)
+# jsonify rapide (orjson si installé) et compression gzip/brotli des réponses
+install_response_pipeline(app)
 
 
 def init_check_hours_file():
@@ -113,25 +254,17 @@ def init_check_hours_file():
 init_check_hours_file()
 
 
-def cache_response(duration=300):
-    """Décorateur pour mettre en cache les réponses des routes."""
-
-    def decorator(f):
-        @wraps(f)
-        def wrapper(*args, **kwargs):
-            cache_key = f.__name__ + str(args) + str(kwargs)
-            now = time.time()
-
-            if cache_key in cache and cache[cache_key]["expires"] > now:
-                return cache[cache_key]["data"]
+@app.before_request
+def set_quota_caller():
+    """Attribue le quota consommé pendant la requête à la route appelée."""
+    g.quota_token = set_caller(request.endpoint or request.path)
 
-            result = f(*args, **kwargs)
-            cache[cache_key] = {"data": result, "expires": now + duration}
-            return result
 
-        return wrapper
-
-    return decorator
+@app.teardown_request
+def reset_quota_caller(exception=None):
+    token = g.pop("quota_token", None)
+    if token is not None:
+        reset_caller(token)
 
 
 def require_auth(f):
@@ -153,6 +286,9 @@ def require_auth(f):
                     ),
                     401,
                 )
+        if http_cache_store:
+            install_http_cache(automation.youtube, http_cache_store)
+        install_quota_accounting(automation.youtube, quota_ledger)
         return f(*args, **kwargs)
 
     return decorated_function
@@ -160,10 +296,10 @@ def require_auth(f):
 
 @app.route("/get_watch_time")
 @require_auth
+@route_cache.cached(tags=("statistics",), version=statistics_version)
 def get_watch_time():
     try:
-        total_time = automation.video_tracker.calculate_total_duration()
-        video_count = len(automation.video_tracker.videos)
+        video_count, total_time = automation.statistics_manager.get_totals()
         logger.info(
             f"Temps de visionnage calculé depuis tracked_videos.json: {format_duration_readable(total_time)}"
         )
@@ -180,8 +316,74 @@ def get_watch_time():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route("/get_video_history")
+@require_auth
+@route_cache.cached(tags=("statistics",), version=statistics_version)
+def get_video_history():
+    try:
+        limit = min(max(request.args.get("limit", 50, type=int), 1), 500)
+        cursor = request.args.get("cursor", type=int)
+        page = automation.statistics_manager.get_video_history_page(limit, cursor)
+        return jsonify({"success": True, **page})
+    except Exception as e:
+        logger.error(f"Erreur lors de la récupération de l'historique: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/get_daily_stats")
+@require_auth
+@route_cache.cached(tags=("statistics",), version=statistics_version)
+def get_daily_stats():
+    try:
+        days = min(max(request.args.get("days", 7, type=int), 1), 3660)
+        resolution = request.args.get("resolution", "day")
+        if resolution not in ("hour", "day", "week", "month"):
+            return jsonify({"success": False, "error": "Résolution invalide"}), 400
+        daily_stats = automation.statistics_manager.get_daily_stats(
+            days, resolution, request.args.get("channel_id")
+        )
+        return jsonify({"success": True, "daily_stats": daily_stats})
+    except Exception as e:
+        logger.error(f"Erreur lors de la récupération des stats quotidiennes: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/get_channel_activity")
+@require_auth
+@route_cache.cached(
+    ttl=300, tags=("statistics", "subscriptions"), version=statistics_version
+)
+def get_channel_activity():
+    try:
+        days = min(max(request.args.get("days", 30, type=int), 1), 3660)
+        limit = min(max(request.args.get("limit", 10, type=int), 1), 100)
+        channels = automation.statistics_manager.get_channel_activity(days, limit)
+
+        # Titres manquants : compléter depuis le cache des abonnements
+        if any(not channel["title"] for channel in channels):
+            titles = {}
+            cache_file = "cached_subscriptions.json"
+            if os.path.exists(cache_file):
+                try:
+                    with open(cache_file, "r", encoding="utf-8") as f:
+                        titles = {sub["id"]: sub["title"] for sub in json.load(f)}
+                except Exception as e:
+                    logger.error(f"Erreur lors de la lecture du cache: {str(e)}")
+            for channel in channels:
+                if not channel["title"]:
+                    channel["title"] = titles.get(
+                        channel["channel_id"], channel["channel_id"]
+                    )
+
+        return jsonify({"success": True, "channels": channels})
+    except Exception as e:
+        logger.error(f"Erreur lors de la récupération de l'activité: {str(e)}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @app.route("/remove_from_watch_later", methods=["POST"])
 @require_auth
+@route_cache.invalidates("statistics", "watch_later")
 def remove_from_watch_later():
     try:
         data = request.get_json()
@@ -192,9 +394,7 @@ def remove_from_watch_later():
 
         if result["success"]:
             # Obtenir les stats mises à jour
-            stats = automation.statistics_manager.get_current_stats()
-            total_time = automation.video_tracker.calculate_total_duration()
-            video_count = len(automation.video_tracker.videos)
+            video_count, total_time = automation.statistics_manager.get_totals()
 
             return jsonify(
                 {
@@ -217,10 +417,32 @@ def remove_from_watch_later():
 
 @app.route("/get_tracked_videos")
 @require_auth
+@route_cache.conditional(tags=("statistics", "watch_later"), version=tracked_version)
+@route_cache.cached(tags=("statistics", "watch_later"), version=tracked_version)
 def get_tracked_videos():
+    """Vidéos suivies ; paginées avec limit, cursor, sort, order et fields."""
+    try:
+        query = parse_list_query(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     try:
-        tracked_videos = automation.statistics_manager.stats.get("tracked_videos", {})
-        return jsonify({"success": True, "videos": tracked_videos})
+        if query is not None:
+            page = list_indexes.page(
+                "tracked_videos",
+                tracked_version(),
+                automation.statistics_manager.get_tracked_videos,
+                query,
+            )
+            return jsonify(
+                {
+                    "success": True,
+                    "videos": page["items"],
+                    "next_cursor": page["next_cursor"],
+                    "total_count": page["total_count"],
+                }
+            )
+        tracked_videos = automation.statistics_manager.get_tracked_videos()
+        return jsonify({"success": True, "videos": dict(tracked_videos)})
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des vidéos suivies: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
@@ -233,10 +455,31 @@ def serve_js(filename):
 
 @app.route("/get_watch_later_videos")
 @require_auth
+@route_cache.conditional(tags=("watch_later",), version=tracked_version, max_age=300)
+@route_cache.cached(ttl=300, tags=("watch_later",), version=watch_later_list_version)
 def get_watch_later_videos():
-    """Récupère les vidéos de la playlist Watch Later."""
+    """Récupère les vidéos de la playlist Watch Later (paginées si demandé)."""
+    try:
+        query = parse_list_query(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     try:
         logger.info("Récupération des vidéos Watch Later...")
+        if query is not None:
+            page = list_indexes.page(
+                "watch_later",
+                watch_later_list_version(),
+                automation.get_watch_later_videos,
+                query,
+            )
+            return jsonify(
+                {
+                    "success": True,
+                    "videos": page["items"],
+                    "next_cursor": page["next_cursor"],
+                    "total_count": page["total_count"],
+                }
+            )
         videos = automation.get_watch_later_videos()
         return jsonify({"success": True, "videos": videos})
     except Exception as e:
@@ -304,15 +547,19 @@ def favicon():
 
 @app.route("/subscribe_to_updates")
 def subscribe_to_updates():
-    def generate():
-        while True:
-            status = automation.get_monitoring_status()
-            quota = automation.get_quota_status()
-            data = {"status": status, "quota": quota, "is_monitoring": is_monitoring}
-            yield f"data: {json.dumps(data)}\n\n"
-            time.sleep(5)
-
-    return Response(generate(), mimetype="text/event-stream")
+    """Flux SSE : état complet à la connexion, puis seulement les changements."""
+    subscriber = event_broadcaster.subscribe()
+    if subscriber is None:
+        return jsonify({"success": False, "error": "Trop de clients connectés"}), 503
+    state_publisher.start()
+    initial = EventBroadcaster.format_event("state", state_publisher.sample())
+    response = Response(
+        event_broadcaster.stream(subscriber, [initial]),
+        mimetype="text/event-stream",
+    )
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
 
 
 @app.route("/")
@@ -322,29 +569,48 @@ def index():
 
 @app.route("/get_subscriptions")
 @require_auth
+@route_cache.conditional(tags=("subscriptions", "channels"), max_age=600)
+@route_cache.cached(
+    ttl=600, tags=("subscriptions", "channels"), version=subscriptions_list_version
+)
 def get_subscriptions():
-    """Récupère la liste des abonnements."""
+    """Récupère la liste des abonnements (paginée si demandé)."""
+    try:
+        query = parse_list_query(request.args)
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     try:
         logger.info("Récupération des abonnements...")
         automation.is_loading_subscriptions = (
             True  # Indiquer que le chargement commence
         )
 
-        subscriptions = automation.get_subscriptions()
+        if query is not None:
+            page = list_indexes.page(
+                "subscriptions",
+                subscriptions_list_version(),
+                automation.get_subscriptions,
+                query,
+            )
+            subscriptions = page["items"]
+        else:
+            page = None
+            subscriptions = automation.get_subscriptions()
 
         automation.is_loading_subscriptions = (
             False  # Indiquer que le chargement est terminé
         )
 
         # Une fois les chaînes chargées, mettre à jour le quota
-        quota_status = automation.get_quota_status()
+        quota_status = quota_ledger.get_status()
 
         return jsonify(
             {
                 "success": True,
                 "subscriptions": subscriptions,
                 "is_monitoring": automation.get_monitoring_status()["is_monitoring"],
-                "total_count": len(subscriptions),
+                "total_count": page["total_count"] if page else len(subscriptions),
+                "next_cursor": page["next_cursor"] if page else None,
                 "quota_status": quota_status,
             }
         )
@@ -357,6 +623,9 @@ def get_subscriptions():
 
 @app.route("/get_statistics")
 @require_auth
+@route_cache.cached(
+    tags=("statistics", "subscriptions", "channels"), version=statistics_version
+)
 def get_statistics():
     try:
         stats = automation.statistics_manager.get_current_stats()
@@ -378,8 +647,7 @@ def get_statistics():
 
         # Mettre à jour les statistiques
         if hasattr(automation, "statistics_manager"):
-            automation.statistics_manager.stats["total_channels"] = total_channels
-            automation.statistics_manager.save()
+            automation.statistics_manager.update_total_channels(total_channels)
 
         # Mettre à jour le total dans la réponse
         stats["total_channels"] = total_channels
@@ -391,6 +659,22 @@ def get_statistics():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _fetch_channel_videos(channel_id, playlist_id, max_results):
+    """Récupère les vidéos récentes d'une chaîne (exécuté dans un thread du pool)."""
+    fetcher = VideoBatchFetcher(
+        automation.youtube,
+        http=thread_local_http(automation.youtube),
+        rate_limiter=api_rate_limiter,
+        store=video_store,
+    )
+    try:
+        return fetcher.get_playlist_videos(playlist_id, max_results=max_results)
+    except Exception:
+        # La playlist a peut-être changé : forcer une nouvelle résolution
+        uploads_resolver.invalidate(channel_id)
+        raise
+
+
 @app.route("/get_latest_videos")
 @require_auth
 def get_latest_videos():
@@ -408,46 +692,46 @@ def get_latest_videos():
         if not selected_channel_ids:
             return jsonify({"success": True, "videos": []})
 
-        latest_videos = []
-        max_videos_per_channel = min(
-            Config.MAX_VIDEOS_PER_CHANNEL,
-            Config.MAX_RECENT_VIDEOS // len(selected_channel_ids),
+        max_videos_per_channel = max(
+            1,
+            min(
+                Config.MAX_VIDEOS_PER_CHANNEL,
+                Config.MAX_RECENT_VIDEOS // len(selected_channel_ids),
+            ),
         )
 
-        for channel_id in selected_channel_ids:
-            try:
-                # Obtenir les informations de la chaîne
-                channel_request = automation.youtube.channels().list(
-                    part="snippet,contentDetails", id=channel_id
-                )
-                channel_response = channel_request.execute()
-
-                if not channel_response["items"]:
-                    continue
-
-                channel = channel_response["items"][0]
-                playlist_id = channel["contentDetails"]["relatedPlaylists"]["uploads"]
-
-                # Récupérer les vidéos récentes
-                videos = automation.get_recent_videos(
-                    playlist_id=playlist_id, max_results=max_videos_per_channel
-                )
-
-                latest_videos.extend(videos)
-                time.sleep(Config.API_QUOTA_DELAY)  # Respecter les quotas
-
-            except Exception as e:
-                logger.error(f"Erreur pour la chaîne {channel_id}: {str(e)}")
-                continue
-
-        # Trier par date de publication
-        latest_videos.sort(key=lambda x: x["publishedAt"], reverse=True)
+        # Résoudre les playlists des uploads (cache persistant, appels groupés)
+        playlists = uploads_resolver.resolve_many(
+            automation.youtube,
+            selected_channel_ids,
+        )
 
-        # Limiter le nombre total de vidéos
-        latest_videos = latest_videos[: Config.MAX_RECENT_VIDEOS]
+        engine = ChannelFetchEngine(
+            lambda channel_id: _fetch_channel_videos(
+                channel_id, playlists[channel_id], max_videos_per_channel
+            )
+        )
+        result = engine.fetch(list(playlists), limit=Config.MAX_RECENT_VIDEOS)
+        latest_videos = result["videos"]
+        report = result["report"]
+
+        # Chaînes sans playlist des uploads : jamais interrogées, mais en erreur
+        unresolved = [
+            cid for cid in dict.fromkeys(selected_channel_ids) if cid not in playlists
+        ]
+        for channel_id in unresolved:
+            report["channels"][channel_id] = {
+                "duration": 0,
+                "video_count": 0,
+                "error": "Playlist des uploads introuvable",
+            }
+        report["failed"].extend(unresolved)
 
-        logger.info(f"{len(latest_videos)} vidéos récupérées")
-        return jsonify({"success": True, "videos": latest_videos})
+        logger.info(
+            f"{len(latest_videos)} vidéos récupérées en {report['duration']}s "
+            f"({len(report['failed'])} chaînes en erreur)"
+        )
+        return jsonify({"success": True, "videos": latest_videos, "report": report})
 
     except Exception as e:
         logger.error(f"Erreur lors de la récupération des vidéos: {str(e)}")
@@ -456,6 +740,7 @@ def get_latest_videos():
 
 @app.route("/check_watched_videos")
 @require_auth
+@route_cache.invalidates("statistics", "watch_later")
 def check_watched_videos():
     """Vérifie et retire les vidéos déjà regardées."""
     try:
@@ -468,7 +753,7 @@ def check_watched_videos():
                 raise ValueError("Playlist Watch Later non initialisée")
 
             # Vérifier le quota avant de commencer
-            quota_status = automation.get_quota_status()
+            quota_status = quota_ledger.get_status()
             if quota_status["percentage_used"] > 95:
                 raise QuotaExceededError("Quota API YouTube presque épuisé")
 
@@ -519,7 +804,7 @@ def check_watched_videos():
                                 "time_saved": round(time_difference, 2),
                             },
                         },
-                        "quota_info": automation.get_quota_status(),
+                        "quota_info": quota_ledger.get_status(),
                         "timestamp": datetime.now().isoformat(),
                     },
                 }
@@ -572,6 +857,7 @@ def check_watched_videos():
 
 @app.route("/refresh_channels")
 @require_auth
+@route_cache.invalidates("subscriptions", "channels")
 def refresh_channels():
     """Force le rafraîchissement des abonnements."""
     try:
@@ -603,83 +889,25 @@ def get_recent_videos(channel_id):
         logger.info(f"Récupération des vidéos pour la chaîne {channel_id}")
 
         # Vérifier que l'ID de la chaîne est valide
-        channel_request = automation.youtube.channels().list(
-            part="contentDetails", id=channel_id
+        playlist_id = uploads_resolver.resolve(
+            automation.youtube,
+            channel_id,
         )
-        channel_response = channel_request.execute()
-
-        if not channel_response["items"]:
+        if not playlist_id:
             raise ValueError(Config.get_error_message("invalid_channel"))
 
-        playlist_id = channel_response["items"][0]["contentDetails"][
-            "relatedPlaylists"
-        ]["uploads"]
-
-        # Obtenir toutes les vidéos récentes
-        request = automation.youtube.playlistItems().list(
-            part="snippet,contentDetails",
-            playlistId=playlist_id,
-            maxResults=Config.MAX_VIDEOS_PER_CHANNEL,
+        # Obtenir les vidéos récentes, détails récupérés par paquets de 50
+        fetcher = VideoBatchFetcher(
+            automation.youtube,
+            store=video_store,
         )
-        response = request.execute()
-        automation._update_quota(cost=1)
-
-        videos = []
-        for item in response.get("items", []):
-            video_id = item["snippet"]["resourceId"]["videoId"]
-
-            # Vérifier les détails de la vidéo pour identifier les Shorts
-            video_request = automation.youtube.videos().list(
-                part="snippet,contentDetails,statistics", id=video_id
+        try:
+            videos = fetcher.get_playlist_videos(
+                playlist_id, max_results=Config.MAX_VIDEOS_PER_CHANNEL
             )
-            video_response = video_request.execute()
-            automation._update_quota(cost=1)
-
-            if not video_response["items"]:
-                continue
-
-            video = video_response["items"][0]
-
-            # Vérifier si c'est un Short en examinant l'URL de la vidéo
-            try:
-                # Récupérer l'URL canonique de la vidéo
-                video_url = f"https://www.youtube.com/watch?v={video_id}"
-                snippet = video["snippet"]
-                if (
-                    "shorts" in video.get("snippet", {}).get("customUrl", "").lower()
-                    or "shorts" in snippet.get("description", "").lower()
-                ):
-                    continue
-
-                # Ignorer les vidéos au format vertical et de courte durée
-                duration = video["contentDetails"]["duration"]
-                duration_seconds = isodate.parse_duration(duration).total_seconds()
-
-                if duration_seconds <= 61:  # Ignorer les vidéos de moins de 61 secondes
-                    continue
-
-                # Ajouter la vidéo si ce n'est pas un Short
-                videos.append(
-                    {
-                        "id": video_id,
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"]["description"],
-                        "publishedAt": item["snippet"]["publishedAt"],
-                        "thumbnail": item["snippet"]["thumbnails"]
-                        .get("medium", {})
-                        .get("url"),
-                        "channelTitle": item["snippet"]["channelTitle"],
-                        "duration": duration,
-                        "viewCount": video["statistics"].get("viewCount", "0"),
-                        "likeCount": video["statistics"].get("likeCount", "0"),
-                    }
-                )
-
-            except Exception as e:
-                logger.warning(
-                    f"Erreur lors du traitement de la vidéo {video_id}: {str(e)}"
-                )
-                continue
+        except Exception:
+            uploads_resolver.invalidate(channel_id)
+            raise
 
         logger.info(f"{len(videos)} vidéos récupérées pour la chaîne {channel_id}")
         return jsonify({"success": True, "videos": videos})
@@ -694,6 +922,7 @@ def get_recent_videos(channel_id):
 
 @app.route("/add_to_watch_later", methods=["POST"])
 @require_auth
+@route_cache.invalidates("statistics", "watch_later")
 def add_to_watch_later_route():
     """Ajoute une vidéo à la playlist Watch Later."""
     try:
@@ -759,7 +988,7 @@ def get_quota_status():
                 }
             )
 
-        quota_status = automation.get_quota_status()
+        quota_status = quota_ledger.get_status()
         return jsonify({"success": True, "quota": quota_status})
     except Exception as e:
         logger.error(f"Erreur lors de la récupération du statut du quota: {str(e)}")
@@ -768,6 +997,7 @@ def get_quota_status():
 
 @app.route("/save_channels", methods=["POST"])
 @require_auth
+@route_cache.invalidates("channels", "subscriptions", "statistics")
 def save_channels():
     try:
         data = request.get_json()
@@ -793,6 +1023,7 @@ def save_channels():
 
         if result["success"]:
             logger.info(f"{len(channel_ids)} chaînes sauvegardées")
+            channel_watermarks.prune(channel_ids)
 
             # On retourne directement le résultat qui contient déjà les stats
             return jsonify(result)
@@ -807,6 +1038,8 @@ def save_channels():
 
 @app.route("/get_selected_channels")
 @require_auth
+@route_cache.conditional(tags=("channels",))
+@route_cache.cached(ttl=600, tags=("channels",))
 def get_selected_channels():
     try:
         selected_channels = automation.get_selected_channels()
@@ -866,6 +1099,9 @@ def start_monitoring():
 def stop_monitoring():
     """Arrête la surveillance."""
     try:
+        # Interrompre immédiatement une passe asyncio en cours
+        if hasattr(automation.channel_monitor, "cancel"):
+            automation.channel_monitor.cancel()
         if automation.stop_monitoring_process():  # Utiliser la nouvelle méthode
             return jsonify({"success": True, "message": "Surveillance arrêtée"})
         return (
@@ -896,11 +1132,7 @@ def debug_subscriptions():
             "auth_status": (
                 "authenticated" if automation.youtube else "not_authenticated"
             ),
-            "quota_status": (
-                automation.get_quota_status()
-                if hasattr(automation, "get_quota_status")
-                else None
-            ),
+            "quota_status": quota_ledger.get_status(),
             "error": None,
         }
 
@@ -939,12 +1171,40 @@ def debug_auth_status():
 def debug_quota():
     """Vérifie le statut du quota API."""
     try:
-        quota_status = automation.get_quota_status()
+        quota_status = quota_ledger.get_status()
         return jsonify({"success": True, "quota": quota_status})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route("/debug/http_cache")
+def debug_http_cache():
+    """Statistiques du cache HTTP ETag."""
+    if not http_cache_store:
+        return jsonify({"success": True, "enabled": False})
+    return jsonify(
+        {"success": True, "enabled": True, "cache": http_cache_store.get_stats()}
+    )
+
+
+@app.route("/debug/route_cache")
+def debug_route_cache():
+    """Compteurs du cache des réponses des routes."""
+    return jsonify({"success": True, "cache": route_cache.get_stats()})
+
+
+@app.route("/debug/events")
+def debug_events():
+    """Clients SSE connectés et évènements diffusés."""
+    return jsonify({"success": True, "events": event_broadcaster.get_stats()})
+
+
+@app.route("/debug/video_store")
+def debug_video_store():
+    """Statistiques du store de métadonnées des vidéos."""
+    return jsonify({"success": True, "store": video_store.get_stats()})
+
+
 @app.route("/debug/check_files")
 def debug_check_files():
     """Vérifie l'existence et les permissions des fichiers importants."""
@@ -1184,6 +1444,13 @@ def cleanup():
             monitoring_thread.join(timeout=1)
         if automation:
             automation.cleanup()
+            # Écrire les statistiques encore en attente
+            if hasattr(automation, "statistics_manager"):
+                automation.statistics_manager.flush()
+        state_publisher.stop()
+        event_broadcaster.close_all()
+        video_store.close()
+        quota_ledger.flush()
     except Exception as e:
         logger.error(f"Erreur lors du nettoyage: {str(e)}")
 
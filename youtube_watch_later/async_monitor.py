@@ -0,0 +1,288 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from config import Config
+from exceptions import APIError, QuotaExceededError
+from quota_ledger import QuotaLedger, quota_caller
+from uploads_resolver import UploadsPlaylistResolver
+from video_fetcher import (
+    MAX_IDS_PER_REQUEST,
+    chunk_ids,
+    format_video,
+    records_from_details,
+)
+from watermark_store import ChannelWatermarkStore
+
+try:
+    import aiohttp
+except ImportError:  # Dépendance optionnelle
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://youtube.googleapis.com/"
+
+
+class QuotaAwareSemaphore:
+    """Sémaphore bornant les appels simultanés et refusant d'entamer la réserve de quota."""
+
+    def __init__(self, max_concurrency: int, ledger: Optional[QuotaLedger]):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.ledger = ledger
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        if self.ledger:
+            status = self.ledger.get_status()
+            if status["remaining"] <= Config.YOUTUBE_QUOTA_RESERVE:
+                self._semaphore.release()
+                raise QuotaExceededError("Réserve de quota atteinte")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+
+
+class AsyncChannelMonitor:
+    """Moteur de surveillance asyncio : des centaines de chaînes vérifiées en parallèle.
+
+    Même interface que IncrementalChannelMonitor (run_pass), exécuté dans le
+    thread de surveillance avec sa propre boucle d'évènements ; cancel()
+    interrompt la passe en cours depuis un autre thread.
+    """
+
+    def __init__(
+        self,
+        resolver: UploadsPlaylistResolver,
+        watermarks: ChannelWatermarkStore,
+        store=None,
+        ledger: QuotaLedger = None,
+        max_concurrency: int = None,
+        max_items: int = None,
+    ):
+        if aiohttp is None:
+            raise ImportError("aiohttp est requis pour le moteur asyncio")
+        self.resolver = resolver
+        self.watermarks = watermarks
+        self.store = store
+        self.ledger = ledger
+        self.max_concurrency = max_concurrency or Config.ASYNC_MAX_CONCURRENCY
+        self.max_items = max_items or Config.MAX_VIDEOS_PER_CHANNEL
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._state_lock = threading.Lock()
+
+    # Accès HTTP
+
+    def _auth(self, youtube) -> Tuple[Dict, Dict]:
+        """En-têtes et paramètres d'authentification du client googleapiclient."""
+        credentials = getattr(getattr(youtube, "_http", None), "credentials", None)
+        # httplib2.Http possède aussi un attribut credentials, sans jeton OAuth
+        if credentials is not None and hasattr(credentials, "token"):
+            if not credentials.valid:
+                from google.auth.transport.requests import Request
+
+                credentials.refresh(Request())
+            return {"Authorization": f"Bearer {credentials.token}"}, {}
+        key = getattr(youtube, "_developerKey", None)
+        return {}, ({"key": key} if key else {})
+
+    async def _get(self, session, resource: str, params: Dict) -> Dict:
+        """Requête GET non bloquante vers l'API, comptée dans le registre de quota."""
+        async with self._semaphore:
+            async with session.get(
+                f"{self._base_url}{resource}", params={**self._params, **params}
+            ) as response:
+                if self.ledger:
+                    # Écriture du registre sur disque : hors de la boucle
+                    await asyncio.to_thread(
+                        self.ledger.record, resource, "list", 1, caller="monitoring"
+                    )
+                body = await response.json(content_type=None)
+                if response.status >= 400:
+                    if "quotaExceeded" in str(body):
+                        raise QuotaExceededError("Quota API dépassé")
+                    raise APIError(str(body.get("error", body)), response.status)
+                return body
+
+    # Logique de surveillance
+
+    async def _list_items_since(self, session, playlist_id: str, watermark):
+        items = []
+        page_token = None
+        while len(items) < self.max_items:
+            params = {
+                "part": "snippet,contentDetails",
+                "playlistId": playlist_id,
+                "maxResults": min(self.max_items - len(items), MAX_IDS_PER_REQUEST),
+            }
+            if page_token:
+                params["pageToken"] = page_token
+            response = await self._get(session, "playlistItems", params)
+            for item in response.get("items", []):
+                if watermark and (
+                    item["snippet"]["resourceId"]["videoId"] == watermark["video_id"]
+                    or item["snippet"]["publishedAt"] <= watermark["published_at"]
+                ):
+                    return items
+                items.append(item)
+            page_token = response.get("nextPageToken")
+            if not watermark or not page_token:
+                break
+        return items[: self.max_items]
+
+    async def _get_records(self, session, video_ids: List[str]) -> Dict[str, Dict]:
+        # Stockage SQLite lu et écrit dans un thread, sans bloquer les autres chaînes
+        records = (
+            await asyncio.to_thread(self.store.get_many, video_ids)
+            if self.store
+            else {}
+        )
+        missing = [video_id for video_id in video_ids if video_id not in records]
+        for batch in chunk_ids(missing):
+            response = await self._get(
+                session,
+                "videos",
+                {"part": "snippet,contentDetails,statistics", "id": ",".join(batch)},
+            )
+            fetched = records_from_details(
+                {video["id"]: video for video in response.get("items", [])}
+            )
+            if self.store:
+                await asyncio.to_thread(self.store.put_many, fetched)
+            records.update(fetched)
+        return records
+
+    async def _check_channel(self, session, channel_id: str, playlist_id: str):
+        items = await self._list_items_since(
+            session, playlist_id, self.watermarks.get(channel_id)
+        )
+        if not items:
+            return [], None
+
+        newest = max(items, key=lambda item: item["snippet"]["publishedAt"])
+        mark = (
+            newest["snippet"]["resourceId"]["videoId"],
+            newest["snippet"]["publishedAt"],
+        )
+        records = await self._get_records(
+            session, [item["snippet"]["resourceId"]["videoId"] for item in items]
+        )
+        videos = []
+        for item in items:
+            record = records.get(item["snippet"]["resourceId"]["videoId"])
+            if record and not record["is_short"]:
+                videos.append(format_video(item, record))
+        return videos, mark
+
+    async def _run(self, youtube, channel_ids, handler) -> Dict:
+        headers, self._params = await asyncio.to_thread(self._auth, youtube)
+        # Racine du client (api_endpoint éventuel), les chemins incluant youtube/v3
+        base_url = getattr(youtube, "_baseUrl", None) or DEFAULT_BASE_URL
+        self._base_url = f"{base_url.rstrip('/')}/youtube/v3/"
+        self._semaphore = QuotaAwareSemaphore(self.max_concurrency, self.ledger)
+        playlists = await asyncio.to_thread(
+            self.resolver.resolve_many, youtube, channel_ids
+        )
+
+        marks = {}
+        errors = {}
+        new_count = 0
+        handler_lock = asyncio.Lock()
+
+        async def check(session, channel_id, playlist_id):
+            nonlocal new_count
+            try:
+                videos, mark = await self._check_channel(
+                    session, channel_id, playlist_id
+                )
+            except QuotaExceededError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Erreur lors de la vérification de {channel_id}: {str(e)}"
+                )
+                errors[channel_id] = str(e)
+                await asyncio.to_thread(self.resolver.invalidate, channel_id)
+                return
+
+            try:
+                if videos:
+                    # Le traitement (ajout à la playlist) reste séquentiel
+                    async with handler_lock:
+                        await asyncio.to_thread(handler, channel_id, videos)
+                    new_count += len(videos)
+                if mark:
+                    marks[channel_id] = mark
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement de {channel_id}: {str(e)}")
+                errors[channel_id] = str(e)
+
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        try:
+            async with aiohttp.ClientSession(
+                headers=headers, connector=connector
+            ) as session:
+                results = await asyncio.gather(
+                    *(check(session, cid, pid) for cid, pid in playlists.items()),
+                    return_exceptions=True,
+                )
+            for result in results:
+                if isinstance(result, QuotaExceededError):
+                    errors["quota"] = str(result)
+                    break
+        finally:
+            # Conserver la progression, même en cas d'annulation
+            self.watermarks.update_many(marks)
+
+        return {
+            "channels": len(playlists),
+            "new_videos": new_count,
+            "errors": errors,
+        }
+
+    def run_pass(
+        self,
+        youtube,
+        channel_ids: List[str],
+        handler: Callable[[str, List[Dict]], None],
+        on_request: Optional[Callable[[], None]] = None,
+    ) -> Dict:
+        """Exécute une passe complète (bloquant) dans le thread appelant."""
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        async def main():
+            with self._state_lock:
+                self._loop = asyncio.get_running_loop()
+                self._task = asyncio.current_task()
+            return await self._run(youtube, channel_ids, handler)
+
+        try:
+            with quota_caller("monitoring"):
+                report = asyncio.run(main())
+            report["cancelled"] = False
+        except asyncio.CancelledError:
+            logger.info("Passe de surveillance asyncio annulée")
+            report = {"channels": 0, "new_videos": 0, "errors": {}, "cancelled": True}
+        finally:
+            with self._state_lock:
+                self._loop = None
+                self._task = None
+
+        report["duration"] = round(time.perf_counter() - wall_start, 3)
+        report["cpu_time"] = round(time.process_time() - cpu_start, 3)
+        logger.info(
+            f"Passe de surveillance asyncio: {report['channels']} chaînes, "
+            f"{report['new_videos']} nouvelles vidéos, {len(report['errors'])} erreurs "
+            f"en {report['duration']:.2f}s (CPU {report['cpu_time']:.2f}s)"
+        )
+        return report
+
+    def cancel(self):
+        """Annule la passe en cours (appelable depuis n'importe quel thread)."""
+        with self._state_lock:
+            if self._loop and self._task:
+                self._loop.call_soon_threadsafe(self._task.cancel)
@@ -0,0 +1,100 @@
+"""Benchmark de la pagination des listes : liste complète vs page de 50.
+
+Vérifie aussi que le parcours page par page, pour chaque tri et chaque
+ordre, renvoie toutes les vidéos une seule fois et dans l'ordre :
+
+    python benchmarks/bench_list_pages.py --sizes 8000 100000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_tracked_videos import build_table  # noqa: E402
+from list_query import (  # noqa: E402
+    SORT_FIELDS,
+    ListIndexCache,
+    parse_list_query,
+    sort_value,
+)
+
+
+def timed(func, repeat: int = 20) -> float:
+    """Durée médiane d'un appel, en millisecondes."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return round(sorted(durations)[len(durations) // 2] * 1000, 3)
+
+
+def walk(cache: ListIndexCache, videos, query_args: dict) -> list:
+    """Toutes les pages d'un tri ; retourne les identifiants dans l'ordre reçu."""
+    ids, cursor = [], None
+    while True:
+        args = dict(query_args, **({"cursor": cursor} if cursor else {}))
+        page = cache.page("tracked", 1, lambda: videos, parse_list_query(args))
+        ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la pagination")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8000, 100_000])
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    failures = []
+    for size in args.sizes:
+        videos = build_table(size).to_dict()
+        cache = ListIndexCache()
+        page_args = {"limit": str(args.limit), "fields": "title,seconds"}
+        first = parse_list_query(page_args)
+
+        full_ms = timed(lambda: json.dumps({"videos": videos}), repeat=5)
+        build_ms = timed(lambda: ListIndexCache().page("t", 1, lambda: videos, first))
+        cache.page("tracked", 1, lambda: videos, first)
+        page_ms = timed(
+            lambda: json.dumps(cache.page("tracked", 1, lambda: videos, first))
+        )
+        full_bytes = len(json.dumps({"videos": videos}))
+        page_bytes = len(json.dumps(cache.page("tracked", 1, lambda: videos, first)))
+        print(
+            f"{size:>7} vidéos: liste complète {full_ms} ms ({full_bytes} o), "
+            f"index {build_ms} ms (une fois par version), "
+            f"page de {args.limit} {page_ms} ms ({page_bytes} o)"
+        )
+
+        for sort in SORT_FIELDS:
+            for order in ("asc", "desc"):
+                ids = walk(
+                    cache,
+                    videos,
+                    {"limit": "997", "sort": sort, "order": order, "fields": "id"},
+                )
+                expected = sorted(
+                    videos,
+                    key=lambda video_id: (sort_value(sort, videos[video_id]), video_id),
+                    reverse=order == "desc",
+                )
+                if ids != expected:
+                    failures.append(
+                        f"{size} vidéos, tri {sort} {order}: ordre incorrect"
+                    )
+
+    for message in failures:
+        print(f"ÉCHEC {message}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Migration d'un fichier de statistiques volumineux, sans numéro de version.
+
+Affiche le bilan de chaque exécution (étapes, durée, octets lus et écrits)
+et la durée d'une exécution sans étape en attente :
+
+    python benchmarks/bench_migrations.py --tracked-videos 50000 --runs 5
+
+L'exactitude (écriture unique, sauvegarde, rétention) est vérifiée par
+tests/test_migrations.py.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from migrations import Migration  # noqa: E402
+
+
+def generate_legacy_stats(path: str, tracked_videos: int, seed: int = 42) -> int:
+    """Écrit des statistiques à l'ancien format (durées en minutes, sans version)."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    data = {
+        "total_videos": tracked_videos,
+        "total_watch_time": 0,
+        "videos_by_month": {},
+        "daily_stats": {
+            (now - timedelta(days=i)).strftime("%Y-%m-%d"): {
+                "videos_added": rng.randint(0, 50),
+                "watch_time": round(rng.uniform(0, 600), 2),
+            }
+            for i in range(365)
+        },
+        "selected_channels": 10,
+        "last_check": now.isoformat(),
+        "tracked_videos": {
+            f"vid{i:08d}": {
+                "duration": round(rng.uniform(1, 120), 2),
+                "added_at": (now - timedelta(minutes=i)).isoformat(),
+                "title": f"Vidéo de test numéro {i} avec un titre réaliste",
+                "channel_id": f"UC{rng.randrange(500):022d}",
+            }
+            for i in range(tracked_videos)
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des migrations")
+    parser.add_argument("--tracked-videos", type=int, default=50_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--retention", type=int, default=3)
+    args = parser.parse_args()
+
+    statistics_file = os.path.join(tempfile.mkdtemp(), "statistics.json")
+    for run in range(args.runs):
+        size = generate_legacy_stats(statistics_file, args.tracked_videos)
+        migration = Migration(statistics_file, backup_retention=args.retention)
+        migration.run()
+        report = migration.last_report
+        print(
+            f"exécution {run + 1}: {size / 1024 / 1024:.1f} Mo, "
+            f"v{report['from_version']} -> v{report['to_version']} "
+            f"(étapes {report['steps']}) en {report['duration']}s, "
+            f"{report['bytes_read']} octets lus, {report['bytes_written']} écrits"
+        )
+
+        # Aucune étape en attente : lecture seule
+        again = Migration(statistics_file, backup_retention=args.retention)
+        again.run()
+        print(f"  sans étape en attente: {again.last_report['duration']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Benchmark de la chaîne de réponse : sérialisation JSON et compression.
+
+Compare, sur /get_subscriptions et /get_tracked_videos avec des volumes de
+production, la taille transférée et le temps CPU par requête :
+
+- json standard de Flask (comportement précédent) ;
+- encodeur rapide (orjson si installé) sans compression ;
+- encodeur rapide + gzip (et brotli si installé) à chaque requête ;
+- réponse du cache des routes, compressée une seule fois.
+
+    python benchmarks/bench_response_pipeline.py --subscriptions 2000 --tracked-videos 8000 50000
+
+Les résultats sont écrits dans benchmarks/results/ (ignoré par git), sauf
+si --output est fourni.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+from flask import Flask, jsonify  # noqa: E402
+from bench_tracked_videos import build_table  # noqa: E402
+from config import Config  # noqa: E402
+from response_pipeline import brotli, install_response_pipeline, orjson  # noqa: E402
+from route_cache import RouteCache  # noqa: E402
+
+WORDS = (
+    "vidéos chaîne nouvelles abonnez-vous tutoriel semaine direct podcast "
+    "musique jeux technologie cuisine voyage science histoire actualité"
+).split()
+
+
+def generate_subscriptions(count: int, seed: int = 42):
+    """Abonnements au format de /get_subscriptions, descriptions longues comprises."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"UC{i:022d}",
+            "title": f"Chaîne {i} {rng.choice(WORDS)}",
+            "thumbnail": f"https://yt3.ggpht.com/ytc/channel{i}=s88-c-k-c0x00ffffff-no-rj",
+            "description": " ".join(rng.choices(WORDS, k=rng.randint(50, 300))),
+            "subscriberCount": rng.randint(100, 5_000_000),
+            "videoCount": rng.randint(10, 5000),
+            "selected": rng.random() < 0.3,
+            "channelTitle": f"Chaîne {i}",
+        }
+        for i in range(count)
+    ]
+
+
+def build_app(payloads: dict, pipeline: bool, cached: bool) -> Flask:
+    app = Flask(__name__)
+    if pipeline:
+        install_response_pipeline(app)
+    route_cache = RouteCache()
+
+    def route(name):
+        def view():
+            return jsonify(payloads[name])
+
+        view.__name__ = name
+        if cached:
+            view = route_cache.cached(ttl=3600)(view)
+        app.add_url_rule(f"/{name}", name, view)
+
+    for name in payloads:
+        route(name)
+    return app
+
+
+def measure(app: Flask, path: str, encoding: str, iterations: int) -> dict:
+    """Octets transférés et temps CPU médian par requête (ms)."""
+    client = app.test_client()
+    headers = {"Accept-Encoding": encoding} if encoding else {}
+    client.get(path, headers=headers)  # Préchauffage (et remplissage du cache)
+    durations = []
+    for _ in range(iterations):
+        start = time.process_time()
+        response = client.get(path, headers=headers)
+        size = len(response.get_data())
+        durations.append(time.process_time() - start)
+    durations.sort()
+    return {
+        "bytes": size,
+        "encoding": response.headers.get("Content-Encoding", "identity"),
+        "cpu_ms": round(durations[len(durations) // 2] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON et compression")
+    parser.add_argument("--subscriptions", type=int, default=2000)
+    parser.add_argument("--tracked-videos", type=int, nargs="+", default=[8000, 50_000])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "bench_response_pipeline.json")
+    )
+    args = parser.parse_args()
+
+    subscriptions = generate_subscriptions(args.subscriptions)
+    payloads = {
+        "get_subscriptions": {
+            "success": True,
+            "subscriptions": subscriptions,
+            "is_monitoring": False,
+            "total_count": len(subscriptions),
+        }
+    }
+    for size in args.tracked_videos:
+        payloads[f"get_tracked_videos_{size}"] = {
+            "success": True,
+            "videos": build_table(size).to_dict(),
+        }
+
+    modes = [
+        ("json standard", False, False, True, None),
+        ("rapide", True, False, False, None),
+        ("rapide + gzip", True, False, True, "gzip"),
+    ]
+    if brotli is not None:
+        modes.append(("rapide + br", True, False, True, "br"))
+    modes.append(("cache + gzip", True, True, True, "gzip"))
+    if brotli is not None:
+        modes.append(("cache + br", True, True, True, "br"))
+
+    print(
+        f"Encodeur rapide: {'orjson' if orjson else 'absent (json standard)'}, "
+        f"brotli: {'oui' if brotli else 'absent'}"
+    )
+    results = []
+    for name, pipeline, cached, compression, encoding in modes:
+        Config.COMPRESSION_ENABLED = compression
+        app = build_app(payloads, pipeline, cached)
+        for path in payloads:
+            result = {
+                "route": path,
+                "mode": name,
+                **measure(app, f"/{path}", encoding, args.iterations),
+            }
+            results.append(result)
+            print(
+                f"{path:28} {name:14} {result['bytes']:>10} o "
+                f"({result['encoding']:8}) {result['cpu_ms']:>8} ms CPU"
+            )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Benchmark des routes Flask sur des jeux de données synthétiques de grande taille.
+
+L'application est pilotée via le client de test Flask, le client YouTube pointant
+vers l'API simulée (youtube_standin.py). Les résultats (p50/p99, pic mémoire,
+nombre d'appels API) sont écrits en JSON, par défaut dans benchmarks/results/
+(ignoré par git), pour comparer les commits entre eux :
+
+    python benchmarks/bench_routes.py --iterations 20 --output bench_routes.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+STANDIN_PORT = 8095
+
+
+def generate_fixtures(
+    data_dir: str,
+    tracked_videos: int = 20000,
+    selected_channels: int = 500,
+    channel_ids=None,
+    seed: int = 42,
+):
+    """Génère les fichiers de données (statistiques, vidéos suivies, chaînes)."""
+    rng = random.Random(seed)
+    os.makedirs(data_dir, exist_ok=True)
+    now = datetime.now()
+
+    tracked = {}
+    history = []
+    for i in range(tracked_videos):
+        video_id = f"vid{i:08d}"
+        added_at = (now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))).isoformat()
+        tracked[video_id] = {
+            "duration": round(rng.uniform(2, 120), 2),
+            "added_at": added_at,
+            "title": f"Vidéo de test numéro {i} avec un titre réaliste",
+        }
+        if i < 100:
+            history.append(
+                {
+                    "id": video_id,
+                    "title": tracked[video_id]["title"],
+                    "duration": "PT10M",
+                    "watch_time": tracked[video_id]["duration"],
+                    "added_at": added_at,
+                }
+            )
+
+    daily_stats = {
+        (now - timedelta(days=d)).strftime("%Y-%m-%d"): {
+            "videos_added": rng.randint(0, 50),
+            "watch_time": rng.uniform(0, 600),
+        }
+        for d in range(365)
+    }
+    videos_by_month = {
+        (now - timedelta(days=30 * m)).strftime("%Y-%m"): {
+            "count": rng.randint(0, 500),
+            "watch_time": rng.uniform(0, 6000),
+        }
+        for m in range(24)
+    }
+
+    stats = {
+        "total_videos": tracked_videos,
+        "total_watch_time": round(sum(v["duration"] for v in tracked.values()), 2),
+        "videos_by_month": videos_by_month,
+        "daily_stats": daily_stats,
+        "selected_channels": selected_channels,
+        "quota_usage": {"used": 0, "limit": 10000, "reset_date": now.isoformat()},
+        "last_check": now.isoformat(),
+        "video_history": history,
+        "tracked_videos": tracked,
+    }
+    # Schéma courant : aucune migration pendant les mesures. La configuration
+    # est lue à l'import, DATA_DIR doit donc être défini avant cet appel.
+    from migrations import Migration, migrate_durations_to_seconds
+
+    statistics_file = os.path.join(data_dir, "statistics.json")
+    migrate_durations_to_seconds(stats)
+    stats["version"] = Migration(statistics_file).migrations[-1]["version"]
+    with open(statistics_file, "w", encoding="utf-8") as f:
+        json.dump(stats, f, indent=2)
+    with open(
+        os.path.join(data_dir, "tracked_videos.json"), "w", encoding="utf-8"
+    ) as f:
+        json.dump(tracked, f, indent=2)
+
+    channel_ids = channel_ids or [f"UC{c:022d}" for c in range(selected_channels)]
+    with open(
+        os.path.join(data_dir, "selected_channels.txt"), "w", encoding="utf-8"
+    ) as f:
+        f.write("\n".join(channel_ids[:selected_channels]))
+
+    return {
+        "tracked_videos": tracked_videos,
+        "selected_channels": selected_channels,
+        "statistics_bytes": os.path.getsize(os.path.join(data_dir, "statistics.json")),
+    }
+
+
+def start_standin(subscriptions: int, latency: float):
+    """Démarre l'API simulée dans un thread et retourne son jeu de données."""
+    from werkzeug.serving import make_server
+    from youtube_standin import StandinDataset, StandinSettings, create_standin_app
+
+    dataset = StandinDataset(channels=subscriptions, videos_per_channel=5)
+    settings = StandinSettings(latency=latency, quota_limit=10**9)
+    server = make_server(
+        "127.0.0.1", STANDIN_PORT, create_standin_app(dataset, settings), threaded=True
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return dataset, server
+
+
+def standin_requests(client) -> int:
+    return client.get("/standin/stats").get_json()["requests"]
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def bench_route(client, standin_client, method: str, path: str, iterations: int, **kw):
+    """Exécute une route `iterations` fois et mesure latence, mémoire et appels API."""
+    latencies = []
+    api_before = standin_requests(standin_client)
+    tracemalloc.start()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = client.open(path, method=method, **kw)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.close()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    api_calls = standin_requests(standin_client) - api_before
+
+    return {
+        "method": method,
+        "path": path,
+        "status": response.status_code,
+        "iterations": iterations,
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "api_calls": api_calls,
+        "api_calls_per_request": round(api_calls / iterations, 2),
+        "response_bytes": len(response.get_data()),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR
+            )
+            .decode()
+            .strip()
+        )
+    except Exception:
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark des routes de l'application"
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--tracked-videos", type=int, default=20000)
+    parser.add_argument("--subscriptions", type=int, default=5000)
+    parser.add_argument("--selected-channels", type=int, default=500)
+    parser.add_argument("--api-latency", type=float, default=0.0)
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "bench_routes.json")
+    )
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="ywl_bench_")
+
+    # La configuration lit ces variables à l'import : les définir avant
+    os.environ["DATA_DIR"] = data_dir
+    os.environ["YOUTUBE_API_ENDPOINT"] = f"http://127.0.0.1:{STANDIN_PORT}"
+    os.environ["FLASK_DEBUG"] = "0"
+    fixtures = generate_fixtures(data_dir, args.tracked_videos, args.selected_channels)
+
+    dataset, server = start_standin(args.subscriptions, args.api_latency)
+
+    import logging
+
+    logging.disable(logging.INFO)
+    from werkzeug.test import Client
+    from app import app
+
+    client = app.test_client()
+    standin_client = Client(server.app)
+    selected = [f"UC{c:022d}" for c in range(args.selected_channels)]
+
+    routes = [
+        ("GET", "/get_statistics", {}),
+        ("GET", "/get_tracked_videos", {}),
+        ("GET", "/get_subscriptions", {}),
+        ("GET", "/get_monitoring_status", {}),
+        ("GET", "/check_watched_videos", {}),
+        ("POST", "/save_channels", {"json": {"channel_ids": selected}}),
+    ]
+
+    results = []
+    for method, path, kw in routes:
+        result = bench_route(
+            client, standin_client, method, path, args.iterations, **kw
+        )
+        results.append(result)
+        print(
+            f"{method:4} {path:28} p50={result['p50_ms']:9.2f}ms "
+            f"p99={result['p99_ms']:9.2f}ms mem={result['peak_memory_kb']:10.1f}KB "
+            f"api={result['api_calls_per_request']}"
+        )
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(),
+        "fixtures": {**fixtures, "subscriptions": args.subscriptions},
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
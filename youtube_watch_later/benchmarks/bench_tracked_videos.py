@@ -0,0 +1,120 @@
+"""Benchmark mémoire et itération : dictionnaire de dictionnaires vs TrackedVideoTable.
+
+python benchmarks/bench_tracked_videos.py --sizes 10000 100000 1000000
+
+Résultats écrits par défaut dans benchmarks/results/ (ignoré par git).
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+from video_table import TrackedVideoTable  # noqa: E402
+
+
+def generate_entries(size: int, channels: int = 500, seed: int = 42):
+    """Entrées au format de stats["tracked_videos"]."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    for i in range(size):
+        yield f"vid{i:08d}", {
+            "seconds": rng.randint(120, 7200),
+            "added_at": (
+                now - timedelta(seconds=rng.randint(0, 86400 * 365))
+            ).isoformat(),
+            "title": f"Vidéo de test numéro {i} avec un titre réaliste",
+            "channel_id": f"UC{rng.randrange(channels):022d}",
+        }
+
+
+def build_dict(size: int):
+    return dict(generate_entries(size))
+
+
+def build_table(size: int):
+    table = TrackedVideoTable()
+    for video_id, entry in generate_entries(size):
+        table[video_id] = entry
+    return table
+
+
+def measure(builder, size: int):
+    """Mémoire retenue par la structure, temps de construction et d'itération."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    videos = builder(size)
+    build_time = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    total = sum(entry["seconds"] for entry in videos.values())
+    iterate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if isinstance(videos, TrackedVideoTable):
+        rows_total = sum(row[1] for row in videos.rows())
+    else:
+        rows_total = sum(entry["seconds"] for entry in videos.values())
+    rows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if isinstance(videos, TrackedVideoTable):
+        column_total = videos.total_seconds()
+    else:
+        column_total = sum(entry["seconds"] for entry in videos.values())
+    sum_time = time.perf_counter() - start
+
+    assert total == column_total == rows_total
+    return {
+        "memory_mb": round(retained / 1024 / 1024, 2),
+        "bytes_per_video": round(retained / size, 1),
+        "build_s": round(build_time, 3),
+        "iterate_values_s": round(iterate_time, 3),
+        "iterate_rows_s": round(rows_time, 3),
+        "sum_durations_s": round(sum_time, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du stockage des vidéos")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--output", default=os.path.join(RESULTS_DIR, "bench_tracked_videos.json")
+    )
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        for name, builder in (("dict", build_dict), ("table", build_table)):
+            result = {"size": size, "structure": name, **measure(builder, size)}
+            results.append(result)
+            print(
+                f"{size:>9} {name:6} mem={result['memory_mb']:9.2f}MB "
+                f"({result['bytes_per_video']:7.1f} o/vidéo) "
+                f"values={result['iterate_values_s']:7.3f}s "
+                f"lignes={result['iterate_rows_s']:7.3f}s "
+                f"somme={result['sum_durations_s']:7.4f}s"
+            )
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark de charge concurrent du StatisticsManager.
+
+Plusieurs threads écrivains ajoutent et retirent des vidéos, mettent à jour le
+quota et forcent des écritures sur disque pendant que des threads lecteurs
+interrogent les statistiques. Le script mesure le débit des écritures et des
+lectures et la latence des lectures :
+
+    python benchmarks/stress_statistics.py --writers 8 --readers 16 --seconds 10
+
+La cohérence sous concurrence est vérifiée par
+tests/test_statistics_concurrency.py.
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+sys.path.insert(0, BASE_DIR)
+
+
+def writer(manager, index: int, stop: threading.Event, counts: list):
+    rng = random.Random(index)
+    ops = 0
+    while not stop.is_set():
+        video_id = f"stress{index}-{rng.randrange(500)}"
+        action = rng.random()
+        if action < 0.6:
+            manager.add_video_to_stats(
+                {
+                    "id": video_id,
+                    "duration_seconds": rng.randint(60, 7200),
+                    "title": "Vidéo de charge",
+                    "channel_id": f"UCstress{rng.randrange(20)}",
+                }
+            )
+        elif action < 0.9:
+            manager.remove_video_from_stats(video_id)
+        elif action < 0.97:
+            manager.update_quota(rng.randrange(10000), 10000, "2024-01-01T00:00:00")
+        else:
+            manager.flush()
+        ops += 1
+    counts[index] = ops
+
+
+def reader(manager, index: int, stop: threading.Event, counts: list, latencies: list):
+    ops = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        manager.get_snapshot()
+        manager.get_current_stats()
+        manager.get_tracked_videos()
+        manager.get_daily_stats(30)
+        manager.get_video_history(20)
+        latencies.append(time.perf_counter() - start)
+        ops += 1
+    counts[index] = ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de charge des statistiques")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--tracked-videos", type=int, default=5000)
+    parser.add_argument(
+        "--backend", default="json", choices=("json", "sqlite", "eventlog")
+    )
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="stress_stats_")
+    os.environ["DATA_DIR"] = data_dir
+    os.environ["STATS_BACKEND"] = args.backend
+    from bench_routes import generate_fixtures
+
+    generate_fixtures(data_dir, args.tracked_videos, 10)
+
+    from config import Config
+    from statistics_manager import StatisticsManager
+
+    logging.disable(logging.WARNING)
+    manager = StatisticsManager(Config.STATISTICS_FILE)
+    stop = threading.Event()
+    writer_counts = [0] * args.writers
+    reader_counts = [0] * args.readers
+    latencies = []
+    threads = [
+        threading.Thread(target=writer, args=(manager, i, stop, writer_counts))
+        for i in range(args.writers)
+    ] + [
+        threading.Thread(
+            target=reader, args=(manager, i, stop, reader_counts, latencies)
+        )
+        for i in range(args.readers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    manager.flush()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0
+    print(
+        f"{args.backend}: {sum(writer_counts) / args.seconds:.0f} écritures/s, "
+        f"{sum(reader_counts) / args.seconds:.0f} lectures/s "
+        f"(p50 {p50:.2f} ms, p99 {p99:.2f} ms) ; "
+        f"{len(manager.stats['tracked_videos'])} vidéos suivies"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+import contextvars
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Callable, Dict, List
+from config import Config
+from http_cache import TransportWrapper
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class TokenBucket:
+    """Limiteur de débit partagé entre threads (algorithme du seau à jetons)."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1))
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def acquire(self, tokens: float = 1):
+        """Bloque jusqu'à ce que `tokens` jetons soient disponibles."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def thread_local_http(youtube):
+    """Retourne un transport HTTP propre au thread courant (httplib2 n'est pas thread-safe)."""
+    shared = getattr(youtube, "_http", None)
+    if shared is None:
+        return None
+    if getattr(_local, "owner", None) is shared:
+        return _local.http
+
+    import httplib2
+
+    credentials = getattr(shared, "credentials", None)
+    if credentials is not None:
+        from google_auth_httplib2 import AuthorizedHttp
+
+        _local.http = AuthorizedHttp(credentials, http=httplib2.Http())
+    else:
+        # Client sans OAuth (clé d'API ou API simulée)
+        _local.http = httplib2.Http()
+    _local.owner = shared
+
+    if isinstance(shared, TransportWrapper):
+        # Reproduire les couches (cache ETag, comptage du quota) du client
+        _local.http = youtube._http.with_transport(_local.http)
+    return _local.http
+
+
+class ChannelFetchEngine:
+    """Récupère les vidéos de plusieurs chaînes en parallèle avec un pool borné."""
+
+    def __init__(
+        self,
+        fetch_channel: Callable[[str], List[Dict]],
+        max_workers: int = None,
+    ):
+        self.fetch_channel = fetch_channel
+        self.max_workers = max_workers or Config.FETCH_MAX_WORKERS
+
+    def _fetch_one(self, channel_id: str):
+        start = time.perf_counter()
+        try:
+            videos = self.fetch_channel(channel_id)
+            error = None
+        except Exception as e:
+            logger.error(f"Erreur pour la chaîne {channel_id}: {str(e)}")
+            videos = []
+            error = str(e)
+        return channel_id, videos, error, time.perf_counter() - start
+
+    def fetch(self, channel_ids: List[str], limit: int) -> Dict:
+        """Récupère et fusionne les vidéos des chaînes, triées par date de publication."""
+        start = time.perf_counter()
+        per_channel: List[List[Dict]] = []
+        report: Dict[str, Dict] = {}
+
+        workers = max(1, min(self.max_workers, len(channel_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Propager le contexte (attribution du quota) aux threads du pool
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._fetch_one, cid)
+                for cid in channel_ids
+            ]
+            for future in as_completed(futures):
+                channel_id, videos, error, duration = future.result()
+                report[channel_id] = {
+                    "duration": round(duration, 3),
+                    "video_count": len(videos),
+                    "error": error,
+                }
+                if videos:
+                    per_channel.append(
+                        sorted(videos, key=lambda v: v["publishedAt"], reverse=True)
+                    )
+
+        # Fusion k-way des listes déjà triées, arrêtée dès que la limite est atteinte
+        merged = list(
+            islice(
+                heapq.merge(*per_channel, key=lambda v: v["publishedAt"], reverse=True),
+                limit,
+            )
+        )
+
+        return {
+            "videos": merged,
+            "report": {
+                "duration": round(time.perf_counter() - start, 3),
+                "channels": report,
+                "failed": [cid for cid, r in report.items() if r["error"]],
+            },
+        }
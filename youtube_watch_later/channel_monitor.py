@@ -0,0 +1,118 @@
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from config import Config
+from quota_ledger import quota_caller
+from uploads_resolver import UploadsPlaylistResolver
+from video_fetcher import VideoBatchFetcher
+from watermark_store import ChannelWatermarkStore
+
+logger = logging.getLogger(__name__)
+
+
+class IncrementalChannelMonitor:
+    """Passe de surveillance incrémentale basée sur un marqueur par chaîne.
+
+    Seuls les éléments publiés après le marqueur sont lus et classés : une
+    chaîne sans nouveauté ne coûte qu'un appel playlistItems.
+    """
+
+    def __init__(
+        self,
+        resolver: UploadsPlaylistResolver,
+        watermarks: ChannelWatermarkStore,
+        rate_limiter=None,
+        max_items: int = None,
+        store=None,
+    ):
+        self.resolver = resolver
+        self.watermarks = watermarks
+        self.rate_limiter = rate_limiter
+        self.store = store
+        self.max_items = max_items or Config.MAX_VIDEOS_PER_CHANNEL
+
+    def check_channel(
+        self,
+        fetcher: VideoBatchFetcher,
+        channel_id: str,
+        playlist_id: str,
+    ) -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
+        """Retourne les nouvelles vidéos (hors Shorts) et le nouveau marqueur."""
+        items = fetcher.list_playlist_items_since(
+            playlist_id, self.watermarks.get(channel_id), self.max_items
+        )
+        if not items:
+            return [], None
+
+        newest = max(items, key=lambda item: item["snippet"]["publishedAt"])
+        mark = (
+            newest["snippet"]["resourceId"]["videoId"],
+            newest["snippet"]["publishedAt"],
+        )
+        return fetcher.build_videos(items), mark
+
+    def run_pass(
+        self,
+        youtube,
+        channel_ids: List[str],
+        handler: Callable[[str, List[Dict]], None],
+        on_request: Optional[Callable[[], None]] = None,
+    ) -> Dict:
+        """Vérifie toutes les chaînes ; `handler` reçoit les nouvelles vidéos.
+
+        Le marqueur d'une chaîne n'avance que si `handler` a réussi, afin de
+        ne jamais perdre une vidéo en cas d'erreur.
+        """
+        with quota_caller("monitoring"):
+            return self._run_pass(youtube, channel_ids, handler, on_request)
+
+    def _run_pass(self, youtube, channel_ids, handler, on_request):
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        playlists = self.resolver.resolve_many(youtube, channel_ids, on_request)
+        fetcher = VideoBatchFetcher(
+            youtube,
+            on_request=on_request,
+            rate_limiter=self.rate_limiter,
+            store=self.store,
+        )
+
+        marks = {}
+        errors = {}
+        new_count = 0
+        for channel_id, playlist_id in playlists.items():
+            try:
+                videos, mark = self.check_channel(fetcher, channel_id, playlist_id)
+            except Exception as e:
+                logger.error(
+                    f"Erreur lors de la vérification de {channel_id}: {str(e)}"
+                )
+                errors[channel_id] = str(e)
+                self.resolver.invalidate(channel_id)
+                continue
+
+            try:
+                if videos:
+                    handler(channel_id, videos)
+                    new_count += len(videos)
+                if mark:
+                    marks[channel_id] = mark
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement de {channel_id}: {str(e)}")
+                errors[channel_id] = str(e)
+
+        self.watermarks.update_many(marks)
+
+        duration = time.perf_counter() - start
+        cpu_time = time.process_time() - cpu_start
+        logger.info(
+            f"Passe de surveillance: {len(playlists)} chaînes, {new_count} nouvelles "
+            f"vidéos, {len(errors)} erreurs en {duration:.2f}s (CPU {cpu_time:.2f}s)"
+        )
+        return {
+            "channels": len(playlists),
+            "new_videos": new_count,
+            "errors": errors,
+            "duration": round(duration, 3),
+            "cpu_time": round(cpu_time, 3),
+        }
@@ -70,10 +70,11 @@ class Config:
 
     # Chemins des fichiers
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-    DATA_DIR = os.path.join(BASE_DIR, "data")
+    DATA_DIR = os.getenv("DATA_DIR", os.path.join(BASE_DIR, "data"))
     LOGS_DIR = os.path.join(BASE_DIR, "logs")
 
     SELECTED_CHANNELS_FILE = os.path.join(DATA_DIR, "selected_channels.txt")
+    CHANNEL_WATERMARKS_FILE = os.path.join(DATA_DIR, "channel_watermarks.json")
     STATISTICS_FILE = os.path.join(DATA_DIR, "statistics.json")
     CLIENT_SECRETS_FILE = os.path.join(BASE_DIR, "client_secrets.json")
     TOKEN_PICKLE_FILE = os.path.join(DATA_DIR, "token.pickle")
@@ -81,11 +82,22 @@ class Config:
     CHECK_HOURS_FILE = os.path.join(DATA_DIR, "check_hours.json")
     THEME_FILE = os.path.join(DATA_DIR, "theme.json")
     VIDEOS_TRACKING_FILE = os.path.join(DATA_DIR, "tracked_videos.json")
+    STATS_DB_FILE = os.path.join(DATA_DIR, "statistics.db")
+    STATS_EVENT_LOG = os.path.join(DATA_DIR, "statistics.log")
+    STATS_SNAPSHOT_FILE = os.path.join(DATA_DIR, "statistics.snapshot.json")
+    VIDEO_HISTORY_FILE = os.path.join(DATA_DIR, "video_history.jsonl")
+    UPLOADS_PLAYLISTS_FILE = os.path.join(DATA_DIR, "uploads_playlists.json")
+    HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+    VIDEO_METADATA_DB = os.path.join(DATA_DIR, "video_metadata.db")
+    QUOTA_LEDGER_FILE = os.path.join(DATA_DIR, "quota_ledger.json")
 
     # YouTube API
     YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
     YOUTUBE_QUOTA_LIMIT = int(os.getenv("YOUTUBE_QUOTA_LIMIT", "10000"))
     YOUTUBE_QUOTA_RESERVE = int(os.getenv("YOUTUBE_QUOTA_RESERVE", "1000"))
+    # Serveur local simulant l'API (youtube_standin.py), pour les tests de charge
+    YOUTUBE_API_ENDPOINT = os.getenv("YOUTUBE_API_ENDPOINT")
+    QUOTA_LEDGER_SAVE_INTERVAL = 5  # Secondes entre deux écritures du registre
     WATCH_LATER_PLAYLIST_NAME = "Watch Later Pro"
 
     # Configuration Flask
@@ -100,6 +112,7 @@ class Config:
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     MAX_VIDEOS_PER_CHANNEL = int(os.getenv("MAX_VIDEOS_PER_CHANNEL", 10))
     MAX_RECENT_VIDEOS = int(os.getenv("MAX_RECENT_VIDEOS", 50))
+    VIDEOS_BATCH_SIZE = int(os.getenv("VIDEOS_BATCH_SIZE", 50))  # Max 50 par l'API
     CHECK_INTERVAL = 60  # Vérification chaque minute
 
     # Cache et Performance
@@ -108,6 +121,15 @@ class Config:
     CACHE_DEFAULT_TIMEOUT = 300
     CACHE_THRESHOLD = 1000
     API_QUOTA_DELAY = float(os.getenv("API_QUOTA_DELAY", 0.1))
+    HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+    HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+    VIDEO_CACHE_SIZE = int(os.getenv("VIDEO_CACHE_SIZE", 5000))
+    VIDEO_STATIC_TTL = int(os.getenv("VIDEO_STATIC_TTL", 30 * 86400))  # Durée, titre
+    VIDEO_STATS_TTL = int(os.getenv("VIDEO_STATS_TTL", 86400))  # Vues, likes
+    API_RATE_LIMIT = float(os.getenv("API_RATE_LIMIT", 10))  # Requêtes par seconde
+    FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", 8))
+    MONITORING_ENGINE = os.getenv("MONITORING_ENGINE", "thread")  # thread | asyncio
+    ASYNC_MAX_CONCURRENCY = int(os.getenv("ASYNC_MAX_CONCURRENCY", 50))
 
     # Thème
     DEFAULT_THEME = "light"
@@ -116,6 +138,45 @@ class Config:
     # Statistiques
     STATS_RETENTION_DAYS = int(os.getenv("STATS_RETENTION_DAYS", 30))
     HISTORY_MAX_ITEMS = int(os.getenv("HISTORY_MAX_ITEMS", 100))
+    # Cache des réponses des routes en lecture
+    ROUTE_CACHE_MAX_ENTRIES = int(os.getenv("ROUTE_CACHE_MAX_ENTRIES", 256))
+    ROUTE_CACHE_TTL = float(os.getenv("ROUTE_CACHE_TTL", 60))  # Secondes
+    # Pagination des routes de listes (tracked, watch later, abonnements)
+    LIST_PAGE_SIZE = int(os.getenv("LIST_PAGE_SIZE", 50))
+    LIST_MAX_PAGE_SIZE = int(os.getenv("LIST_MAX_PAGE_SIZE", 500))
+    # Réponses : encodeur JSON rapide (orjson si installé) et compression
+    JSON_FAST_ENCODER = os.getenv("JSON_FAST_ENCODER", "true").lower() == "true"
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))  # Octets
+    # Niveaux rapides à chaque requête, élevés pour le cache (compressé une fois)
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 4))
+    COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+    COMPRESSION_CACHED_GZIP_LEVEL = int(os.getenv("COMPRESSION_CACHED_GZIP_LEVEL", 9))
+    COMPRESSION_CACHED_BROTLI_QUALITY = int(
+        os.getenv("COMPRESSION_CACHED_BROTLI_QUALITY", 9)
+    )
+    # Évènements poussés aux navigateurs (Server-Sent Events)
+    SSE_MAX_CLIENTS = int(os.getenv("SSE_MAX_CLIENTS", 20))
+    SSE_QUEUE_SIZE = int(os.getenv("SSE_QUEUE_SIZE", 100))  # Évènements par client
+    SSE_HEARTBEAT_INTERVAL = float(os.getenv("SSE_HEARTBEAT_INTERVAL", 15))  # Secondes
+    SSE_SAMPLE_INTERVAL = float(os.getenv("SSE_SAMPLE_INTERVAL", 1))  # Secondes
+    SSE_RETRY_MS = int(os.getenv("SSE_RETRY_MS", 3000))  # Délai de reconnexion
+    # Sauvegardes conservées par fichier migré (0 = toutes)
+    MIGRATION_BACKUP_RETENTION = int(os.getenv("MIGRATION_BACKUP_RETENTION", 3))
+    # Conservation des agrégats par granularité (les mois sont conservés)
+    ROLLUP_HOURLY_RETENTION_DAYS = int(os.getenv("ROLLUP_HOURLY_RETENTION_DAYS", 7))
+    ROLLUP_DAILY_RETENTION_DAYS = int(os.getenv("ROLLUP_DAILY_RETENTION_DAYS", 400))
+    ROLLUP_WEEKLY_RETENTION_DAYS = int(
+        os.getenv("ROLLUP_WEEKLY_RETENTION_DAYS", 5 * 365)
+    )
+    STATS_FLUSH_DELAY = float(os.getenv("STATS_FLUSH_DELAY", 2.0))  # Secondes
+    STATS_FLUSH_THRESHOLD = int(os.getenv("STATS_FLUSH_THRESHOLD", 100))
+    STATS_BACKEND = os.getenv("STATS_BACKEND", "json")  # json | sqlite | eventlog
+    STATS_SNAPSHOT_INTERVAL = int(os.getenv("STATS_SNAPSHOT_INTERVAL", 1000))
+    # Compare les agrégats à un recalcul complet après chaque mutation (débogage)
+    STATS_VERIFY_AGGREGATES = (
+        os.getenv("STATS_VERIFY_AGGREGATES", "false").lower() == "true"
+    )
 
     # Sécurité
     SESSION_COOKIE_SECURE = FLASK_ENV == "production"
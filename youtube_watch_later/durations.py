@@ -0,0 +1,31 @@
+import re
+from functools import lru_cache
+import isodate
+
+# Forme usuelle renvoyée par l'API YouTube : P[n]W[n]DT[n]H[n]M[n]S
+ISO_DURATION = re.compile(
+    r"^P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_duration(value: str) -> int:
+    """Convertit une durée ISO 8601 (PT1H2M3S) en secondes entières.
+
+    Les résultats sont mémorisés : les mêmes durées reviennent souvent.
+    """
+    if not value:
+        return 0
+    match = ISO_DURATION.match(value)
+    if match and value not in ("P", "PT"):
+        weeks, days, hours, minutes, seconds = (
+            int(group) if group else 0 for group in match.groups()
+        )
+        return (((weeks * 7 + days) * 24 + hours) * 60 + minutes) * 60 + seconds
+    # Formes rares (fractions de seconde...) : analyse complète
+    return int(isodate.parse_duration(value).total_seconds())
+
+
+def seconds_to_minutes(seconds: int) -> float:
+    """Minutes arrondies, pour l'affichage et les réponses JSON."""
+    return round(seconds / 60, 2)
@@ -0,0 +1,218 @@
+import json
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """File d'évènements bornée d'un client SSE."""
+
+    def __init__(self, max_events: int):
+        self.max_events = max_events
+        self.events: deque = deque()
+        self.condition = threading.Condition()
+        self.lagging = False  # File saturée : le client sera déconnecté
+        self.closed = False
+
+    def push(self, frame: str) -> bool:
+        """Ajoute un évènement ; False si le client ne suit plus."""
+        with self.condition:
+            if len(self.events) >= self.max_events:
+                self.lagging = True
+            else:
+                self.events.append(frame)
+            self.condition.notify()
+            return not self.lagging
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+
+    def next_frames(self, timeout: float) -> Optional[List[str]]:
+        """Évènements en attente ; liste vide après `timeout`, None pour déconnecter."""
+        with self.condition:
+            if not self.events and not self.lagging and not self.closed:
+                self.condition.wait(timeout)
+            if self.lagging or self.closed:
+                return None
+            frames = list(self.events)
+            self.events.clear()
+            return frames
+
+
+class EventBroadcaster:
+    """Diffusion d'évènements Server-Sent Events vers plusieurs clients.
+
+    Chaque évènement est sérialisé une seule fois puis déposé dans la file
+    bornée de chaque client, sans jamais bloquer le producteur. Un client
+    dont la file est pleine est déconnecté : à la reconnexion, il reçoit
+    l'état complet. Un commentaire périodique maintient la connexion et
+    permet de détecter les clients partis.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = None,
+        queue_size: int = None,
+        heartbeat: float = None,
+    ):
+        self.max_clients = max_clients or Config.SSE_MAX_CLIENTS
+        self.queue_size = queue_size or Config.SSE_QUEUE_SIZE
+        self.heartbeat = heartbeat or Config.SSE_HEARTBEAT_INTERVAL
+        self._subscribers: set = set()
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self.published = 0
+        self.dropped_clients = 0
+
+    @staticmethod
+    def format_event(event: str, data, event_id: int = None) -> str:
+        payload = json.dumps(data, separators=(",", ":"), default=str)
+        frame = f"event: {event}\ndata: {payload}\n\n"
+        return f"id: {event_id}\n{frame}" if event_id else frame
+
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Optional[Subscriber]:
+        """Enregistre un client ; None si le nombre maximal est atteint."""
+        with self._lock:
+            if len(self._subscribers) >= self.max_clients:
+                return None
+            subscriber = Subscriber(self.queue_size)
+            self._subscribers.add(subscriber)
+        logger.debug(f"Client SSE connecté ({len(self._subscribers)} au total)")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event: str, data) -> int:
+        """Diffuse un évènement ; retourne le nombre de clients atteints."""
+        with self._lock:
+            if not self._subscribers:
+                return 0
+            self._last_id += 1
+            frame = self.format_event(event, data, self._last_id)
+            delivered = 0
+            # Sous verrou : tous les clients reçoivent les évènements dans le même ordre
+            for subscriber in list(self._subscribers):
+                if subscriber.push(frame):
+                    delivered += 1
+                else:
+                    self._subscribers.discard(subscriber)
+                    self.dropped_clients += 1
+                    logger.warning("Client SSE trop lent déconnecté")
+            self.published += 1
+        return delivered
+
+    def stream(
+        self, subscriber: Subscriber, initial: Iterable[str] = ()
+    ) -> Iterator[str]:
+        """Générateur de la réponse SSE d'un client ; le désinscrit à la fin."""
+        try:
+            yield f"retry: {Config.SSE_RETRY_MS}\n\n"
+            for frame in initial:
+                yield frame
+            while True:
+                frames = subscriber.next_frames(self.heartbeat)
+                if frames is None:
+                    break
+                yield "".join(frames) if frames else ": heartbeat\n\n"
+        finally:
+            self.unsubscribe(subscriber)
+
+    def close_all(self):
+        """Ferme les flux de tous les clients (arrêt de l'application)."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            self._subscribers.clear()
+        for subscriber in subscribers:
+            subscriber.close()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "clients": len(self._subscribers),
+                "max_clients": self.max_clients,
+                "queue_size": self.queue_size,
+                "published": self.published,
+                "dropped_clients": self.dropped_clients,
+                "queued": [len(s.events) for s in self._subscribers],
+            }
+
+
+class StatePublisher:
+    """Producteur unique de l'état poussé aux clients.
+
+    Un thread échantillonne les sources (fonctions retournant un
+    dictionnaire) et ne publie que les clés modifiées depuis le dernier
+    échantillon ; il ne fait rien tant qu'aucun client n'est connecté.
+    """
+
+    def __init__(
+        self,
+        broadcaster: EventBroadcaster,
+        sources: Dict[str, Callable[[], Dict]],
+        interval: float = None,
+    ):
+        self.broadcaster = broadcaster
+        self.sources = sources
+        self.interval = interval or Config.SSE_SAMPLE_INTERVAL
+        self.state: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> Dict[str, Dict]:
+        """Échantillonne les sources, publie les différences ; retourne l'état complet."""
+        with self._lock:
+            for name, source in self.sources.items():
+                try:
+                    current = dict(source())
+                except Exception as e:
+                    logger.error(
+                        f"Erreur lors de la lecture de l'état {name}: {str(e)}"
+                    )
+                    continue
+                previous = self.state.get(name)
+                if current == previous:
+                    continue
+                self.state[name] = current
+                if previous is not None:
+                    delta = {
+                        key: value
+                        for key, value in current.items()
+                        if previous.get(key) != value
+                    }
+                    delta.update({key: None for key in previous if key not in current})
+                    self.broadcaster.publish(name, delta)
+            return {name: dict(values) for name, values in self.state.items()}
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if self.broadcaster.client_count:
+                self.sample()
+
+    def start(self):
+        """Démarre le thread producteur (idempotent)."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="state-publisher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
@@ -0,0 +1,215 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Ressources de l'API Data dont les réponses portent un ETag exploitable
+CACHEABLE_RESOURCES = re.compile(
+    r"/youtube/v3/(playlistItems|videos|channels|subscriptions)\b"
+)
+
+
+class ETagCacheStore:
+    """Stockage disque des réponses (corps + ETag) avec budget de taille LRU."""
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        self.cache_dir = cache_dir or Config.HTTP_CACHE_DIR
+        self.max_bytes = max_bytes or Config.HTTP_CACHE_MAX_BYTES
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._load_index()
+
+    def _load_index(self):
+        """Reconstruit l'index LRU depuis le disque (ordre des dates d'accès)."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            files = []
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".cache"):
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                    files.append((stat.st_mtime, name[:-6], stat.st_size))
+            for _, key, size in sorted(files):
+                self._entries[key] = size
+                self.total_bytes += size
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du cache HTTP: {str(e)}")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.cache")
+
+    @staticmethod
+    def make_key(uri: str) -> str:
+        return hashlib.sha1(uri.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict, bytes]]:
+        """Retourne (métadonnées, corps) d'une entrée, ou None."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                with open(self._path(key), "rb") as f:
+                    meta = json.loads(f.readline().decode("utf-8"))
+                    body = f.read()
+                self._entries.move_to_end(key)
+                os.utime(self._path(key))
+                return meta, body
+            except Exception as e:
+                logger.warning(f"Entrée de cache HTTP illisible {key}: {str(e)}")
+                self._remove(key)
+                return None
+
+    def put(self, key: str, meta: Dict, body: bytes):
+        """Enregistre une entrée puis évince les plus anciennes si nécessaire."""
+        data = json.dumps(meta).encode("utf-8") + b"\n" + body
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                tmp_file = f"{self._path(key)}.tmp"
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_file, self._path(key))
+            except Exception as e:
+                logger.error(f"Erreur lors de l'écriture du cache HTTP: {str(e)}")
+                return
+            self.total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        """Supprime une entrée (appelé sous verrou)."""
+        self.total_bytes -= self._entries.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def record_hit(self, size: int):
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += size
+
+    def record_miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def get_stats(self) -> Dict:
+        """Compteurs du cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total * 100, 2) if total else 0,
+                "bytes_saved": self.bytes_saved,
+                "entries": len(self._entries),
+                "size_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class TransportWrapper(ABC):
+    """Base des couches empilées sur le transport httplib2 du client YouTube."""
+
+    def __init__(self, http):
+        self.http = http
+
+    def __getattr__(self, name):
+        # Déléguer le reste (credentials, timeout, ...) au transport d'origine
+        if name == "http":
+            raise AttributeError(name)
+        return getattr(self.http, name)
+
+    @abstractmethod
+    def _rewrap(self, inner):
+        """Crée la même couche autour d'un autre transport."""
+
+    def with_transport(self, base):
+        """Reconstruit toute la pile de couches autour du transport `base`."""
+        if isinstance(self.http, TransportWrapper):
+            return self._rewrap(self.http.with_transport(base))
+        return self._rewrap(base)
+
+    @staticmethod
+    def has_layer(http, cls) -> bool:
+        """Indique si la pile de transports contient déjà une couche `cls`."""
+        while isinstance(http, TransportWrapper):
+            if isinstance(http, cls):
+                return True
+            http = http.http
+        return False
+
+
+def install_transport_layer(youtube, cls, *args):
+    """Empile une couche `cls` sur le transport du client, une seule fois."""
+    http = getattr(youtube, "_http", None)
+    if http is None or TransportWrapper.has_layer(http, cls):
+        return False
+    youtube._http = cls(http, *args)
+    return True
+
+
+class CachingHttp(TransportWrapper):
+    """Transport HTTP (interface httplib2) envoyant des requêtes conditionnelles.
+
+    Les réponses 200 portant un ETag sont mémorisées ; les requêtes suivantes
+    envoient If-None-Match et un 304 est servi depuis le cache sous forme de 200.
+    """
+
+    def __init__(self, http, store: ETagCacheStore):
+        super().__init__(http)
+        self.store = store
+
+    def _rewrap(self, inner):
+        return CachingHttp(inner, self.store)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if method != "GET" or not CACHEABLE_RESOURCES.search(uri):
+            return self.http.request(
+                uri, method=method, body=body, headers=headers, **kwargs
+            )
+
+        import httplib2
+
+        key = ETagCacheStore.make_key(uri)
+        cached = self.store.get(key)
+        headers = dict(headers or {})
+        if cached:
+            headers["If-None-Match"] = cached[0]["etag"]
+
+        response, content = self.http.request(
+            uri, method=method, body=body, headers=headers, **kwargs
+        )
+
+        if response.status == 304 and cached:
+            meta, cached_body = cached
+            self.store.record_hit(len(cached_body))
+            return httplib2.Response(meta["headers"]), cached_body
+
+        self.store.record_miss()
+        etag = response.get("etag")
+        if response.status == 200 and etag:
+            self.store.put(
+                key, {"etag": etag, "headers": dict(response.items())}, content
+            )
+        return response, content
+
+
+def install_http_cache(youtube, store: ETagCacheStore):
+    """Insère le cache ETag sous le client googleapiclient, une seule fois."""
+    if install_transport_layer(youtube, CachingHttp, store):
+        logger.info("Cache HTTP ETag activé pour le client YouTube")
@@ -0,0 +1,194 @@
+import base64
+import json
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from config import Config
+from durations import parse_iso_duration
+
+SORT_FIELDS = ("added_at", "duration", "title")
+# Ordre par défaut : les plus récentes et les plus longues d'abord
+DEFAULT_ORDER = {"added_at": "desc", "duration": "desc", "title": "asc"}
+QUERY_ARGS = ("limit", "cursor", "sort", "order", "fields")
+
+
+def sort_value(sort: str, item: Dict):
+    """Valeur de tri d'un élément, jamais None (comparaison de tuples)."""
+    if sort == "title":
+        return (item.get("title") or "").casefold()
+    if sort == "added_at":
+        return item.get("added_at") or item.get("publishedAt") or ""
+    for key in ("seconds", "duration_seconds"):
+        if isinstance(item.get(key), (int, float)):
+            return item[key]
+    duration = item.get("duration")
+    if isinstance(duration, str):
+        try:
+            return parse_iso_duration(duration)
+        except Exception:
+            return 0
+    return duration if isinstance(duration, (int, float)) else 0
+
+
+def encode_cursor(sort: str, key: Tuple) -> str:
+    """Curseur opaque : tri et clé (valeur, id) du dernier élément renvoyé."""
+    raw = json.dumps([sort, key[0], key[1]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, value, item_id = json.loads(raw)
+    except Exception:
+        raise ValueError("Curseur invalide")
+    if cursor_sort != sort:
+        raise ValueError("Curseur obtenu avec un autre tri")
+    # Même type que les clés de l'index, sinon la recherche dichotomique échoue
+    expected = (int, float) if sort == "duration" else str
+    if (
+        not isinstance(value, expected)
+        or isinstance(value, bool)
+        or not isinstance(item_id, str)
+    ):
+        raise ValueError("Curseur invalide")
+    return value, item_id
+
+
+def parse_list_query(args) -> Optional[Dict]:
+    """Paramètres de pagination d'une route de liste.
+
+    Retourne None sans aucun de ces paramètres : la route renvoie alors la
+    liste complète, comme auparavant. Lève ValueError si un paramètre est
+    invalide.
+    """
+    if not any(name in args for name in QUERY_ARGS):
+        return None
+    sort = args.get("sort", "added_at")
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"Tri inconnu: {sort} (valeurs: {', '.join(SORT_FIELDS)})")
+    order = args.get("order", DEFAULT_ORDER[sort])
+    if order not in ("asc", "desc"):
+        raise ValueError(f"Ordre inconnu: {order} (asc ou desc)")
+    try:
+        limit = int(args.get("limit", Config.LIST_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("Le paramètre limit doit être un entier")
+    cursor = args.get("cursor")
+    fields = args.get("fields")
+    return {
+        "sort": sort,
+        "descending": order == "desc",
+        "limit": max(1, min(limit, Config.LIST_MAX_PAGE_SIZE)),
+        "after": decode_cursor(cursor, sort) if cursor else None,
+        "fields": (
+            tuple(field.strip() for field in fields.split(",") if field.strip())
+            if fields
+            else None
+        ),
+    }
+
+
+def project(item_id: str, item: Dict, fields: Optional[Iterable[str]]) -> Dict:
+    """Élément avec son identifiant, réduit aux champs demandés."""
+    if fields is None:
+        return item if item.get("id") == item_id else {"id": item_id, **item}
+    projected = {"id": item_id}
+    projected.update({field: item.get(field) for field in fields if field != "id"})
+    return projected
+
+
+class SortedIndex:
+    """Clés (valeur de tri, id) d'une collection, triées une seule fois.
+
+    Une page se trouve par recherche dichotomique après la clé du curseur :
+    O(log n + taille de la page), et les éléments insérés entre deux pages
+    ne décalent pas la pagination.
+    """
+
+    def __init__(self, items: Mapping[str, Dict], sort: str):
+        self.items = items
+        self.sort = sort
+        self.keys: List[Tuple] = sorted(
+            (sort_value(sort, item), item_id) for item_id, item in items.items()
+        )
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def page(self, query: Dict) -> Dict:
+        limit = query["limit"]
+        key = tuple(query["after"]) if query["after"] else None
+        if query["descending"]:
+            end = bisect_left(self.keys, key) if key else len(self.keys)
+            start = max(0, end - limit)
+            keys = self.keys[start:end][::-1]
+            more = start > 0
+        else:
+            start = bisect_right(self.keys, key) if key else 0
+            keys = self.keys[start : start + limit]
+            more = start + limit < len(self.keys)
+        return {
+            "items": [
+                project(item_id, self.items[item_id], query["fields"])
+                for _, item_id in keys
+            ],
+            "next_cursor": (
+                encode_cursor(self.sort, keys[-1]) if keys and more else None
+            ),
+            "total_count": len(self.keys),
+        }
+
+
+class ListIndexCache:
+    """Index triés des collections paginées, par version de la collection.
+
+    La collection est chargée une fois par version (un seul chargement
+    même si plusieurs pages sont demandées en même temps) et chaque tri
+    construit son index à la première demande.
+    """
+
+    def __init__(self):
+        self._collections: Dict[str, Tuple] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _collection(
+        self,
+        name: str,
+        version,
+        load: Callable[[], Union[Mapping[str, Dict], List[Dict]]],
+    ) -> Tuple:
+        entry = self._collections.get(name)
+        if entry is not None and entry[0] == version:
+            return entry
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            entry = self._collections.get(name)
+            if entry is None or entry[0] != version:
+                items = load()
+                if not isinstance(items, Mapping):
+                    items = {
+                        str(item.get("id") or position): item
+                        for position, item in enumerate(items)
+                    }
+                entry = (version, items, {})
+                self._collections[name] = entry
+            return entry
+
+    def index(self, name: str, version, load: Callable, sort: str) -> SortedIndex:
+        _, items, indexes = self._collection(name, version, load)
+        index = indexes.get(sort)
+        if index is None:
+            # Construction concurrente possible mais idempotente
+            index = indexes[sort] = SortedIndex(items, sort)
+        return index
+
+    def page(self, name: str, version, load: Callable, query: Dict) -> Dict:
+        """Page de la collection `name` selon `query` (voir parse_list_query)."""
+        return self.index(name, version, load, query["sort"]).page(query)
+
+    def clear(self):
+        with self._lock:
+            self._collections.clear()
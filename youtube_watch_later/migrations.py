@@ -1,9 +1,13 @@
+import glob
 import json
 import os
 import logging
+import shutil
+import time
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from config import Config
+from video_history import VideoHistory
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +15,14 @@ logger = logging.getLogger(__name__)
 class Migration:
     """Gère les migrations de données."""
 
-    def __init__(self, statistics_file: str):
+    def __init__(self, statistics_file: str, backup_retention: int = None):
         self.statistics_file = statistics_file
+        self.backup_retention = (
+            Config.MIGRATION_BACKUP_RETENTION
+            if backup_retention is None
+            else backup_retention
+        )
+        self.last_report: Optional[Dict[str, Any]] = None
         self.migrations: List[Dict[str, Any]] = [
             {
                 "version": 1,
@@ -29,90 +39,174 @@ class Migration:
                 "description": "Ajout de l'historique des vidéos",
                 "function": self._migrate_v3,
             },
+            {
+                "version": 4,
+                "description": "Durées en secondes entières",
+                "function": self._migrate_v4,
+            },
         ]
 
     def _get_current_version(self, data: Dict) -> int:
         """Récupère la version actuelle des données."""
         return data.get("version", 0)
 
-    def _save_data(self, data: Dict):
-        """Sauvegarde les données avec backup."""
-        # Créer un backup avant la migration
-        if os.path.exists(self.statistics_file):
-            backup_file = (
-                f"{self.statistics_file}.bak.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
+    def _backup(self) -> Optional[str]:
+        """Sauvegarde unique du fichier d'origine.
+
+        Un lien physique suffit : le fichier migré remplace l'original par
+        renommage, l'ancien contenu reste accessible via la sauvegarde.
+        """
+        if not os.path.exists(self.statistics_file):
+            return None
+        backup_file = (
+            f"{self.statistics_file}.bak."
+            f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        )
+        try:
+            os.link(self.statistics_file, backup_file)
+        except OSError:
+            shutil.copy2(self.statistics_file, backup_file)
+        return backup_file
+
+    def _prune_backups(self) -> int:
+        """Supprime les sauvegardes au-delà de la rétention ; retourne leur nombre."""
+        if self.backup_retention <= 0:
+            return 0
+        backups = sorted(glob.glob(f"{glob.escape(self.statistics_file)}.bak.*"))
+        removed = 0
+        for backup_file in backups[: -self.backup_retention]:
             try:
-                with open(self.statistics_file, "r", encoding="utf-8") as src:
-                    with open(backup_file, "w", encoding="utf-8") as dst:
-                        dst.write(src.read())
-            except Exception as e:
-                logger.error(f"Erreur lors de la création du backup: {str(e)}")
+                os.remove(backup_file)
+                removed += 1
+            except OSError as e:
+                logger.error(f"Erreur lors de la suppression du backup: {str(e)}")
+        return removed
+
+    def _save_data(self, data: Dict) -> Dict[str, Any]:
+        """Écrit les données migrées en une fois, avec une seule sauvegarde.
 
-        # Sauvegarder les nouvelles données
+        Fichier temporaire, fsync, sauvegarde de l'original puis renommage
+        atomique : une interruption laisse l'ancien ou le nouveau fichier.
+        """
+        tmp_file = f"{self.statistics_file}.tmp"
         try:
-            with open(self.statistics_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            os.makedirs(os.path.dirname(self.statistics_file) or ".", exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            backup_file = self._backup()
+            os.replace(tmp_file, self.statistics_file)
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde des données: {str(e)}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             raise
+        return {
+            "bytes_written": len(payload),
+            "backup": backup_file,
+            "backups_pruned": self._prune_backups(),
+        }
 
     def _migrate_v1(self, data: Dict) -> Dict:
-        """Migration vers la version 1: Structure initiale."""
+        """Migration vers la version 1: Structure initiale.
+
+        Les clés manquantes reçoivent leur valeur par défaut ; les données
+        existantes (fichier écrit sans numéro de version) sont conservées.
+        """
         return {
-            "version": 1,
             "total_videos": 0,
             "total_watch_time": 0,
             "videos_by_month": {},
             "daily_stats": {},
             "selected_channels": 0,
             "last_check": datetime.now().isoformat(),
+            **data,
+            "version": 1,
         }
 
     def _migrate_v2(self, data: Dict) -> Dict:
         """Migration vers la version 2: Ajout du suivi du quota."""
-        data["quota_usage"] = {
-            "used": 0,
-            "limit": Config.YOUTUBE_QUOTA_LIMIT,
-            "reset_date": datetime.now().isoformat(),
-        }
+        data.setdefault(
+            "quota_usage",
+            {
+                "used": 0,
+                "limit": Config.YOUTUBE_QUOTA_LIMIT,
+                "reset_date": datetime.now().isoformat(),
+            },
+        )
         data["version"] = 2
         return data
 
     def _migrate_v3(self, data: Dict) -> Dict:
         """Migration vers la version 3: Ajout de l'historique des vidéos."""
-        data["video_history"] = []
+        data.setdefault("video_history", [])
         data["version"] = 3
         return data
 
+    def _migrate_v4(self, data: Dict) -> Dict:
+        """Migration vers la version 4: durées en secondes entières."""
+        migrate_durations_to_seconds(data)
+        data["version"] = 4
+        return data
+
     def run(self):
-        """Exécute les migrations nécessaires."""
+        """Exécute les migrations nécessaires.
+
+        Toutes les étapes en attente sont appliquées en mémoire, puis le
+        fichier est écrit une seule fois. Le bilan (versions, durée, octets
+        lus et écrits, sauvegarde) est disponible dans `last_report`.
+        """
         try:
+            started = time.perf_counter()
             # Charger les données existantes ou créer une nouvelle structure
+            bytes_read = 0
             try:
-                with open(self.statistics_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                with open(self.statistics_file, "rb") as f:
+                    raw = f.read()
+                bytes_read = len(raw)
+                data = json.loads(raw)
             except (FileNotFoundError, json.JSONDecodeError):
                 data = {}
 
             current_version = self._get_current_version(data)
+            pending = [m for m in self.migrations if m["version"] > current_version]
 
             # Appliquer les migrations nécessaires
-            for migration in self.migrations:
-                if migration["version"] > current_version:
-                    logger.info(
-                        f"Application de la migration v{migration['version']}: {migration['description']}"
+            for migration in pending:
+                logger.info(
+                    f"Application de la migration v{migration['version']}: {migration['description']}"
+                )
+                try:
+                    data = migration["function"](data)
+                except Exception as e:
+                    logger.error(
+                        f"Erreur lors de la migration v{migration['version']}: {str(e)}"
                     )
-                    try:
-                        data = migration["function"](data)
-                        self._save_data(data)
-                        logger.info(f"Migration v{migration['version']} réussie")
-                    except Exception as e:
-                        logger.error(
-                            f"Erreur lors de la migration v{migration['version']}: {str(e)}"
-                        )
-                        raise
+                    raise
+
+            report = {
+                "from_version": current_version,
+                "to_version": self._get_current_version(data),
+                "steps": [m["version"] for m in pending],
+                "bytes_read": bytes_read,
+                "bytes_written": 0,
+                "backup": None,
+                "backups_pruned": 0,
+            }
+            if pending:
+                report.update(self._save_data(data))
+            report["duration"] = round(time.perf_counter() - started, 3)
+            self.last_report = report
 
+            if pending:
+                logger.info(
+                    f"Migrations v{current_version} -> v{report['to_version']} "
+                    f"appliquées en {report['duration']}s "
+                    f"({report['bytes_read']} octets lus, "
+                    f"{report['bytes_written']} écrits, sauvegarde: {report['backup']})"
+                )
             return data
 
         except Exception as e:
@@ -120,6 +214,82 @@ class Migration:
             raise
 
 
+def migrate_durations_to_seconds(data: Dict) -> bool:
+    """Ajoute les durées en secondes entières aux statistiques (idempotent).
+
+    Les vidéos suivies reçoivent `seconds`, les agrégats quotidiens et
+    mensuels `watch_seconds` ; le temps total est recalculé exactement.
+    Retourne True si des données ont été converties.
+    """
+    changed = False
+    tracked = data.get("tracked_videos") or {}
+    for entry in tracked.values():
+        if entry.get("seconds") is None:
+            entry["seconds"] = int(round(float(entry.get("duration") or 0) * 60))
+            changed = True
+
+    for buckets in (data.get("daily_stats") or {}, data.get("videos_by_month") or {}):
+        for bucket in buckets.values():
+            if bucket.get("watch_seconds") is None:
+                bucket["watch_seconds"] = int(
+                    round(float(bucket.get("watch_time") or 0) * 60)
+                )
+                changed = True
+
+    if changed:
+        total_seconds = sum(entry["seconds"] for entry in tracked.values())
+        data["total_watch_time"] = round(total_seconds / 60, 2)
+    return changed
+
+
+def import_json_stats(
+    storage,
+    statistics_file: str = None,
+    tracking_file: str = None,
+    history_file: str = None,
+) -> bool:
+    """Importe statistics.json (avec tracked_videos.json et l'historique
+    video_history.jsonl) dans un stockage alternatif (SQLite ou journal
+    d'évènements).
+
+    Les fichiers JSON sont conservés tels quels comme sauvegarde.
+    """
+    statistics_file = statistics_file or Config.STATISTICS_FILE
+    tracking_file = tracking_file or Config.VIDEOS_TRACKING_FILE
+    history_file = history_file or Config.VIDEO_HISTORY_FILE
+    if not os.path.exists(statistics_file):
+        return False
+
+    try:
+        with open(statistics_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        # Vidéos connues du tracker mais absentes des statistiques
+        if os.path.exists(tracking_file):
+            with open(tracking_file, "r", encoding="utf-8") as f:
+                tracked = json.load(f)
+            data.setdefault("tracked_videos", {})
+            for video_id, video in tracked.items():
+                if isinstance(video, dict):
+                    data["tracked_videos"].setdefault(video_id, video)
+
+        # En JSON, l'historique n'est plus dans statistics.json
+        if os.path.exists(history_file):
+            data["video_history"] = VideoHistory(history_file=history_file).to_list()
+
+        migrate_durations_to_seconds(data)
+        storage.import_stats(data)
+        logger.info(
+            f"Statistiques migrées vers {type(storage).__name__}: "
+            f"{len(data.get('tracked_videos', {}))} vidéos suivies, "
+            f"{len(data.get('video_history', []))} entrées d'historique"
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Erreur lors de la migration des statistiques: {str(e)}")
+        return False
+
+
 def run_migrations():
     """Fonction utilitaire pour exécuter les migrations."""
     try:
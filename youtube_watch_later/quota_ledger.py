@@ -0,0 +1,214 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+from config import Config
+from http_cache import TransportWrapper, install_transport_layer
+
+logger = logging.getLogger(__name__)
+
+# Coût officiel (en unités) de chaque méthode de l'API YouTube Data v3
+QUOTA_COSTS = {
+    ("channels", "list"): 1,
+    ("playlistItems", "list"): 1,
+    ("playlistItems", "insert"): 50,
+    ("playlistItems", "update"): 50,
+    ("playlistItems", "delete"): 50,
+    ("playlists", "list"): 1,
+    ("playlists", "insert"): 50,
+    ("playlists", "update"): 50,
+    ("playlists", "delete"): 50,
+    ("subscriptions", "list"): 1,
+    ("subscriptions", "insert"): 50,
+    ("subscriptions", "delete"): 50,
+    ("videos", "list"): 1,
+    ("videos", "rate"): 50,
+    ("videos", "getRating"): 1,
+    ("videos", "update"): 50,
+    ("videos", "delete"): 50,
+    ("videos", "insert"): 1600,
+    ("search", "list"): 100,
+}
+DEFAULT_COST = 1
+
+HTTP_METHODS = {"GET": "list", "POST": "insert", "PUT": "update", "DELETE": "delete"}
+API_PATH = re.compile(r"/youtube/v3/([A-Za-z]+)(?:/([A-Za-z]+))?")
+
+# Route ou tâche de fond à laquelle l'utilisation du quota est attribuée
+_caller: ContextVar[str] = ContextVar("quota_caller", default="background")
+
+
+def _pacific_tz():
+    """Fuseau du Pacifique, où le quota YouTube est réinitialisé à minuit."""
+    try:
+        from zoneinfo import ZoneInfo
+
+        return ZoneInfo("America/Los_Angeles")
+    except Exception:
+        return timezone(timedelta(hours=-8))
+
+
+QUOTA_TZ = _pacific_tz()
+
+
+def resolve_cost(uri: str, http_method: str):
+    """Retourne (ressource, méthode, coût) d'une requête vers l'API."""
+    match = API_PATH.search(uri)
+    if not match:
+        return None, None, 0
+    resource, action = match.group(1), match.group(2)
+    method = action or HTTP_METHODS.get(http_method.upper(), "list")
+    return resource, method, QUOTA_COSTS.get((resource, method), DEFAULT_COST)
+
+
+def get_caller() -> str:
+    return _caller.get()
+
+
+def set_caller(name: str):
+    """Définit l'appelant courant ; retourne un jeton pour reset_caller."""
+    return _caller.set(name)
+
+
+def reset_caller(token):
+    _caller.reset(token)
+
+
+@contextmanager
+def quota_caller(name: str):
+    """Attribue les appels API du bloc à `name` (route ou tâche de fond)."""
+    token = _caller.set(name)
+    try:
+        yield
+    finally:
+        _caller.reset(token)
+
+
+class QuotaLedger:
+    """Registre journalier de l'utilisation du quota, persisté sur disque."""
+
+    def __init__(self, ledger_file: str = None, limit: int = None):
+        self.ledger_file = ledger_file or Config.QUOTA_LEDGER_FILE
+        self.limit = limit or Config.YOUTUBE_QUOTA_LIMIT
+        self._lock = threading.Lock()
+        self._last_save = 0.0
+        self._dirty = False
+        self.days: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            if os.path.exists(self.ledger_file):
+                with open(self.ledger_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du registre de quota: {str(e)}")
+        return {}
+
+    def _save(self):
+        """Écriture atomique du registre (appelé sous verrou)."""
+        try:
+            os.makedirs(os.path.dirname(self.ledger_file), exist_ok=True)
+            cutoff = (
+                self._now() - timedelta(days=Config.STATS_RETENTION_DAYS)
+            ).strftime("%Y-%m-%d")
+            self.days = {day: v for day, v in self.days.items() if day >= cutoff}
+            tmp_file = f"{self.ledger_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.days, f, indent=2)
+            os.replace(tmp_file, self.ledger_file)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        except Exception as e:
+            logger.error(f"Erreur lors de la sauvegarde du registre de quota: {str(e)}")
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(QUOTA_TZ)
+
+    def _today(self) -> Dict:
+        day = self._now().strftime("%Y-%m-%d")
+        if day not in self.days:
+            self.days[day] = {"used": 0, "by_caller": {}, "by_method": {}}
+        return self.days[day]
+
+    def record(self, resource: str, method: str, cost: int, caller: str = None):
+        """Enregistre le coût d'un appel API."""
+        caller = caller or get_caller()
+        key = f"{resource}.{method}"
+        with self._lock:
+            today = self._today()
+            today["used"] += cost
+            today["by_caller"][caller] = today["by_caller"].get(caller, 0) + cost
+            today["by_method"][key] = today["by_method"].get(key, 0) + cost
+            self._dirty = True
+            if time.monotonic() - self._last_save >= Config.QUOTA_LEDGER_SAVE_INTERVAL:
+                self._save()
+
+    def flush(self):
+        """Force l'écriture des changements en attente."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def get_used(self) -> int:
+        with self._lock:
+            return self._today()["used"]
+
+    def get_status(self) -> Dict:
+        """Statut du quota au format attendu par /get_quota_status."""
+        now = self._now()
+        next_reset = (now + timedelta(days=1)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        remaining_time = next_reset - now
+        hours, rest = divmod(int(remaining_time.total_seconds()), 3600)
+
+        with self._lock:
+            today = self._today()
+            used = today["used"]
+            by_caller = dict(today["by_caller"])
+            by_method = dict(today["by_method"])
+
+        return {
+            "used": used,
+            "limit": self.limit,
+            "remaining": max(0, self.limit - used),
+            "percentage_used": round(used / self.limit * 100, 2) if self.limit else 0,
+            "time_until_reset": f"Réinitialisation dans {hours}h {rest // 60:02d}min",
+            "next_reset": next_reset.isoformat(),
+            "by_caller": by_caller,
+            "by_method": by_method,
+        }
+
+
+class QuotaAccountingHttp(TransportWrapper):
+    """Couche de transport comptant le coût de chaque requête sortante."""
+
+    def __init__(self, http, ledger: QuotaLedger):
+        super().__init__(http)
+        self.ledger = ledger
+
+    def _rewrap(self, inner):
+        return QuotaAccountingHttp(inner, self.ledger)
+
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        response = self.http.request(
+            uri, method=method, body=body, headers=headers, **kwargs
+        )
+        # Toute requête, même invalide, consomme du quota
+        resource, api_method, cost = resolve_cost(uri, method)
+        if cost:
+            self.ledger.record(resource, api_method, cost)
+        return response
+
+
+def install_quota_accounting(youtube, ledger: QuotaLedger):
+    """Branche le comptage du quota sur le client googleapiclient, une seule fois."""
+    if install_transport_layer(youtube, QuotaAccountingHttp, ledger):
+        logger.info("Comptage du quota activé pour le client YouTube")
@@ -0,0 +1,149 @@
+import gzip
+import logging
+from collections.abc import Mapping
+from typing import Optional
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
+from config import Config
+from video_table import json_default
+
+try:
+    import orjson
+except ImportError:  # Dépendance optionnelle
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # Dépendance optionnelle
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_MIMETYPES = (
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+
+def _default(value):
+    """Types non natifs : structures compactes, vues en lecture seule, puis Flask."""
+    try:
+        return json_default(value)
+    except TypeError:
+        pass
+    if isinstance(value, Mapping):
+        return dict(value)
+    return DefaultJSONProvider.default(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Sérialisation JSON de `jsonify` : orjson si installé, sinon json standard.
+
+    Les clés ne sont plus triées et l'UTF-8 n'est plus échappé, dans les
+    deux cas ; en mode debug, la sortie reste indentée (json standard).
+    """
+
+    sort_keys = False
+    ensure_ascii = False
+    default = staticmethod(_default)
+
+    @property
+    def fast(self) -> bool:
+        return orjson is not None and Config.JSON_FAST_ENCODER
+
+    def _orjson(self, obj) -> Optional[bytes]:
+        try:
+            return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Cas non gérés par orjson (entiers > 64 bits...) : json standard
+            return None
+
+    def dumps(self, obj, **kwargs) -> str:
+        if self.fast and not kwargs:
+            body = self._orjson(obj)
+            if body is not None:
+                return body.decode("utf-8")
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs) -> Response:
+        if not self.fast or self._app.debug:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self._orjson(obj)
+        if body is None:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def compressible(mimetype: Optional[str]) -> bool:
+    mimetype = mimetype or ""
+    return mimetype.startswith("text/") or mimetype in COMPRESSIBLE_MIMETYPES
+
+
+def negotiate_encoding() -> Optional[str]:
+    """Meilleur encodage accepté par le client : br (si disponible) puis gzip."""
+    if not Config.COMPRESSION_ENABLED:
+        return None
+    offers = ["br", "gzip"] if brotli is not None else ["gzip"]
+    return request.accept_encodings.best_match(offers)
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    """Compresse `body` ; niveau élevé pour une entrée de cache (compressée une fois)."""
+    if encoding == "br":
+        quality = (
+            Config.COMPRESSION_CACHED_BROTLI_QUALITY
+            if cached
+            else Config.COMPRESSION_BROTLI_QUALITY
+        )
+        return brotli.compress(body, quality=quality)
+    level = (
+        Config.COMPRESSION_CACHED_GZIP_LEVEL
+        if cached
+        else Config.COMPRESSION_GZIP_LEVEL
+    )
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_response(response: Response) -> Response:
+    """Hook after_request : compresse le corps au-delà de COMPRESSION_MIN_SIZE.
+
+    Les flux (SSE), les fichiers statiques et les réponses déjà encodées,
+    comme les entrées pré-compressées du cache des routes, sont laissés
+    tels quels.
+    """
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+        or not compressible(response.mimetype)
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if response.content_length is not None and (
+        response.content_length < Config.COMPRESSION_MIN_SIZE
+    ):
+        return response
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+    body = response.get_data()
+    if len(body) < Config.COMPRESSION_MIN_SIZE:
+        return response
+    response.set_data(compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def install_response_pipeline(app: Flask):
+    """Encodeur JSON rapide et compression des réponses de l'application."""
+    app.json = FastJSONProvider(app)
+    app.after_request(compress_response)
+    logger.info(
+        f"Réponses: JSON {'orjson' if app.json.fast else 'standard'}, "
+        f"compression {'br+gzip' if brotli is not None else 'gzip'}"
+        f"{'' if Config.COMPRESSION_ENABLED else ' désactivée'}"
+    )
@@ -0,0 +1,215 @@
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+from config import Config
+
+# Granularités, de la plus fine à la plus grossière
+TIERS = ("hour", "day", "week", "month")
+ALL_CHANNELS = "*"
+UNKNOWN_CHANNEL = "unknown"
+
+
+def bucket_key(tier: str, at: datetime) -> str:
+    """Clé du compartiment contenant `at` ; l'ordre lexical suit le temps."""
+    if tier == "hour":
+        return at.strftime("%Y-%m-%dT%H")
+    if tier == "day":
+        return at.strftime("%Y-%m-%d")
+    if tier == "week":
+        return (at.date() - timedelta(days=at.weekday())).isoformat()
+    return at.strftime("%Y-%m")
+
+
+def _bucket_start(tier: str, at: datetime) -> datetime:
+    if tier == "hour":
+        return at.replace(minute=0, second=0, microsecond=0)
+    day = at.replace(hour=0, minute=0, second=0, microsecond=0)
+    if tier == "day":
+        return day
+    if tier == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def _next_bucket(tier: str, start: datetime) -> datetime:
+    if tier == "hour":
+        return start + timedelta(hours=1)
+    if tier == "day":
+        return start + timedelta(days=1)
+    if tier == "week":
+        return start + timedelta(days=7)
+    return (start + timedelta(days=32)).replace(day=1)
+
+
+def retention(tier: str) -> Optional[timedelta]:
+    """Durée de conservation d'une granularité ; None = illimitée."""
+    days = {
+        "hour": Config.ROLLUP_HOURLY_RETENTION_DAYS,
+        "day": Config.ROLLUP_DAILY_RETENTION_DAYS,
+        "week": Config.ROLLUP_WEEKLY_RETENTION_DAYS,
+    }.get(tier)
+    return timedelta(days=days) if days else None
+
+
+class RollupIndex:
+    """Index d'agrégats par chaîne à plusieurs résolutions temporelles.
+
+    Chaque ajout incrémente son compartiment horaire, quotidien, hebdomadaire
+    et mensuel. Le vieillissement supprime seulement les compartiments fins
+    trop anciens : les granularités plus grossières les contiennent déjà.
+    Une requête sur une plage lit un compartiment par pas de temps, quelle
+    que soit la quantité d'historique.
+
+    Les données restent un dictionnaire sérialisable :
+    {tier: {clé: {channel_id: [nombre, secondes]}}, "titles": {...}}.
+    """
+
+    def __init__(self, data: Optional[Dict] = None):
+        self.data = data if data is not None else {}
+        for tier in TIERS:
+            self.data.setdefault(tier, {})
+        self.data.setdefault("titles", {})
+        self._lock = threading.Lock()
+        self._aged_day = None
+
+    def add(
+        self,
+        at: datetime,
+        channel_id: Optional[str],
+        seconds: int,
+        count: int = 1,
+        title: Optional[str] = None,
+        tiers: tuple = TIERS,
+    ):
+        """Ajoute `count` vidéos (durée totale `seconds`) à l'instant `at`."""
+        channel_id = channel_id or UNKNOWN_CHANNEL
+        with self._lock:
+            for tier in tiers:
+                bucket = self.data[tier].setdefault(bucket_key(tier, at), {})
+                for key in (channel_id, ALL_CHANNELS):
+                    values = bucket.setdefault(key, [0, 0])
+                    values[0] += count
+                    values[1] += seconds
+            if title:
+                self.data["titles"][channel_id] = title
+
+    def age(self, now: Optional[datetime] = None) -> int:
+        """Supprime les compartiments au-delà de leur rétention ; retourne leur nombre."""
+        now = now or datetime.now()
+        removed = 0
+        with self._lock:
+            for tier in TIERS:
+                keep = retention(tier)
+                if keep is None:
+                    continue
+                cutoff = bucket_key(tier, now - keep)
+                buckets = self.data[tier]
+                for key in [key for key in buckets if key < cutoff]:
+                    del buckets[key]
+                    removed += 1
+            self._aged_day = now.date()
+        return removed
+
+    def age_daily(self, now: datetime) -> int:
+        """Vieillit l'index au plus une fois par jour (appelé à chaque ajout)."""
+        if self._aged_day == now.date():
+            return 0
+        return self.age(now)
+
+    def covering_tier(self, start: datetime, finest: str = "day") -> str:
+        """Granularité la plus fine, à partir de `finest`, qui couvre encore `start`."""
+        now = datetime.now()
+        for tier in TIERS[TIERS.index(finest) :]:
+            keep = retention(tier)
+            if keep is None or start >= now - keep:
+                return tier
+        return TIERS[-1]
+
+    @staticmethod
+    def _keys(tier: str, start: datetime, end: datetime) -> Iterator[str]:
+        current = _bucket_start(tier, start)
+        while current <= end:
+            yield bucket_key(tier, current)
+            current = _next_bucket(tier, current)
+
+    def series(
+        self,
+        tier: str,
+        start: datetime,
+        end: datetime,
+        channel_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """Série complète (compartiments vides inclus) entre `start` et `end`."""
+        buckets = self.data[tier]
+        channel = channel_id or ALL_CHANNELS
+        with self._lock:
+            return [
+                {"bucket": key, "count": values[0], "seconds": values[1]}
+                for key in self._keys(tier, start, end)
+                for values in (buckets.get(key, {}).get(channel, (0, 0)),)
+            ]
+
+    def channel_totals(
+        self, tier: str, start: datetime, end: datetime
+    ) -> Dict[str, List[int]]:
+        """Totaux [nombre, secondes] par chaîne sur la plage."""
+        buckets = self.data[tier]
+        totals: Dict[str, List[int]] = {}
+        with self._lock:
+            for key in self._keys(tier, start, end):
+                for channel_id, (count, seconds) in buckets.get(key, {}).items():
+                    if channel_id == ALL_CHANNELS:
+                        continue
+                    values = totals.setdefault(channel_id, [0, 0])
+                    values[0] += count
+                    values[1] += seconds
+        return totals
+
+    def title(self, channel_id: str) -> Optional[str]:
+        return self.data["titles"].get(channel_id)
+
+    def seed(self, tracked_videos: Dict[str, Dict], stats: Dict):
+        """Construit l'index à partir des données existantes.
+
+        Les vidéos suivies donnent la répartition par chaîne ; le reste des
+        compteurs quotidiens et mensuels (vidéos retirées depuis) est
+        rattaché à une chaîne inconnue.
+        """
+        for entry in tracked_videos.values():
+            try:
+                at = datetime.fromisoformat(entry.get("added_at") or "")
+            except ValueError:
+                continue
+            self.add(
+                at.replace(tzinfo=None),
+                entry.get("channel_id"),
+                int(entry.get("seconds") or 0),
+            )
+
+        for day, values in sorted(stats.get("daily_stats", {}).items()):
+            try:
+                at = datetime.strptime(day, "%Y-%m-%d")
+            except ValueError:
+                continue
+            self._add_remainder("day", at, values.get("videos_added", 0), values)
+
+        for month, values in sorted(stats.get("videos_by_month", {}).items()):
+            try:
+                at = datetime.strptime(month, "%Y-%m")
+            except ValueError:
+                continue
+            self._add_remainder("month", at, values.get("count", 0), values)
+
+    def _add_remainder(self, tier: str, at: datetime, count: int, values: Dict):
+        known = self.data[tier].get(bucket_key(tier, at), {}).get(ALL_CHANNELS, (0, 0))
+        seconds = values.get("watch_seconds")
+        if seconds is None:
+            seconds = round(float(values.get("watch_time") or 0) * 60)
+        missing = count - known[0]
+        if missing > 0:
+            tiers = TIERS[TIERS.index(tier) :]
+            self.add(at, None, max(seconds - known[1], 0), missing, tiers=tiers)
+
+    def to_dict(self) -> Dict:
+        """Dictionnaire sous-jacent (sérialisation JSON)."""
+        return self.data
@@ -0,0 +1,281 @@
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional
+from flask import Response, request
+from config import Config
+from response_pipeline import compress, compressible, negotiate_encoding
+
+logger = logging.getLogger(__name__)
+
+# Distingue les ETags d'un démarrage à l'autre (compteurs remis à zéro)
+BOOT_ID = format(int(time.time() * 1000) & 0xFFFFFFFF, "x")
+
+
+class CachedResponse:
+    """Réponse mise en cache : corps, statut et en-têtes, sans l'objet Flask.
+
+    Le corps est compressé une seule fois par encodage, à la première
+    demande, puis servi tel quel aux requêtes suivantes.
+    """
+
+    __slots__ = (
+        "body",
+        "status",
+        "headers",
+        "mimetype",
+        "expires",
+        "tags",
+        "version",
+        "encoded",
+    )
+
+    def __init__(self, response: Response, expires: float, tags, version):
+        self.body = response.get_data()
+        self.status = response.status_code
+        self.headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            # Content-Type est reconstruit à partir de mimetype
+            if name.lower() not in ("content-length", "content-type", "set-cookie")
+        ]
+        self.mimetype = response.mimetype
+        self.expires = expires
+        self.tags = tuple(tags)
+        self.version = version
+        self.encoded: Dict[str, bytes] = {}
+
+    def to_response(self, encoding: Optional[str] = None) -> Response:
+        if (
+            encoding is None
+            or len(self.body) < Config.COMPRESSION_MIN_SIZE
+            or not compressible(self.mimetype)
+        ):
+            response = Response(self.body, status=self.status, mimetype=self.mimetype)
+            response.headers.extend(self.headers)
+            return response
+        body = self.encoded.get(encoding)
+        if body is None:
+            # Course possible entre deux requêtes : résultat identique
+            body = self.encoded[encoding] = compress(self.body, encoding, cached=True)
+        response = Response(body, status=self.status, mimetype=self.mimetype)
+        response.headers.extend(self.headers)
+        response.headers["Content-Encoding"] = encoding
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+class RouteCache:
+    """Cache des réponses des routes en lecture, borné (LRU) avec TTL par route.
+
+    La clé comprend la route et ses paramètres de requête. Chaque entrée
+    porte des étiquettes : les routes qui modifient les données invalident
+    les étiquettes concernées. Une fonction de version optionnelle (compteur
+    de modifications) invalide aussi les entrées modifiées hors des routes,
+    par exemple par la surveillance en arrière-plan.
+    """
+
+    def __init__(self, max_entries: int = None, default_ttl: float = None):
+        self.max_entries = max_entries or Config.ROUTE_CACHE_MAX_ENTRIES
+        self.default_ttl = default_ttl or Config.ROUTE_CACHE_TTL
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._generations: Dict[str, int] = {}  # Invalidations par étiquette
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key() -> str:
+        """Route et paramètres de requête, triés."""
+        args = sorted(request.args.items(multi=True))
+        query = "&".join(f"{name}={value}" for name, value in args)
+        return f"{request.endpoint}:{request.path}?{query}"
+
+    def _drop(self, key: str):
+        """Retire une entrée et ses étiquettes (appelé sous verrou)."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key: str, version=None) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                entry.expires <= time.monotonic() or entry.version != version
+            ):
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedResponse, generation: tuple = None) -> bool:
+        """Stocke l'entrée, sauf si ses étiquettes ont été invalidées depuis
+        `generation` (relevé avant de calculer la réponse)."""
+        with self._lock:
+            if generation is not None and generation != self.generation(*entry.tags):
+                return False
+            self._drop(key)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, *tags: str) -> int:
+        """Supprime les entrées portant l'une des étiquettes ; retourne leur nombre."""
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+                keys |= self._tags.get(tag, set())
+            for key in keys:
+                self._drop(key)
+            self.invalidations += len(keys)
+        if keys:
+            logger.debug(f"Cache des routes: {len(keys)} entrées invalidées {tags}")
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "bytes": sum(len(entry.body) for entry in self._entries.values()),
+                "compressed_bytes": sum(
+                    len(body)
+                    for entry in self._entries.values()
+                    for body in entry.encoded.values()
+                ),
+                "tags": {tag: len(keys) for tag, keys in self._tags.items()},
+            }
+
+    def cached(
+        self,
+        ttl: float = None,
+        tags: Iterable[str] = (),
+        version: Callable[[], object] = None,
+    ):
+        """Décorateur : sert la route depuis le cache tant que l'entrée est valide.
+
+        Seules les réponses 200 sont conservées.
+        """
+        ttl = ttl or self.default_ttl
+        tags = tuple(tags)
+
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                key = self.make_key()
+                current = version() if version else None
+                encoding = negotiate_encoding()
+                entry = self.get(key, current)
+                if entry is not None:
+                    return entry.to_response(encoding)
+
+                # Une invalidation pendant la route rend la réponse périmée
+                generation = self.generation(*tags)
+                response = f(*args, **kwargs)
+                if isinstance(response, Response) and response.status_code == 200:
+                    entry = CachedResponse(
+                        response, time.monotonic() + ttl, tags, current
+                    )
+                    self.put(key, entry, generation)
+                    return entry.to_response(encoding)
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def generation(self, *tags: str) -> tuple:
+        """Nombre d'invalidations de chaque étiquette (compteur de modifications)."""
+        return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def etag(self, key: str, tags: Iterable[str], version=None) -> str:
+        """ETag dérivé des compteurs de modification, sans lire le corps."""
+        generations = ".".join(str(n) for n in self.generation(*tags))
+        return f"{BOOT_ID}-{zlib.crc32(key.encode('utf-8')):x}-{generations}-{version}"
+
+    def conditional(
+        self,
+        tags: Iterable[str] = (),
+        version: Callable[[], object] = None,
+        max_age: int = None,
+    ):
+        """Décorateur : GET conditionnel (ETag faible, If-None-Match -> 304).
+
+        L'ETag combine les générations des étiquettes, la version de la
+        collection et, pour les données modifiables hors de l'application,
+        une tranche de `max_age` secondes. Il est calculé avant la route :
+        un 304 est renvoyé sans rien exécuter ni sérialiser.
+        """
+        tags = tuple(tags)
+
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                current = version() if version else None
+                if max_age:
+                    current = f"{current}.{int(time.time() // max_age)}"
+                etag = self.etag(self.make_key(), tags, current)
+                if request.if_none_match.contains_weak(etag):
+                    response = Response(status=304)
+                else:
+                    response = f(*args, **kwargs)
+                    if (
+                        not isinstance(response, Response)
+                        or response.status_code != 200
+                    ):
+                        return response
+                response.set_etag(etag, weak=True)
+                # Le navigateur doit revalider à chaque fois
+                response.headers["Cache-Control"] = "no-cache"
+                return response
+
+            return wrapper
+
+        return decorator
+
+    def invalidates(self, *tags: str):
+        """Décorateur : invalide les étiquettes après une route qui modifie les données."""
+
+        def decorator(f):
+            @wraps(f)
+            def wrapper(*args, **kwargs):
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    self.invalidate(*tags)
+
+            return wrapper
+
+        return decorator
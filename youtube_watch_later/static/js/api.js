@@ -3,6 +3,8 @@ class ApiService {
     this.baseUrl = "";
     this.retryCount = 3;
     this.retryDelay = 1000;
+    // Validateurs des GET : endpoint -> { etag, body }
+    this.validators = new Map();
   }
 
   handleQuotaError() {
@@ -39,17 +41,30 @@ class ApiService {
 
   async request(endpoint, options = {}) {
     let attempts = 0;
+    const isGet = !options.method || options.method.toUpperCase() === "GET";
 
     while (attempts < this.retryCount) {
       try {
+        // GET conditionnel : le serveur répond 304 sans corps si la
+        // ressource n'a pas changé depuis la dernière réponse conservée
+        const validator = isGet ? this.validators.get(endpoint) : null;
         const response = await fetch(`${this.baseUrl}${endpoint}`, {
           ...options,
+          // Le cache HTTP du navigateur est court-circuité : les
+          // validateurs sont gérés ici
+          ...(isGet ? { cache: "no-store" } : {}),
           headers: {
             "Content-Type": "application/json",
+            ...(validator ? { "If-None-Match": validator.etag } : {}),
             ...options.headers,
           },
         });
 
+        if (response.status === 304 && validator) {
+          // Nouvel objet à chaque appel : l'appelant peut le modifier
+          return JSON.parse(validator.body);
+        }
+
         if (!response.ok) {
           const error = await response.json();
           if (error.error?.toLowerCase().includes("quota")) {
@@ -59,11 +74,18 @@ class ApiService {
           throw new Error(error.error || "Erreur réseau");
         }
 
-        const data = await response.json();
+        const body = await response.text();
+        const data = JSON.parse(body);
         if (data.error?.toLowerCase().includes("quota")) {
           this.handleQuotaError();
           throw new Error("Quota dépassé");
         }
+        const etag = response.headers.get("ETag");
+        if (isGet && etag) {
+          this.validators.set(endpoint, { etag, body });
+        } else if (isGet) {
+          this.validators.delete(endpoint);
+        }
         return data;
       } catch (error) {
         attempts++;
@@ -101,12 +123,26 @@ class ApiService {
     });
   }
 
-  async getSubscriptions() {
-    return await this.request("/get_subscriptions");
+  // Paramètres optionnels des listes : limit, cursor, sort, order, fields
+  withQuery(endpoint, params = {}) {
+    const query = new URLSearchParams(params).toString();
+    return query ? `${endpoint}?${query}` : endpoint;
+  }
+
+  async getSubscriptions(params = {}) {
+    return await this.request(this.withQuery("/get_subscriptions", params));
+  }
+
+  async getWatchLaterVideos(params = {}) {
+    return await this.request(this.withQuery("/get_watch_later_videos", params));
+  }
+
+  async getTrackedVideos(params = {}) {
+    return await this.request(this.withQuery("/get_tracked_videos", params));
   }
 
-  async getWatchLaterVideos() {
-    return await this.request("/get_watch_later_videos");
+  async getSelectedChannels() {
+    return await this.request("/get_selected_channels");
   }
 
   async addToWatchLater(videoId, title) {
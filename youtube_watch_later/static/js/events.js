@@ -0,0 +1,84 @@
+// Flux d'évènements poussés par le serveur (Server-Sent Events).
+// À la connexion, le serveur envoie l'état complet ("state"), puis
+// seulement les clés modifiées de "quota", "stats" et "monitoring",
+// ainsi que les ajouts et retraits de vidéos.
+class UpdateStream {
+  constructor(url = "/subscribe_to_updates") {
+    this.url = url;
+    this.source = null;
+    this.state = {};
+    this.handlers = new Map();
+    this.reconnectDelay = 5000;
+    this.reconnectTimer = null;
+  }
+
+  // handler(état complet, changements) pour quota/stats/monitoring,
+  // handler(données) pour video_added/video_removed
+  on(event, handler) {
+    if (!this.handlers.has(event)) {
+      this.handlers.set(event, []);
+    }
+    this.handlers.get(event).push(handler);
+    return this;
+  }
+
+  emit(event, ...args) {
+    (this.handlers.get(event) || []).forEach((handler) => {
+      try {
+        handler(...args);
+      } catch (error) {
+        console.error(`Erreur dans le gestionnaire ${event}:`, error);
+      }
+    });
+  }
+
+  connect() {
+    if (this.source || !window.EventSource) return;
+
+    this.source = new EventSource(this.url);
+
+    this.source.addEventListener("state", (event) => {
+      const state = JSON.parse(event.data);
+      this.state = state;
+      Object.entries(state).forEach(([name, values]) =>
+        this.emit(name, values, values)
+      );
+      this.emit("state", state);
+    });
+
+    ["quota", "stats", "monitoring"].forEach((name) => {
+      this.source.addEventListener(name, (event) => {
+        const changes = JSON.parse(event.data);
+        this.state[name] = { ...this.state[name], ...changes };
+        this.emit(name, this.state[name], changes);
+      });
+    });
+
+    ["video_added", "video_removed"].forEach((name) => {
+      this.source.addEventListener(name, (event) => {
+        this.emit(name, JSON.parse(event.data));
+      });
+    });
+
+    this.source.onerror = () => {
+      // EventSource se reconnecte seul, sauf si le serveur a refusé le flux
+      if (this.source && this.source.readyState === EventSource.CLOSED) {
+        this.disconnect();
+        this.reconnectTimer = setTimeout(
+          () => this.connect(),
+          this.reconnectDelay
+        );
+      }
+    };
+  }
+
+  disconnect() {
+    clearTimeout(this.reconnectTimer);
+    if (this.source) {
+      this.source.close();
+      this.source = null;
+    }
+  }
+}
+
+window.updateStream = new UpdateStream();
@@ -48,19 +48,6 @@ async function updateQuotaDisplay() {
   }
 }
 
-function startQuotaUpdates() {
-  if (quotaUpdateTimer) clearInterval(quotaUpdateTimer);
-  quotaUpdateTimer = setInterval(updateQuotaDisplay, 5000); // Mise à jour toutes les 5 secondes
-  updateQuotaDisplay(); // Mise à jour immédiate
-}
-
-function stopQuotaUpdates() {
-  if (quotaUpdateTimer) {
-    clearInterval(quotaUpdateTimer);
-    quotaUpdateTimer = null;
-  }
-}
-
 function updateCheckInterval() {
   const select = document.getElementById("videoDateLimit");
   currentDateLimit = select.value;
@@ -178,8 +165,7 @@ async function initializeApp() {
       updateQuotaDisplay(), // Ajout ici
     ]);
 
-    // Mettre en place la mise à jour périodique du quota
-    setInterval(updateQuotaDisplay, 60000); // Mise à jour toutes les minutes
+    // Les mises à jour suivantes du quota sont poussées par le serveur
 
     // Mettre à jour les statistiques
     updateStatistics();
@@ -211,9 +197,8 @@ function setupEventListeners() {
   sortSelect?.addEventListener("change", filterAndSortChannels);
   filterSelect?.addEventListener("change", filterAndSortChannels);
 
-  // Vérifications périodiques
-  setInterval(checkQuotaStatus, 300000); // 5 minutes
-  setInterval(updateStatistics, 60000); // 1 minute
+  // Quota, statistiques et surveillance poussés par le serveur
+  setupLiveUpdates();
 
   // Raccourcis clavier
   document.addEventListener("keydown", handleKeyboardShortcuts);
@@ -241,12 +226,8 @@ async function fetchChannelsWithRetry(maxRetries = 3, delay = 1000) {
 
   for (let i = 0; i < maxRetries; i++) {
     try {
-      const response = await fetch("/get_subscriptions");
-      if (!response.ok) {
-        throw new Error(`Erreur HTTP: ${response.status}`);
-      }
-
-      const data = await response.json();
+      // Requête conditionnelle : 304 si les abonnements n'ont pas changé
+      const data = await apiService.getSubscriptions();
       if (!data.success) {
         throw new Error(
           data.error || "Erreur lors de la récupération des abonnements"
@@ -276,12 +257,7 @@ async function loadSubscriptionsWithRetry() {
 
   try {
     // Première requête pour obtenir les abonnements
-    const response = await fetch("/get_subscriptions");
-    if (!response.ok) {
-      throw new Error(`Erreur HTTP: ${response.status}`);
-    }
-
-    const data = await response.json();
+    const data = await apiService.getSubscriptions();
     if (!data.success) {
       throw new Error(
         data.error || "Erreur lors de la récupération des abonnements"
@@ -289,8 +265,9 @@ async function loadSubscriptionsWithRetry() {
     }
 
     // Deuxième requête pour obtenir les chaînes sélectionnées
-    const selectedResponse = await fetch("/get_selected_channels");
-    const selectedData = await selectedResponse.json();
+    const selectedData = await apiService
+      .getSelectedChannels()
+      .catch(() => ({ success: false }));
 
     if (selectedData.success) {
       // Créer un Set des IDs des chaînes sélectionnées
@@ -1281,32 +1258,24 @@ async function updateChannelVideos() {
 document.addEventListener("DOMContentLoaded", initializeDatePicker);
 // Dans main.js
 
-let quotaUpdateTimer = null;
-
-async function updateQuotaDisplay() {
-  if (document.hidden) return; // Ne pas mettre à jour si la page est cachée
-
-  try {
-    const response = await apiService.getQuotaStatus();
-    if (!response.success) return;
-
-    const quotaElement = document.getElementById("apiQuota");
-    if (!quotaElement) return;
+function renderQuota(quota) {
+  const quotaElement = document.getElementById("apiQuota");
+  if (!quotaElement) return;
 
-    if (response.quota.loading) {
-      quotaElement.innerHTML = `
+  if (quota.loading) {
+    quotaElement.innerHTML = `
                 <div class="loading">
                     <i class="fas fa-spinner fa-spin"></i>
                     Chargement...
                 </div>
             `;
-      return;
-    }
+    return;
+  }
 
-    const { used, limit, percentage_used, time_until_reset } = response.quota;
-    const remaining = limit - used;
+  const { used, limit, percentage_used, time_until_reset } = quota;
+  const remaining = limit - used;
 
-    quotaElement.innerHTML = `
+  quotaElement.innerHTML = `
             <div class="text-2xl font-bold ${
               percentage_used > 90 ? "text-red-600" : "text-blue-600"
             }">
@@ -1316,22 +1285,53 @@ async function updateQuotaDisplay() {
                 ${time_until_reset}
             </div>
         `;
+}
+
+async function updateQuotaDisplay() {
+  if (document.hidden) return; // Ne pas mettre à jour si la page est cachée
+
+  try {
+    const response = await apiService.getQuotaStatus();
+    if (!response.success) return;
+
+    renderQuota(response.quota);
   } catch (error) {
     console.error("Erreur lors de la mise à jour du quota:", error);
   }
 }
 
+// Le flux d'évènements remplace les requêtes périodiques : fermé quand la
+// page est cachée, il renvoie l'état complet à la reconnexion
 function startQuotaUpdates() {
-  if (quotaUpdateTimer) clearInterval(quotaUpdateTimer);
-  quotaUpdateTimer = setInterval(updateQuotaDisplay, 5000); // Mise à jour toutes les 5 secondes
-  updateQuotaDisplay(); // Mise à jour immédiate
+  updateStream.connect();
 }
 
 function stopQuotaUpdates() {
-  if (quotaUpdateTimer) {
-    clearInterval(quotaUpdateTimer);
-    quotaUpdateTimer = null;
-  }
+  updateStream.disconnect();
+}
+
+// Dernière version connue des vidéos suivies
+let lastTrackedVersion = null;
+const reloadWatchLaterVideos = debounce(() => loadWatchLaterVideos(), 1000);
+
+function setupLiveUpdates() {
+  updateStream
+    .on("quota", (quota) => renderQuota(quota))
+    .on("stats", (stats) => {
+      renderStatistics(stats);
+      // Vidéos ajoutées ou retirées (y compris pendant une déconnexion)
+      if (
+        lastTrackedVersion !== null &&
+        stats.tracked_version !== lastTrackedVersion
+      ) {
+        reloadWatchLaterVideos();
+      }
+      lastTrackedVersion = stats.tracked_version;
+    })
+    .on("monitoring", (monitoring) => {
+      isMonitoring = monitoring.is_monitoring;
+      updateMonitoringUI();
+    });
 }
 
 // Gestionnaire de visibilité de la page
@@ -1653,8 +1653,14 @@ async function updateStatistics() {
       );
     }
 
-    const stats = response.statistics;
+    renderStatistics(response.statistics);
+  } catch (error) {
+    console.error("Erreur lors de la mise à jour des statistiques:", error);
+  }
+}
 
+function renderStatistics(stats) {
+  try {
     // Mise à jour des compteurs
     const elements = {
       totalVideos: document.getElementById("totalVideos"),
@@ -1683,12 +1689,17 @@ async function updateStatistics() {
   }
 }
 
-// Mettre en place une mise à jour périodique
-setInterval(updateStatistics, 60000); // Mise à jour toutes les minutes
-
 // Appeler immédiatement pour la première mise à jour
 updateStatistics();
 
+// Pages de la playlist, triées par le serveur et réduites aux champs affichés
+const WATCH_LATER_PAGE = {
+  limit: 50,
+  sort: "added_at",
+  fields: "id,title,thumbnail,duration,channelTitle,viewCount,likeCount",
+};
+let watchLaterCursor = null;
+
 async function loadWatchLaterVideos() {
   const loader = document.getElementById("watchLaterLoader");
   const container = document.getElementById("watchLaterVideos");
@@ -1697,13 +1708,14 @@ async function loadWatchLaterVideos() {
     showElement(loader);
     hideElement(container);
 
-    const response = await apiService.getWatchLaterVideos();
+    const response = await apiService.getWatchLaterVideos(WATCH_LATER_PAGE);
 
     if (!response.success) {
       throw new Error(response.error || "Erreur lors du chargement des vidéos");
     }
 
     displayWatchLaterVideos(response.videos);
+    updateWatchLaterMore(response.next_cursor, response.total_count);
     showToast("Vidéos mises à jour", "success");
   } catch (error) {
     console.error("Erreur:", error);
@@ -1783,8 +1795,55 @@ function formatDate(dateString) {
   }
 }
 
-function displayWatchLaterVideos(videos) {
+async function loadMoreWatchLaterVideos() {
+  if (!watchLaterCursor) return;
+
+  try {
+    const response = await apiService.getWatchLaterVideos({
+      ...WATCH_LATER_PAGE,
+      cursor: watchLaterCursor,
+    });
+
+    if (!response.success) {
+      throw new Error(response.error || "Erreur lors du chargement des vidéos");
+    }
+
+    displayWatchLaterVideos(response.videos, true);
+    updateWatchLaterMore(response.next_cursor, response.total_count);
+  } catch (error) {
+    console.error("Erreur:", error);
+    showToast(error.message, "error");
+  }
+}
+
+// Bouton "Voir plus" sous la grille, masqué à la dernière page
+function updateWatchLaterMore(cursor, totalCount) {
+  watchLaterCursor = cursor;
   const container = document.getElementById("watchLaterVideos");
+  let button = document.getElementById("watchLaterMore");
+  if (!button) {
+    button = document.createElement("button");
+    button.id = "watchLaterMore";
+    button.className =
+      "block mx-auto mt-6 px-6 py-2 bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-white rounded-lg hover:bg-gray-300 dark:hover:bg-gray-600 transition-colors";
+    button.addEventListener("click", loadMoreWatchLaterVideos);
+    container.after(button);
+  }
+  const shown = container.querySelectorAll(".video-card").length;
+  button.textContent = `Voir plus (${shown} / ${totalCount})`;
+  button.classList.toggle("hidden", !cursor);
+}
+
+function displayWatchLaterVideos(videos, append = false) {
+  const container = document.getElementById("watchLaterVideos");
+
+  if (append) {
+    container.insertAdjacentHTML(
+      "beforeend",
+      (videos || []).map(watchLaterCard).join("")
+    );
+    return;
+  }
 
   if (!videos || videos.length === 0) {
     container.innerHTML = `
@@ -1796,9 +1855,11 @@ function displayWatchLaterVideos(videos) {
     return;
   }
 
-  container.innerHTML = videos
-    .map(
-      (video) => `
+  container.innerHTML = videos.map(watchLaterCard).join("");
+}
+
+function watchLaterCard(video) {
+  return `
         <div class="video-card bg-white dark:bg-gray-800 rounded-lg shadow-md overflow-hidden">
             <div class="relative">
                 <img src="${video.thumbnail}" 
@@ -1844,9 +1905,7 @@ function displayWatchLaterVideos(videos) {
                 </div>
             </div>
         </div>
-    `
-    )
-    .join("");
+    `;
 }
 
 async function removeFromWatchLater(videoId) {
@@ -273,42 +273,32 @@ class StatisticsManager {
     }
   }
 
-  async updateWatchTime() {
-    try {
-      const response = await fetch("/get_watch_time");
-      const data = await response.json();
-
-      if (data.success) {
-        // Mise à jour de l'affichage avec deux décimales
-        const watchTime = parseFloat(data.watch_time).toFixed(2);
-        const element = document.getElementById("totalWatchTime");
-        if (element) {
-          element.textContent = `${watchTime}min`;
-
-          // Animation si la valeur a changé
-          if (this.stats.totalWatchTime !== parseFloat(watchTime)) {
-            element.classList.add("update-animation");
-            setTimeout(() => {
-              element.classList.remove("update-animation");
-            }, 500);
-          }
-
-          this.stats.totalWatchTime = parseFloat(watchTime);
-        }
+  updateWatchTime(minutes) {
+    // Mise à jour de l'affichage avec deux décimales
+    const watchTime = parseFloat(minutes).toFixed(2);
+    const element = document.getElementById("totalWatchTime");
+    if (element) {
+      element.textContent = `${watchTime}min`;
+
+      // Animation si la valeur a changé
+      if (this.stats.totalWatchTime !== parseFloat(watchTime)) {
+        element.classList.add("update-animation");
+        setTimeout(() => {
+          element.classList.remove("update-animation");
+        }, 500);
       }
-    } catch (error) {
-      console.error("Erreur lors de la mise à jour du temps:", error);
+
+      this.stats.totalWatchTime = parseFloat(watchTime);
     }
   }
 
   setupAutomaticUpdates() {
-    // Mise à jour toutes les 5 secondes
-    setInterval(() => {
-      this.updateWatchTime();
-    }, 5000);
-
-    // Mise à jour immédiate
-    this.updateWatchTime();
+    // Temps de visionnage poussé par le serveur à chaque changement
+    window.updateStream?.on("stats", (stats, changes) => {
+      if (changes.total_watch_time !== undefined) {
+        this.updateWatchTime(stats.total_watch_time);
+      }
+    });
   }
 
   parseDuration(duration) {
@@ -1,23 +1,107 @@
 import json
 from datetime import datetime, timedelta
 import os
-from typing import Dict, List, Optional
+import threading
+from functools import wraps
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
 import logging
-from isodate import parse_duration
 from builtins import open
+from config import Config
+from durations import parse_iso_duration, seconds_to_minutes
+from migrations import import_json_stats, migrate_durations_to_seconds
+from rollup_index import UNKNOWN_CHANNEL, RollupIndex
+from stats_aggregates import RunningAggregates, entry_seconds
+from stats_storage import EventLogStatsStorage, SqliteStatsStorage
+from video_history import VideoHistory
+from video_table import TrackedVideoTable, json_default
+
+# Stockages alternatifs au fichier JSON, choisis par Config.STATS_BACKEND
+STATS_STORAGES = {"sqlite": SqliteStatsStorage, "eventlog": EventLogStatsStorage}
+
+# Valeurs scalaires reprises dans l'instantané publié aux lecteurs
+SNAPSHOT_KEYS = (
+    "total_videos",
+    "total_watch_time",
+    "selected_channels",
+    "total_channels",
+    "last_check",
+)
+
+
+def _writer(func):
+    """Exécute une mutation sous le verrou d'écriture puis publie un instantané."""
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._publish()
+
+    return wrapper
 
 
 class StatisticsManager:
     def __init__(self, statistics_file: str):
         self.statistics_file = statistics_file
         self.logger = logging.getLogger(__name__)
+        # Persistance différée : save() marque l'état modifié, flush() écrit
+        self._flush_lock = threading.Lock()
+        self._timer_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        self._dirty_count = 0
+        # Un seul écrivain à la fois ; les lecteurs utilisent l'instantané publié
+        self._write_lock = threading.RLock()
+        self._snapshot: Mapping = MappingProxyType({})
+        self.version = 0  # Incrémenté quand l'instantané publié change
+        self._tracked_view = (None, MappingProxyType({}))
+        self._view_lock = threading.Lock()
+        # Abonnés aux ajouts et retraits de vidéos : callback(évènement, données)
+        self._listeners: List[Callable[[str, Dict], None]] = []
+        # Stockage optionnel : SQLite ou journal d'évènements
+        storage_class = STATS_STORAGES.get(Config.STATS_BACKEND)
+        self.storage = storage_class() if storage_class else None
         self._init_stats()
+        # Durées en secondes entières : conversion unique des anciennes données
+        if migrate_durations_to_seconds(self.stats):
+            self.logger.info("Durées des statistiques converties en secondes")
+            self.save()
+        # Représentation compacte en colonnes, vue comme un dictionnaire
+        self.stats["tracked_videos"] = TrackedVideoTable(
+            self.stats.get("tracked_videos", {})
+        )
+        self.aggregates = RunningAggregates(self.stats["tracked_videos"])
+        # Historique borné ; en JSON il est persisté dans son propre fichier
+        self.stats["video_history"] = VideoHistory(
+            history_file=None if self.storage else Config.VIDEO_HISTORY_FILE,
+            entries=self.stats.get("video_history") or [],
+        )
+        # Index des agrégats par chaîne et par période
+        rollups = self.stats.get("rollups")
+        self.rollups = RollupIndex(rollups or None)
+        self.stats["rollups"] = self.rollups
+        if not rollups:
+            self.rollups.seed(self.stats["tracked_videos"], self.stats)
+            self.logger.info("Index des agrégats construit")
+        if self.rollups.age() or not rollups:
+            self.save()
+        self._publish()
         self.automation = None
 
     def _init_stats(self):
         """Initialise ou charge les statistiques."""
         try:
-            if os.path.exists(self.statistics_file):
+            if self.storage:
+                if self.storage.is_empty():
+                    import_json_stats(self.storage, self.statistics_file)
+                stats = self.storage.load()
+                if stats is not None:
+                    self.stats = stats
+                    return
+
+            if self.storage is None and os.path.exists(self.statistics_file):
                 with open(self.statistics_file, "r", encoding="utf-8") as f:
                     self.stats = json.load(f)
             else:
@@ -44,12 +128,12 @@ class StatisticsManager:
             )
             self._init_empty_stats()
 
+    @_writer
     def process_video(self, video_data):
         """Traite les données d'une vidéo pour les statistiques."""
         try:
             # Convertir la durée en minutes
-            duration = parse_duration(video_data.get("duration", "PT0S"))
-            minutes = duration.total_seconds() / 60
+            minutes = parse_iso_duration(video_data.get("duration", "PT0S")) / 60
 
             # Réinitialisation du temps total pour ne pas accumuler
             self.stats["total_watch_time"] = minutes
@@ -83,46 +167,212 @@ class StatisticsManager:
         }
 
     def save(self):
-        """Sauvegarde les statistiques dans le fichier."""
-        try:
-            # Créer le dossier parent si nécessaire
-            os.makedirs(os.path.dirname(self.statistics_file), exist_ok=True)
+        """Planifie la sauvegarde des statistiques.
+
+        Les modifications sont regroupées : l'écriture a lieu après
+        STATS_FLUSH_DELAY secondes, ou immédiatement dès que
+        STATS_FLUSH_THRESHOLD modifications sont en attente. Avec un stockage
+        alternatif, l'écriture est immédiate et ne concerne que les agrégats.
+        """
+        if self.storage:
+            with self._write_lock:
+                self.storage.save_state(self.stats)
+            return
+
+        with self._timer_lock:
+            self._dirty_count += 1
+            if self._dirty_count < Config.STATS_FLUSH_THRESHOLD:
+                self._schedule_flush()
+                return
+        self.flush()
+
+    def _schedule_flush(self):
+        """Arme le minuteur d'écriture s'il ne l'est pas (appelé sous verrou)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(Config.STATS_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Écrit les statistiques en attente (fichier temporaire, fsync, renommage)."""
+        if self.storage:
+            with self._write_lock:
+                self.storage.checkpoint(self.stats)
+            return
+
+        with self._timer_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            pending = self._dirty_count
+            self._dirty_count = 0
+        if not pending:
+            return
 
-            # Sauvegarder les statistiques
-            with open(self.statistics_file, "w", encoding="utf-8") as f:
-                json.dump(self.stats, f, indent=2)
+        try:
+            # Sérialisation sous le verrou d'écriture ; le verrou du fichier est
+            # pris avant de le relâcher (toujours dans cet ordre) pour que les
+            # écritures suivent l'ordre des sérialisations.
+            # L'historique a son propre fichier, ajouté entrée par entrée.
+            with self._write_lock:
+                data = json.dumps(
+                    {k: v for k, v in self.stats.items() if k != "video_history"},
+                    separators=(",", ":"),
+                    default=json_default,
+                )
+                self._flush_lock.acquire()
+            try:
+                # Créer le dossier parent si nécessaire
+                os.makedirs(os.path.dirname(self.statistics_file), exist_ok=True)
+                tmp_file = f"{self.statistics_file}.tmp"
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.statistics_file)
+            finally:
+                self._flush_lock.release()
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de la sauvegarde des statistiques: {str(e)}"
             )
+            # Conserver les modifications pour une prochaine tentative
+            with self._timer_lock:
+                self._dirty_count += pending
+                self._schedule_flush()
+
+    def _check_aggregates(self):
+        """Mode vérification : compare les agrégats à un recalcul complet."""
+        if Config.STATS_VERIFY_AGGREGATES:
+            self.aggregates.verify(self.stats.get("tracked_videos", {}))
+
+    def _publish(self):
+        """Publie un instantané immuable de l'état courant (sous verrou d'écriture).
+
+        Seules les valeurs lues par les routes fréquentes y figurent : les
+        scalaires, le quota et les compteurs du jour et du mois en cours.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        month = datetime.now().strftime("%Y-%m")
+        daily = self.stats.get("daily_stats", {}).get(today)
+        monthly = self.stats.get("videos_by_month", {}).get(month)
+        snapshot = {key: self.stats[key] for key in SNAPSHOT_KEYS if key in self.stats}
+        snapshot.update(
+            {
+                "quota_usage": MappingProxyType(
+                    dict(self.stats.get("quota_usage", {}))
+                ),
+                "daily_stats": MappingProxyType(
+                    {today: MappingProxyType(dict(daily))} if daily else {}
+                ),
+                "videos_by_month": MappingProxyType(
+                    {month: MappingProxyType(dict(monthly))} if monthly else {}
+                ),
+                "video_count": self.aggregates.count,
+                "total_seconds": self.aggregates.total_seconds,
+                "tracked_version": self.stats["tracked_videos"].version,
+            }
+        )
+        if snapshot != self._snapshot:
+            self.version += 1
+            self._snapshot = MappingProxyType(snapshot)
+
+    @property
+    def tracked_version(self) -> int:
+        """Compteur de modifications des vidéos suivies."""
+        return self.stats["tracked_videos"].version
+
+    def get_snapshot(self) -> Mapping:
+        """Dernier instantané publié (lecture sans verrou)."""
+        return self._snapshot
+
+    def get_tracked_videos(self) -> Mapping[str, Dict]:
+        """Vue en lecture seule des vidéos suivies.
+
+        Une copie de la table est prise sous le verrou d'écriture, une fois
+        par version ; les lectures suivantes ne prennent aucun verrou.
+        """
+        table = self.stats["tracked_videos"]
+        version, view = self._tracked_view
+        if version != table.version:
+            # Un seul lecteur reconstruit la vue, les autres la réutilisent
+            with self._view_lock:
+                version, view = self._tracked_view
+                if version != table.version:
+                    with self._write_lock:
+                        copy = table.copy()
+                    # Entrées reconstruites hors du verrou d'écriture
+                    view = MappingProxyType(copy.to_dict())
+                    self._tracked_view = (copy.version, view)
+        return view
+
+    def get_totals(self) -> Tuple[int, float]:
+        """Nombre de vidéos suivies et temps total (minutes), en temps constant.
+
+        Les écarts avec le tracker sont corrigés par sync_with_tracker().
+        """
+        snapshot = self._snapshot
+        count = snapshot.get("video_count", self.aggregates.count)
+        total = round(
+            snapshot.get("total_seconds", self.aggregates.total_seconds) / 60, 2
+        )
+        return count, total
+
+    @staticmethod
+    def _add_watch_seconds(bucket: Dict, seconds: int):
+        """Ajoute une durée exacte à un agrégat ; watch_time (minutes) en découle."""
+        bucket["watch_seconds"] = bucket.get("watch_seconds", 0) + seconds
+        bucket["watch_time"] = seconds_to_minutes(bucket["watch_seconds"])
+
+    def add_listener(self, callback: Callable[[str, Dict], None]):
+        """Abonne `callback(évènement, données)` aux ajouts et retraits de vidéos."""
+        self._listeners.append(callback)
+
+    def _notify(self, event: str, data: Dict):
+        for callback in self._listeners:
+            try:
+                callback(event, data)
+            except Exception as e:
+                self.logger.error(f"Erreur lors de la notification {event}: {str(e)}")
 
     def set_automation(self, automation):
         """Défini l'instance de l'automatisation."""
         self.automation = automation
 
+    @_writer
     def remove_video_from_stats(self, video_id: str):
         """Retire une vidéo des statistiques."""
         try:
             if video_id in self.stats["tracked_videos"]:
-                removed_duration = self.stats["tracked_videos"][video_id]["duration"]
+                removed = self.stats["tracked_videos"][video_id]
+                removed_duration = removed["duration"]
                 del self.stats["tracked_videos"][video_id]
 
-                # Recalculer le temps total
-                total_time = sum(
-                    v["duration"] for v in self.stats["tracked_videos"].values()
+                # Mettre à jour le temps total
+                self.aggregates.remove(removed)
+                self.stats["total_watch_time"] = round(
+                    self.aggregates.total_duration, 2
                 )
-                self.stats["total_watch_time"] = round(total_time, 2)
+                self._check_aggregates()
 
-                self.save()
+                if self.storage:
+                    self.storage.video_removed(self.stats, video_id)
+                else:
+                    self.save()
                 self.logger.info(
                     f"Vidéo retirée du suivi: {video_id} (-{removed_duration:.2f} minutes)"
                 )
+                self._notify(
+                    "video_removed",
+                    {"id": video_id, "seconds": removed.get("seconds", 0)},
+                )
                 return removed_duration
             return 0
         except Exception as e:
             self.logger.error(f"Erreur lors du retrait de la vidéo des stats: {str(e)}")
             return 0
 
+    @_writer
     def sync_tracked_videos(self, current_video_ids: List[str]):
         """Synchronise la liste des vidéos suivies avec la playlist actuelle."""
         try:
@@ -149,6 +399,7 @@ class StatisticsManager:
             self.logger.error(f"Erreur lors de la synchronisation des vidéos: {str(e)}")
             return 0
 
+    @_writer
     def add_video_to_stats(self, video: Dict):
         """Ajoute une vidéo aux statistiques."""
         try:
@@ -159,8 +410,8 @@ class StatisticsManager:
             # Mettre à jour le compteur total
             self.stats["total_videos"] = self.stats.get("total_videos", 0) + 1
 
-            # Calculer la durée
-            minutes = 0
+            # Calculer la durée, en secondes entières
+            seconds = 0
             duration = None
             try:
                 if "contentDetails" in video and "duration" in video["contentDetails"]:
@@ -168,44 +419,54 @@ class StatisticsManager:
                 elif "duration" in video:
                     duration = video["duration"]
 
-                if duration:
-                    duration_obj = parse_duration(duration)
-                    minutes = duration_obj.total_seconds() / 60
-                    self.logger.info(f"Durée analysée: {duration} -> {minutes} minutes")
+                if "duration_seconds" in video:
+                    # Métadonnées issues du VideoMetadataStore : durée déjà analysée
+                    seconds = int(video["duration_seconds"])
+                elif duration:
+                    seconds = parse_iso_duration(duration)
 
             except Exception as e:
                 self.logger.error(f"Erreur lors du calcul de la durée: {str(e)}")
-                minutes = 0
+                seconds = 0
+            minutes = seconds / 60
 
             # Enregistrer la vidéo dans le suivi
-            self.stats["tracked_videos"] = self.stats.get("tracked_videos", {})
+            previous = self.stats["tracked_videos"].get(video_id)
+            if previous:
+                self.aggregates.remove(previous)
             self.stats["tracked_videos"][video_id] = {
-                "duration": round(minutes, 2),
+                "seconds": seconds,
                 "added_at": datetime.now().isoformat(),
                 "title": video.get("title", "Sans titre"),
+                "channel_id": video.get("channel_id")
+                or video.get("channelId")
+                or video.get("snippet", {}).get("channelId"),
             }
-
-            # S'assurer que total_watch_time existe
-            if "total_watch_time" not in self.stats:
-                self.stats["total_watch_time"] = 0
-
-            # Mettre à jour le temps total
-            current_total = self.stats["total_watch_time"]
-            self.stats["total_watch_time"] = current_total + minutes
+            self.aggregates.add(self.stats["tracked_videos"][video_id])
 
             # Mettre à jour les statistiques mensuelles
             month_key = datetime.now().strftime("%Y-%m")
             if month_key not in self.stats["videos_by_month"]:
                 self.stats["videos_by_month"][month_key] = {"count": 0, "watch_time": 0}
             self.stats["videos_by_month"][month_key]["count"] += 1
-            self.stats["videos_by_month"][month_key]["watch_time"] += minutes
+            self._add_watch_seconds(self.stats["videos_by_month"][month_key], seconds)
 
             # Mettre à jour les statistiques quotidiennes
             today = datetime.now().strftime("%Y-%m-%d")
             if today not in self.stats["daily_stats"]:
                 self.stats["daily_stats"][today] = {"videos_added": 0, "watch_time": 0}
             self.stats["daily_stats"][today]["videos_added"] += 1
-            self.stats["daily_stats"][today]["watch_time"] += minutes
+            self._add_watch_seconds(self.stats["daily_stats"][today], seconds)
+
+            # Agrégats par chaîne et par période
+            self.rollups.age_daily(datetime.now())
+            self.rollups.add(
+                datetime.now(),
+                self.stats["tracked_videos"][video_id]["channel_id"],
+                seconds,
+                title=video.get("channelTitle")
+                or video.get("snippet", {}).get("channelTitle"),
+            )
 
             # Ajouter à l'historique
             video_info = {
@@ -216,33 +477,40 @@ class StatisticsManager:
                 "added_at": datetime.now().isoformat(),
             }
 
-            # S'assurer que video_history existe
-            if "video_history" not in self.stats:
-                self.stats["video_history"] = []
-
-            self.stats["video_history"].insert(0, video_info)
-            self.stats["video_history"] = self.stats["video_history"][:100]
+            video_info = self.stats["video_history"].append(video_info)
 
             # Mettre à jour la dernière vérification
             self.stats["last_check"] = datetime.now().isoformat()
 
-            # Recalculer le temps total à partir des vidéos suivies
-            tracked_total = sum(
-                v["duration"] for v in self.stats["tracked_videos"].values()
-            )
-            self.stats["total_watch_time"] = round(tracked_total, 2)
+            # Temps total à partir des agrégats des vidéos suivies
+            self.stats["total_watch_time"] = round(self.aggregates.total_duration, 2)
+            self._check_aggregates()
 
-            self.save()
+            if self.storage:
+                self.storage.video_added(self.stats, video_id, video_info)
+            else:
+                self.save()
             self.logger.info(
                 f"Vidéo {video_id} ajoutée aux statistiques. Durée: {minutes:.2f} minutes. "
                 f"Total: {self.stats['total_watch_time']:.2f} minutes"
             )
+            self._notify(
+                "video_added",
+                {
+                    "id": video_id,
+                    "title": video_info["title"],
+                    "channel_id": self.stats["tracked_videos"][video_id]["channel_id"],
+                    "seconds": seconds,
+                    "added_at": video_info["added_at"],
+                },
+            )
 
         except Exception as e:
             self.logger.error(
                 f"Erreur lors de l'ajout des statistiques de la vidéo: {str(e)}"
             )
 
+    @_writer
     def update_video_count(self):
         """Met à jour le nombre de vidéos basé sur le fichier tracked_videos.json."""
         try:
@@ -268,6 +536,7 @@ class StatisticsManager:
             )
             return 0
 
+    @_writer
     def update_video_count(self, change: int = -1):
         """Met à jour le compteur de vidéos."""
         try:
@@ -294,15 +563,12 @@ class StatisticsManager:
                 f"Erreur lors de la mise à jour du nombre de vidéos: {str(e)}"
             )
 
+    @_writer
     def update_total_watch_time(self, new_total: float = None):
         """Met à jour le temps total de visionnage."""
         try:
-            if (
-                new_total is None
-                and hasattr(self, "automation")
-                and hasattr(self.automation, "video_tracker")
-            ):
-                new_total = self.automation.video_tracker.calculate_total_duration()
+            if new_total is None:
+                new_total = self.get_totals()[1]
 
             self.stats["total_watch_time"] = round(float(new_total), 2)
 
@@ -312,6 +578,9 @@ class StatisticsManager:
                 self.stats["daily_stats"][today]["watch_time"] = self.stats[
                     "total_watch_time"
                 ]
+                self.stats["daily_stats"][today]["watch_seconds"] = int(
+                    round(self.stats["total_watch_time"] * 60)
+                )
 
             self.save()
             self.logger.info(
@@ -320,6 +589,7 @@ class StatisticsManager:
         except Exception as e:
             self.logger.error(f"Erreur lors de la mise à jour du temps total: {str(e)}")
 
+    @_writer
     def reset_watch_time(self):
         """Réinitialise le temps de visionnage."""
         try:
@@ -330,11 +600,13 @@ class StatisticsManager:
             month_key = datetime.now().strftime("%Y-%m")
             if month_key in self.stats["videos_by_month"]:
                 self.stats["videos_by_month"][month_key]["watch_time"] = 0
+                self.stats["videos_by_month"][month_key]["watch_seconds"] = 0
 
             # Réinitialiser le temps du jour
             today = datetime.now().strftime("%Y-%m-%d")
             if today in self.stats["daily_stats"]:
                 self.stats["daily_stats"][today]["watch_time"] = 0
+                self.stats["daily_stats"][today]["watch_seconds"] = 0
 
             self.save()
             self.logger.info("Temps de visionnage réinitialisé")
@@ -342,6 +614,7 @@ class StatisticsManager:
         except Exception as e:
             self.logger.error(f"Erreur lors de la réinitialisation du temps: {str(e)}")
 
+    @_writer
     def update_quota(self, used: int, limit: int, last_reset: str):
         """Met à jour l'utilisation du quota API."""
         self.stats["quota_usage"] = {
@@ -352,38 +625,44 @@ class StatisticsManager:
                 datetime.fromisoformat(last_reset) + timedelta(days=1)
             ).isoformat(),
         }
-        self.save()
+        if self.storage:
+            self.storage.quota_updated(self.stats)
+        else:
+            self.save()
+
+    @_writer
+    def update_total_channels(self, total_channels: int):
+        """Enregistre le nombre total de chaînes s'il a changé."""
+        if self.stats.get("total_channels") != total_channels:
+            self.stats["total_channels"] = total_channels
+            self.save()
 
+    @_writer
     def update_selected_channels_count(self, count: int):
         """Met à jour le nombre de chaînes sélectionnées."""
         self.stats["selected_channels"] = count
-        self.save()
+        if self.storage:
+            self.storage.channels_updated(self.stats)
+        else:
+            self.save()
 
     def get_current_stats(self) -> Dict:
-        """Récupère les statistiques actuelles."""
+        """Récupère les statistiques actuelles (depuis l'instantané publié)."""
         try:
-            # Calculer le temps total depuis le tracker
+            snapshot = self._snapshot
+            # Totaux en temps constant depuis les agrégats
             total_time = 0
             video_count = 0
 
-            if self.automation and hasattr(self.automation, "video_tracker"):
-                try:
-                    total_time = (
-                        self.automation.video_tracker.calculate_total_duration()
-                    )
-                    video_count = len(self.automation.video_tracker.videos)
-                    self.logger.info(
-                        f"Stats depuis tracker: {video_count} vidéos, {total_time:.2f} minutes"
-                    )
-                except Exception as e:
-                    self.logger.error(
-                        f"Erreur lors du calcul depuis le tracker: {str(e)}"
-                    )
+            try:
+                video_count, total_time = self.get_totals()
+            except Exception as e:
+                self.logger.error(f"Erreur lors du calcul depuis le tracker: {str(e)}")
 
             if total_time == 0:
-                total_time = self.stats.get("total_watch_time", 0)
+                total_time = snapshot.get("total_watch_time", 0)
             if video_count == 0:
-                video_count = self.stats.get("total_videos", 0)
+                video_count = snapshot.get("total_videos", 0)
 
             today = datetime.now().strftime("%Y-%m-%d")
             current_month = datetime.now().strftime("%Y-%m")
@@ -391,18 +670,18 @@ class StatisticsManager:
             return {
                 "total_videos": video_count,
                 "total_watch_time": round(total_time, 2),
-                "videos_today": self.stats.get("daily_stats", {})
+                "videos_today": snapshot.get("daily_stats", {})
                 .get(today, {})
                 .get("videos_added", 0),
-                "watch_time_today": self.stats.get("daily_stats", {})
+                "watch_time_today": snapshot.get("daily_stats", {})
                 .get(today, {})
                 .get("watch_time", 0),
-                "videos_this_month": self.stats.get("videos_by_month", {})
+                "videos_this_month": snapshot.get("videos_by_month", {})
                 .get(current_month, {})
                 .get("count", 0),
-                "selected_channels": self.stats.get("selected_channels", 0),
-                "quota_usage": self.stats.get("quota_usage", {}),
-                "last_check": self.stats.get("last_check", ""),
+                "selected_channels": snapshot.get("selected_channels", 0),
+                "quota_usage": dict(snapshot.get("quota_usage", {})),
+                "last_check": snapshot.get("last_check", ""),
             }
         except Exception as e:
             self.logger.error(f"Erreur dans get_current_stats: {str(e)}")
@@ -417,6 +696,7 @@ class StatisticsManager:
                 "last_check": "",
             }
 
+    @_writer
     def update_channel_counts(self):
         """Met à jour les compteurs de chaînes."""
         try:
@@ -450,19 +730,52 @@ class StatisticsManager:
             )
             return {"total_channels": 0, "selected_channels": 0}
 
+    @_writer
+    @_writer
     def sync_with_tracker(self):
-        """Synchronise les statistiques avec le video tracker."""
+        """Synchronise les statistiques avec le video tracker.
+
+        Le tracker fait foi : les vidéos qu'il ne connaît pas sont retirées,
+        celles qui manquent sont reprises avec leur durée (sans compter
+        comme des ajouts du jour). Les agrégats sont ainsi corrigés une fois
+        et get_totals() reste en temps constant.
+        """
         try:
-            if self.automation and hasattr(self.automation, "video_tracker"):
-                total_time = self.automation.video_tracker.calculate_total_duration()
-                video_count = len(self.automation.video_tracker.videos)
+            tracker = getattr(self.automation, "video_tracker", None)
+            if tracker is not None:
+                known = tracker.videos
+                tracked = self.stats["tracked_videos"]
+                extra = [video_id for video_id in tracked if video_id not in known]
+                missing = [video_id for video_id in known if video_id not in tracked]
+                for video_id in extra:
+                    self.remove_video_from_stats(video_id)
+                for video_id in missing:
+                    video = known[video_id] if isinstance(known[video_id], dict) else {}
+                    tracked[video_id] = {
+                        "seconds": entry_seconds(video),
+                        "added_at": video.get("added_at") or datetime.now().isoformat(),
+                        "title": video.get("title", "Sans titre"),
+                        "channel_id": video.get("channel_id"),
+                    }
+                    self.aggregates.add(tracked[video_id])
+                if missing and self.storage:
+                    # Correction ponctuelle : réécriture complète du stockage
+                    self.storage.import_stats(
+                        {
+                            **self.stats,
+                            "video_history": self.stats["video_history"].to_list(),
+                        }
+                    )
 
+                video_count = self.aggregates.count
+                total_time = round(self.aggregates.total_duration, 2)
                 self.stats["total_watch_time"] = total_time
                 self.stats["total_videos"] = video_count
 
                 self.logger.info(
                     f"Synchronisation avec tracker: {video_count} vidéos, "
-                    f"{total_time:.2f} minutes"
+                    f"{total_time:.2f} minutes ({len(extra)} retirées, "
+                    f"{len(missing)} reprises)"
                 )
                 self.save()
         except Exception as e:
@@ -470,38 +783,66 @@ class StatisticsManager:
                 f"Erreur lors de la synchronisation avec le tracker: {str(e)}"
             )
 
-    def get_daily_stats(self, days: int = 7) -> List[Dict]:
-        """Récupère les statistiques quotidiennes des n derniers jours."""
-        stats = []
-        now = datetime.now()
+    def get_daily_stats(
+        self, days: int = 7, resolution: str = "day", channel_id: str = None
+    ) -> List[Dict]:
+        """Récupère les statistiques des n derniers jours.
 
-        for i in range(days):
-            date = (now - timedelta(days=i)).strftime("%Y-%m-%d")
-            if date in self.stats["daily_stats"]:
-                stats.append(
-                    {
-                        "date": date,
-                        "videos": self.stats["daily_stats"][date]["videos_added"],
-                        "watch_time": round(
-                            self.stats["daily_stats"][date]["watch_time"]
-                        ),
-                    }
-                )
-            else:
-                stats.append({"date": date, "videos": 0, "watch_time": 0})
+        Au-delà de la rétention de `resolution`, la granularité suivante
+        (semaine, puis mois) est utilisée.
+        """
+        now = datetime.now()
+        start = now - timedelta(days=days - 1)
+        tier = self.rollups.covering_tier(start, resolution)
+        return [
+            {
+                "date": bucket["bucket"],
+                "videos": bucket["count"],
+                "watch_time": round(bucket["seconds"] / 60),
+            }
+            for bucket in self.rollups.series(tier, start, now, channel_id)
+        ]
 
-        return sorted(stats, key=lambda x: x["date"])
+    def get_channel_activity(self, days: int = 30, limit: int = 10) -> List[Dict]:
+        """Chaînes ayant ajouté le plus de vidéos sur les n derniers jours."""
+        now = datetime.now()
+        start = now - timedelta(days=days - 1)
+        tier = self.rollups.covering_tier(start)
+        totals = self.rollups.channel_totals(tier, start, now)
+        channels = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        return [
+            {
+                "channel_id": channel_id,
+                "title": self.rollups.title(channel_id)
+                or ("Chaîne inconnue" if channel_id == UNKNOWN_CHANNEL else None),
+                "video_count": count,
+                "watch_time": round(seconds / 60),
+            }
+            for channel_id, (count, seconds) in channels[:limit]
+        ]
 
     def get_video_history(self, limit: int = 100) -> List[Dict]:
         """Récupère l'historique des dernières vidéos ajoutées."""
-        return self.stats["video_history"][:limit]
+        return self.stats["video_history"].page(limit)["items"]
+
+    def get_video_history_page(
+        self, limit: int = 50, cursor: Optional[int] = None
+    ) -> Dict:
+        """Page de l'historique ; `cursor` vient de la page précédente."""
+        return self.stats["video_history"].page(limit, cursor)
 
     def get_last_check_time(self) -> str:
         """Récupère la date de dernière vérification."""
         return self.stats["last_check"]
 
+    @_writer
     def cleanup_old_stats(self, days: int = 30):
-        """Nettoie les anciennes statistiques."""
+        """Nettoie les anciennes statistiques.
+
+        Les compteurs quotidiens et mensuels retirés restent disponibles, à
+        une granularité plus grossière, dans l'index des agrégats.
+        """
+        self.rollups.age()
         cutoff_date = datetime.now() - timedelta(days=days)
 
         # Nettoyer les stats quotidiennes
@@ -519,6 +860,7 @@ class StatisticsManager:
 
         self.save()
 
+    @_writer
     def reset_daily_stats(self):
         """Réinitialise les statistiques quotidiennes."""
         today = datetime.now().strftime("%Y-%m-%d")
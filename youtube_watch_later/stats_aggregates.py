@@ -0,0 +1,85 @@
+import logging
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def entry_seconds(entry: Dict) -> int:
+    """Durée d'une vidéo suivie en secondes (anciennes entrées en minutes)."""
+    seconds = entry.get("seconds")
+    if seconds is None:
+        return int(round(float(entry.get("duration") or 0) * 60))
+    return int(seconds)
+
+
+class RunningAggregates:
+    """Agrégats des vidéos suivies maintenus au fil des ajouts et retraits.
+
+    Nombre, durée totale et sommes par chaîne et par mois sont mis à jour
+    en O(1) ; verify() les compare à un recalcul complet. L'appelant
+    fournit l'entrée retirée, aucune copie des vidéos n'est conservée ici.
+    Les durées sont des secondes entières : les totaux sont exacts.
+    """
+
+    def __init__(self, tracked_videos: Optional[Dict[str, Dict]] = None):
+        self.count = 0
+        self.total_seconds = 0
+        self.by_channel: Dict[str, Dict] = {}
+        self.by_month: Dict[str, Dict] = {}
+        for entry in (tracked_videos or {}).values():
+            self.add(entry)
+
+    @property
+    def total_duration(self) -> float:
+        """Durée totale en minutes."""
+        return self.total_seconds / 60
+
+    @staticmethod
+    def _key(entry: Dict) -> tuple:
+        return (
+            entry_seconds(entry),
+            entry.get("channel_id") or "unknown",
+            (entry.get("added_at") or "")[:7],
+        )
+
+    @staticmethod
+    def _bump(buckets: Dict[str, Dict], key: str, count: int, seconds: int):
+        bucket = buckets.setdefault(key, {"count": 0, "seconds": 0})
+        bucket["count"] += count
+        bucket["seconds"] += seconds
+        if bucket["count"] <= 0:
+            del buckets[key]
+
+    def add(self, entry: Dict):
+        """Prend en compte une vidéo."""
+        seconds, channel_id, month = self._key(entry)
+        self.count += 1
+        self.total_seconds += seconds
+        self._bump(self.by_channel, channel_id, 1, seconds)
+        self._bump(self.by_month, month, 1, seconds)
+
+    def remove(self, entry: Dict) -> int:
+        """Retire une vidéo précédemment ajoutée ; retourne sa durée (secondes)."""
+        seconds, channel_id, month = self._key(entry)
+        self.count -= 1
+        self.total_seconds -= seconds
+        self._bump(self.by_channel, channel_id, -1, -seconds)
+        self._bump(self.by_month, month, -1, -seconds)
+        return seconds
+
+    def verify(self, tracked_videos: Dict[str, Dict]) -> bool:
+        """Compare les agrégats à un recalcul complet ; journalise les écarts."""
+        expected = RunningAggregates(tracked_videos)
+        errors = []
+        if expected.count != self.count:
+            errors.append(f"nombre {self.count} != {expected.count}")
+        if expected.total_seconds != self.total_seconds:
+            errors.append(f"durée {self.total_seconds} != {expected.total_seconds}")
+        for name in ("by_channel", "by_month"):
+            if getattr(self, name) != getattr(expected, name):
+                errors.append(f"agrégats {name} divergents")
+
+        if errors:
+            logger.error(f"Agrégats des statistiques incohérents: {', '.join(errors)}")
+            return False
+        return True
@@ -0,0 +1,700 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+from config import Config
+from rollup_index import (
+    ALL_CHANNELS,
+    TIERS,
+    UNKNOWN_CHANNEL,
+    RollupIndex,
+    bucket_key,
+    retention,
+)
+from video_table import json_default
+
+logger = logging.getLogger(__name__)
+
+# Valeurs scalaires des statistiques conservées dans la table meta
+META_KEYS = (
+    "version",
+    "total_videos",
+    "total_watch_time",
+    "selected_channels",
+    "total_channels",
+    "last_check",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tracked_videos (
+    video_id TEXT PRIMARY KEY,
+    duration REAL NOT NULL,
+    added_at TEXT NOT NULL,
+    title TEXT,
+    channel_id TEXT,
+    seconds INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_tracked_added_at ON tracked_videos (added_at);
+CREATE TABLE IF NOT EXISTS daily_stats (
+    day TEXT PRIMARY KEY,
+    videos_added INTEGER NOT NULL DEFAULT 0,
+    watch_time REAL NOT NULL DEFAULT 0,
+    watch_seconds INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS monthly_stats (
+    month TEXT PRIMARY KEY,
+    count INTEGER NOT NULL DEFAULT 0,
+    watch_time REAL NOT NULL DEFAULT 0,
+    watch_seconds INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS video_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    video_id TEXT NOT NULL,
+    title TEXT,
+    duration TEXT,
+    watch_time REAL,
+    added_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_video ON video_history (video_id);
+CREATE TABLE IF NOT EXISTS rollups (
+    tier TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    seconds INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (tier, bucket, channel_id)
+);
+CREATE TABLE IF NOT EXISTS rollup_titles (
+    channel_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS quota_usage (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    used INTEGER NOT NULL DEFAULT 0,
+    quota_limit INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+# Colonnes ajoutées après la création initiale des tables
+ADDED_COLUMNS = {
+    "tracked_videos": {"channel_id": "TEXT", "seconds": "INTEGER"},
+    "daily_stats": {"watch_seconds": "INTEGER NOT NULL DEFAULT 0"},
+    "monthly_stats": {"watch_seconds": "INTEGER NOT NULL DEFAULT 0"},
+}
+
+TRACKED_INSERT = (
+    "INSERT OR REPLACE INTO tracked_videos "
+    "(video_id, duration, added_at, title, channel_id, seconds) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+DAILY_INSERT = (
+    "INSERT OR REPLACE INTO daily_stats "
+    "(day, videos_added, watch_time, watch_seconds) VALUES (?, ?, ?, ?)"
+)
+MONTHLY_INSERT = (
+    "INSERT OR REPLACE INTO monthly_stats "
+    "(month, count, watch_time, watch_seconds) VALUES (?, ?, ?, ?)"
+)
+ROLLUP_INSERT = (
+    "INSERT OR REPLACE INTO rollups (tier, bucket, channel_id, count, seconds) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+TITLE_INSERT = "INSERT OR REPLACE INTO rollup_titles (channel_id, title) VALUES (?, ?)"
+
+
+def _tracked_row(video_id: str, entry: Dict) -> tuple:
+    return (
+        video_id,
+        entry.get("duration", 0),
+        entry.get("added_at", ""),
+        entry.get("title"),
+        entry.get("channel_id"),
+        entry.get("seconds"),
+    )
+
+
+def _rollup_row(key: str, bucket: Dict, count_key: str) -> tuple:
+    return (
+        key,
+        bucket.get(count_key, 0),
+        bucket.get("watch_time", 0),
+        bucket.get("watch_seconds", 0),
+    )
+
+
+class SqliteStatsStorage:
+    """Stockage SQLite des statistiques et des vidéos suivies.
+
+    Chaque opération est une transaction courte (mode WAL) : l'ajout ou le
+    retrait d'une vidéo ne touche que quelques lignes indexées au lieu de
+    réécrire tout le fichier JSON.
+    """
+
+    def __init__(self, db_file: str = None, history_size: int = None):
+        self.db_file = db_file or Config.STATS_DB_FILE
+        self.history_size = history_size or Config.HISTORY_MAX_ITEMS
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        for table, added in ADDED_COLUMNS.items():
+            columns = {
+                row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")
+            }
+            for column, definition in added.items():
+                if column not in columns:
+                    self._conn.execute(
+                        f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+                    )
+        self._conn.commit()
+
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM meta LIMIT 1").fetchone() is None
+
+    def load(self) -> Optional[Dict]:
+        """Reconstruit le dictionnaire des statistiques ; None si la base est vide."""
+        if self.is_empty():
+            return None
+
+        with self._lock:
+            conn = self._conn
+            stats = {
+                key: json.loads(value)
+                for key, value in conn.execute("SELECT key, value FROM meta")
+            }
+            stats["tracked_videos"] = {
+                row[0]: {
+                    "duration": row[1],
+                    "added_at": row[2],
+                    "title": row[3],
+                    "channel_id": row[4],
+                    "seconds": row[5],
+                }
+                for row in conn.execute(
+                    "SELECT video_id, duration, added_at, title, channel_id, seconds "
+                    "FROM tracked_videos"
+                )
+            }
+            stats["daily_stats"] = {
+                day: {
+                    "videos_added": videos_added,
+                    "watch_time": watch_time,
+                    "watch_seconds": watch_seconds,
+                }
+                for day, videos_added, watch_time, watch_seconds in conn.execute(
+                    "SELECT day, videos_added, watch_time, watch_seconds "
+                    "FROM daily_stats"
+                )
+            }
+            stats["videos_by_month"] = {
+                month: {
+                    "count": count,
+                    "watch_time": watch_time,
+                    "watch_seconds": watch_seconds,
+                }
+                for month, count, watch_time, watch_seconds in conn.execute(
+                    "SELECT month, count, watch_time, watch_seconds FROM monthly_stats"
+                )
+            }
+            stats["video_history"] = [
+                {
+                    "id": video_id,
+                    "title": title,
+                    "duration": duration,
+                    "watch_time": watch_time,
+                    "added_at": added_at,
+                    "seq": seq,
+                }
+                for seq, video_id, title, duration, watch_time, added_at in conn.execute(
+                    "SELECT seq, video_id, title, duration, watch_time, added_at "
+                    "FROM video_history ORDER BY seq DESC LIMIT ?",
+                    (self.history_size,),
+                )
+            ]
+            row = conn.execute("SELECT data FROM quota_usage WHERE id = 1").fetchone()
+            stats["quota_usage"] = json.loads(row[0]) if row else {}
+            rollups = {tier: {} for tier in TIERS}
+            for tier, bucket, channel_id, count, seconds in conn.execute(
+                "SELECT tier, bucket, channel_id, count, seconds FROM rollups"
+            ):
+                rollups[tier].setdefault(bucket, {})[channel_id] = [count, seconds]
+            rollups["titles"] = dict(
+                conn.execute("SELECT channel_id, title FROM rollup_titles")
+            )
+            # Base antérieure à l'index : il sera reconstruit
+            if any(rollups[tier] for tier in TIERS):
+                stats["rollups"] = rollups
+        return stats
+
+    # Écritures (appelées sous verrou, dans une transaction)
+
+    def _write_meta(self, stats: Dict):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            [(key, json.dumps(stats[key])) for key in META_KEYS if key in stats],
+        )
+
+    def _write_quota(self, stats: Dict):
+        quota = stats.get("quota_usage") or {}
+        self._conn.execute(
+            "INSERT OR REPLACE INTO quota_usage (id, used, quota_limit, data) "
+            "VALUES (1, ?, ?, ?)",
+            (
+                quota.get("used", 0),
+                quota.get("limit", Config.YOUTUBE_QUOTA_LIMIT),
+                json.dumps(quota),
+            ),
+        )
+
+    def _write_rollup(self, stats: Dict, day: str, month: str):
+        daily = stats["daily_stats"].get(day)
+        if daily:
+            self._conn.execute(DAILY_INSERT, _rollup_row(day, daily, "videos_added"))
+        monthly = stats["videos_by_month"].get(month)
+        if monthly:
+            self._conn.execute(MONTHLY_INSERT, _rollup_row(month, monthly, "count"))
+
+    def _write_buckets(self, stats: Dict, entry: Dict):
+        """Compartiments de l'index touchés par l'ajout d'une vidéo."""
+        rollups = stats.get("rollups")
+        if rollups is None:
+            return
+        at = datetime.fromisoformat(entry["added_at"])
+        channel_id = entry.get("channel_id") or UNKNOWN_CHANNEL
+        rows = []
+        for tier in TIERS:
+            key = bucket_key(tier, at)
+            bucket = rollups.data[tier].get(key, {})
+            for channel in (channel_id, ALL_CHANNELS):
+                if channel in bucket:
+                    rows.append((tier, key, channel, *bucket[channel]))
+        self._conn.executemany(ROLLUP_INSERT, rows)
+        title = rollups.title(channel_id)
+        if title:
+            self._conn.execute(TITLE_INSERT, (channel_id, title))
+
+    def _write_index(self, stats: Dict):
+        """Réécrit l'index des agrégats (après vieillissement ou import)."""
+        rollups = stats.get("rollups")
+        if rollups is None:
+            return
+        data = rollups.to_dict() if isinstance(rollups, RollupIndex) else rollups
+        self._conn.execute("DELETE FROM rollups")
+        self._conn.executemany(
+            ROLLUP_INSERT,
+            [
+                (tier, key, channel_id, count, seconds)
+                for tier in TIERS
+                for key, bucket in list(data.get(tier, {}).items())
+                for channel_id, (count, seconds) in list(bucket.items())
+            ],
+        )
+        self._conn.executemany(TITLE_INSERT, list(data.get("titles", {}).items()))
+
+    def _age_index(self, stats: Dict):
+        """Construit l'index s'il est vide, sinon supprime les compartiments vieillis."""
+        if self._conn.execute("SELECT 1 FROM rollups LIMIT 1").fetchone() is None:
+            self._write_index(stats)
+            return
+        now = datetime.now()
+        for tier in TIERS:
+            keep = retention(tier)
+            if keep is not None:
+                self._conn.execute(
+                    "DELETE FROM rollups WHERE tier = ? AND bucket < ?",
+                    (tier, bucket_key(tier, now - keep)),
+                )
+
+    def _write_rollups(self, stats: Dict):
+        """Réécrit les agrégats (quelques centaines de lignes au plus)."""
+        self._conn.execute("DELETE FROM daily_stats")
+        self._conn.executemany(
+            DAILY_INSERT,
+            [
+                _rollup_row(day, v, "videos_added")
+                for day, v in stats.get("daily_stats", {}).items()
+            ],
+        )
+        self._conn.execute("DELETE FROM monthly_stats")
+        self._conn.executemany(
+            MONTHLY_INSERT,
+            [
+                _rollup_row(month, v, "count")
+                for month, v in stats.get("videos_by_month", {}).items()
+            ],
+        )
+
+    def _run(self, action: str, operation):
+        with self._lock:
+            try:
+                with self._conn:
+                    operation()
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors de {action} (SQLite): {str(e)}")
+
+    # Opérations
+
+    def video_added(self, stats: Dict, video_id: str, history_entry: Dict):
+        """Enregistre une vidéo ajoutée : suivi, historique, agrégats du jour."""
+        entry = stats["tracked_videos"][video_id]
+
+        def operation():
+            self._conn.execute(TRACKED_INSERT, _tracked_row(video_id, entry))
+            self._conn.execute(
+                "INSERT INTO video_history "
+                "(video_id, title, duration, watch_time, added_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    video_id,
+                    history_entry.get("title"),
+                    history_entry.get("duration"),
+                    history_entry.get("watch_time"),
+                    history_entry["added_at"],
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM video_history WHERE seq <= "
+                "(SELECT MAX(seq) FROM video_history) - ?",
+                (self.history_size,),
+            )
+            day, month = entry["added_at"][:10], entry["added_at"][:7]
+            self._write_rollup(stats, day, month)
+            self._write_buckets(stats, entry)
+            self._write_meta(stats)
+
+        self._run("l'ajout de la vidéo", operation)
+
+    def video_removed(self, stats: Dict, video_id: str):
+        """Retire une vidéo du suivi."""
+
+        def operation():
+            self._conn.execute(
+                "DELETE FROM tracked_videos WHERE video_id = ?", (video_id,)
+            )
+            self._write_meta(stats)
+
+        self._run("le retrait de la vidéo", operation)
+
+    def quota_updated(self, stats: Dict):
+        """Enregistre l'utilisation du quota."""
+        self._run("la sauvegarde du quota", lambda: self._write_quota(stats))
+
+    def channels_updated(self, stats: Dict):
+        """Enregistre les compteurs de chaînes."""
+        self._run("la sauvegarde des chaînes", lambda: self._write_meta(stats))
+
+    def save_state(self, stats: Dict):
+        """Enregistre les valeurs scalaires, le quota et les agrégats."""
+
+        def operation():
+            self._write_meta(stats)
+            self._write_quota(stats)
+            self._write_rollups(stats)
+            self._age_index(stats)
+
+        self._run("la sauvegarde des statistiques", operation)
+
+    def import_stats(self, stats: Dict):
+        """Importe un dictionnaire complet de statistiques (migration depuis JSON)."""
+
+        def operation():
+            self._conn.execute("DELETE FROM tracked_videos")
+            self._conn.executemany(
+                TRACKED_INSERT,
+                [
+                    _tracked_row(video_id, v)
+                    for video_id, v in stats.get("tracked_videos", {}).items()
+                ],
+            )
+            self._conn.execute("DELETE FROM video_history")
+            self._conn.executemany(
+                "INSERT INTO video_history "
+                "(video_id, title, duration, watch_time, added_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        h.get("id", ""),
+                        h.get("title"),
+                        h.get("duration"),
+                        h.get("watch_time"),
+                        h.get("added_at", ""),
+                    )
+                    # L'historique JSON est du plus récent au plus ancien
+                    for h in reversed(stats.get("video_history", []))
+                ],
+            )
+            self._write_meta(stats)
+            self._write_quota(stats)
+            self._write_rollups(stats)
+            self._write_index(stats)
+
+        self._run("l'import des statistiques", operation)
+
+    def checkpoint(self, stats: Dict):
+        """Reporte le journal WAL dans la base (arrêt de l'application)."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors du checkpoint SQLite: {str(e)}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class EventLogStatsStorage:
+    """Journal d'évènements en ajout seul, compacté par des instantanés.
+
+    Chaque mutation ajoute une ligne JSON compacte (écriture O(1), fsync) ;
+    les évènements portent les valeurs résultantes, leur rejeu est donc
+    idempotent. Au démarrage, le dernier instantané est chargé puis la fin
+    du journal est rejouée ; une fin corrompue est tronquée.
+    """
+
+    def __init__(
+        self,
+        log_file: str = None,
+        snapshot_file: str = None,
+        snapshot_interval: int = None,
+        history_size: int = None,
+    ):
+        self.log_file = log_file or Config.STATS_EVENT_LOG
+        self.snapshot_file = snapshot_file or Config.STATS_SNAPSHOT_FILE
+        self.snapshot_interval = snapshot_interval or Config.STATS_SNAPSHOT_INTERVAL
+        self.history_size = history_size or Config.HISTORY_MAX_ITEMS
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._pending = 0  # Évènements depuis le dernier instantané
+        self._log = None
+        self._indexed = False  # Instantané contenant l'index des agrégats
+        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
+
+    def is_empty(self) -> bool:
+        return not os.path.exists(self.snapshot_file) and not os.path.exists(
+            self.log_file
+        )
+
+    # Chargement
+
+    def _read_snapshot(self) -> Dict:
+        if not os.path.exists(self.snapshot_file):
+            return {"seq": 0, "stats": None}
+        with open(self.snapshot_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _replay(self, stats: Dict, since: int) -> int:
+        """Rejoue les évènements postérieurs à `since` ; tronque une fin corrompue."""
+        if not os.path.exists(self.log_file):
+            return since
+
+        seq = since
+        valid_bytes = 0
+        with open(self.log_file, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("ligne incomplète")
+                    event = json.loads(line)
+                except ValueError:
+                    logger.warning(
+                        f"Journal des statistiques corrompu à l'octet {valid_bytes}, "
+                        f"fin du journal tronquée"
+                    )
+                    break
+                valid_bytes += len(line)
+                if event["n"] > since:
+                    self._apply(stats, event)
+                    seq = event["n"]
+                    self._pending += 1
+
+        if valid_bytes < os.path.getsize(self.log_file):
+            with open(self.log_file, "r+b") as f:
+                f.truncate(valid_bytes)
+        return seq
+
+    def _apply(self, stats: Dict, event: Dict):
+        kind = event["e"]
+        stats.update(event.get("meta", {}))
+        if kind == "add":
+            stats["tracked_videos"][event["id"]] = event["video"]
+            day, daily = event["day"]
+            stats["daily_stats"][day] = daily
+            month, monthly = event["month"]
+            stats["videos_by_month"][month] = monthly
+            stats["video_history"].insert(0, event["history"])
+            del stats["video_history"][self.history_size :]
+            # Index absent de l'instantané : reconstruit après le chargement
+            if "rollups" in stats:
+                video = event["video"]
+                RollupIndex(stats["rollups"]).add(
+                    datetime.fromisoformat(video["added_at"]),
+                    video.get("channel_id"),
+                    int(video.get("seconds") or 0),
+                    title=event.get("channel_title"),
+                )
+        elif kind == "remove":
+            stats["tracked_videos"].pop(event["id"], None)
+        elif kind == "quota":
+            stats["quota_usage"] = event["quota"]
+        elif kind == "state":
+            stats["quota_usage"] = event["quota"]
+            stats["daily_stats"] = event["daily"]
+            stats["videos_by_month"] = event["monthly"]
+
+    def load(self) -> Optional[Dict]:
+        """Charge le dernier instantané et rejoue la fin du journal."""
+        if self.is_empty():
+            return None
+        with self._lock:
+            try:
+                snapshot = self._read_snapshot()
+            except Exception as e:
+                logger.error(f"Erreur lors de la lecture de l'instantané: {str(e)}")
+                snapshot = {"seq": 0, "stats": None}
+            stats = snapshot["stats"] or {
+                "total_videos": 0,
+                "total_watch_time": 0,
+                "videos_by_month": {},
+                "daily_stats": {},
+                "selected_channels": 0,
+                "quota_usage": {},
+                "video_history": [],
+                "tracked_videos": {},
+            }
+            self._pending = 0
+            self._seq = self._replay(stats, snapshot["seq"])
+            self._indexed = "rollups" in stats
+        return stats
+
+    # Écriture
+
+    @staticmethod
+    def _meta(stats: Dict) -> Dict:
+        return {key: stats[key] for key in META_KEYS if key in stats}
+
+    def _append(self, stats: Dict, event: Dict):
+        with self._lock:
+            try:
+                self._seq += 1
+                event["n"] = self._seq
+                if self._log is None:
+                    self._log = open(self.log_file, "a", encoding="utf-8")
+                self._log.write(json.dumps(event, separators=(",", ":")) + "\n")
+                self._log.flush()
+                os.fsync(self._log.fileno())
+                self._pending += 1
+                if self._pending >= self.snapshot_interval:
+                    self._compact(stats)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'écriture du journal: {str(e)}")
+
+    def _compact(self, stats: Dict):
+        """Écrit un instantané puis vide le journal (appelé sous verrou)."""
+        tmp_file = f"{self.snapshot_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"seq": self._seq, "stats": stats},
+                f,
+                separators=(",", ":"),
+                default=json_default,
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.snapshot_file)
+
+        # Les évènements couverts par l'instantané sont ignorés au rejeu :
+        # un arrêt avant la troncature ne cause donc aucun doublon
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        open(self.log_file, "w", encoding="utf-8").close()
+        self._pending = 0
+        logger.info(f"Journal des statistiques compacté (évènement {self._seq})")
+
+    def video_added(self, stats: Dict, video_id: str, history_entry: Dict):
+        entry = stats["tracked_videos"][video_id]
+        day, month = entry["added_at"][:10], entry["added_at"][:7]
+        self._append(
+            stats,
+            {
+                "e": "add",
+                "id": video_id,
+                "video": entry,
+                "history": history_entry,
+                "channel_title": stats["rollups"].title(
+                    entry.get("channel_id") or UNKNOWN_CHANNEL
+                ),
+                "day": [day, stats["daily_stats"].get(day, {})],
+                "month": [month, stats["videos_by_month"].get(month, {})],
+                "meta": self._meta(stats),
+            },
+        )
+
+    def video_removed(self, stats: Dict, video_id: str):
+        self._append(stats, {"e": "remove", "id": video_id, "meta": self._meta(stats)})
+
+    def quota_updated(self, stats: Dict):
+        self._append(stats, {"e": "quota", "quota": stats.get("quota_usage", {})})
+
+    def channels_updated(self, stats: Dict):
+        self._append(stats, {"e": "channels", "meta": self._meta(stats)})
+
+    def save_state(self, stats: Dict):
+        if not self._indexed and "rollups" in stats:
+            # Index construit après le chargement : il doit figurer dans un instantané
+            with self._lock:
+                try:
+                    self._compact(stats)
+                    self._indexed = True
+                except Exception as e:
+                    logger.error(f"Erreur lors du compactage du journal: {str(e)}")
+            return
+        self._append(
+            stats,
+            {
+                "e": "state",
+                "meta": self._meta(stats),
+                "quota": stats.get("quota_usage", {}),
+                "daily": stats.get("daily_stats", {}),
+                "monthly": stats.get("videos_by_month", {}),
+            },
+        )
+
+    def import_stats(self, stats: Dict):
+        """Crée l'instantané initial (migration depuis JSON)."""
+        with self._lock:
+            try:
+                stats.setdefault("tracked_videos", {})
+                stats.setdefault("video_history", [])
+                self._compact(stats)
+                self._indexed = "rollups" in stats
+            except Exception as e:
+                logger.error(f"Erreur lors de l'import des statistiques: {str(e)}")
+
+    def checkpoint(self, stats: Dict):
+        """Compacte le journal (arrêt de l'application)."""
+        with self._lock:
+            try:
+                if self._pending:
+                    self._compact(stats)
+            except Exception as e:
+                logger.error(f"Erreur lors du compactage du journal: {str(e)}")
+
+    def close(self):
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config  # noqa: E402
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Répertoire de données temporaire : tous les fichiers de Config y pointent."""
+    for name, value in vars(Config).items():
+        if isinstance(value, str) and value.startswith(Config.DATA_DIR + os.sep):
+            relative = os.path.relpath(value, Config.DATA_DIR)
+            monkeypatch.setattr(Config, name, str(tmp_path / relative))
+    monkeypatch.setattr(Config, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "STATS_BACKEND", "json")
+    return tmp_path
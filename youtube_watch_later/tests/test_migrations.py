@@ -0,0 +1,121 @@
+import glob
+import json
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from config import Config
+from migrations import Migration
+from statistics_manager import StatisticsManager
+
+
+def write_legacy_stats(path, tracked_videos: int) -> bytes:
+    """Statistiques à l'ancien format : sans version, durées en minutes."""
+    rng = random.Random(42)
+    now = datetime.now()
+    data = {
+        "total_videos": tracked_videos,
+        "total_watch_time": 0,
+        "daily_stats": {
+            (now - timedelta(days=i)).strftime("%Y-%m-%d"): {
+                "videos_added": rng.randint(0, 50),
+                "watch_time": round(rng.uniform(0, 600), 2),
+            }
+            for i in range(365)
+        },
+        "tracked_videos": {
+            f"vid{i:08d}": {
+                "duration": round(rng.uniform(1, 120), 2),
+                "added_at": (now - timedelta(minutes=i)).isoformat(),
+                "title": f"Vidéo de test numéro {i} avec un titre réaliste",
+                "channel_id": f"UC{rng.randrange(500):022d}",
+            }
+            for i in range(tracked_videos)
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def read_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_large_file_migrates_once_with_restorable_backup(tmp_path):
+    statistics_file = str(tmp_path / "statistics.json")
+    original = write_legacy_stats(statistics_file, 20_000)
+    assert len(original) > 4 * 1024 * 1024
+
+    migration = Migration(statistics_file, backup_retention=3)
+    data = migration.run()
+    report = migration.last_report
+
+    assert report["from_version"] == 0
+    assert report["to_version"] == 4
+    assert report["steps"] == [1, 2, 3, 4]
+    assert report["bytes_read"] == len(original)
+    assert report["bytes_written"] == os.path.getsize(statistics_file)
+    assert report["duration"] >= 0
+    assert glob.glob(f"{statistics_file}.bak.*") == [report["backup"]]
+
+    migrated = read_json(statistics_file)
+    assert migrated == data
+    assert migrated["version"] == 4
+    assert len(migrated["tracked_videos"]) == 20_000
+    assert all("seconds" in v for v in migrated["tracked_videos"].values())
+
+    # Aucune étape en attente : ni réécriture ni sauvegarde
+    again = Migration(statistics_file, backup_retention=3)
+    again.run()
+    assert again.last_report["bytes_written"] == 0
+    assert again.last_report["backup"] is None
+
+    # La sauvegarde restaure exactement le fichier d'origine
+    with open(report["backup"], "rb") as f:
+        assert f.read() == original
+    os.replace(report["backup"], statistics_file)
+    remigrated = Migration(statistics_file).run()
+    assert remigrated["version"] == 4
+    assert remigrated["tracked_videos"] == migrated["tracked_videos"]
+
+
+def test_backup_retention(tmp_path):
+    statistics_file = str(tmp_path / "statistics.json")
+    for _ in range(4):
+        write_legacy_stats(statistics_file, 10)
+        Migration(statistics_file, backup_retention=2).run()
+    assert len(glob.glob(f"{statistics_file}.bak.*")) == 2
+
+
+def add_videos(manager: StatisticsManager, count: int):
+    for i in range(count):
+        manager.add_video_to_stats(
+            {
+                "id": f"vid{i:04d}",
+                "duration_seconds": 60 * (i + 1),
+                "title": f"Vidéo {i}",
+                "channel_id": f"UC{i % 3}",
+            }
+        )
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "eventlog"])
+def test_history_survives_backend_switch(data_dir, monkeypatch, backend):
+    manager = StatisticsManager(Config.STATISTICS_FILE)
+    add_videos(manager, 25)
+    manager.flush()
+    history = manager.get_video_history(100)
+    assert len(history) == 25
+
+    monkeypatch.setattr(Config, "STATS_BACKEND", backend)
+    switched = StatisticsManager(Config.STATISTICS_FILE)
+
+    assert switched.get_totals() == manager.get_totals()
+    assert [(h["id"], h["added_at"]) for h in switched.get_video_history(100)] == [
+        (h["id"], h["added_at"]) for h in history
+    ]
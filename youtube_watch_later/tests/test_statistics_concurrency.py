@@ -0,0 +1,99 @@
+import logging
+import random
+import threading
+
+import pytest
+
+from config import Config
+from statistics_manager import StatisticsManager
+
+WRITERS = 6
+READERS = 6
+OPERATIONS = 300
+
+
+def writer(manager, index: int, expected: dict, failures: list):
+    """Ajouts et retraits sur les vidéos propres à ce thread ; `expected` suit l'état attendu."""
+    rng = random.Random(index)
+    try:
+        for _ in range(OPERATIONS):
+            video_id = f"stress{index}-{rng.randrange(50)}"
+            action = rng.random()
+            if action < 0.6:
+                seconds = rng.randint(60, 7200)
+                manager.add_video_to_stats(
+                    {
+                        "id": video_id,
+                        "duration_seconds": seconds,
+                        "title": "Vidéo de charge",
+                        "channel_id": f"UCstress{rng.randrange(5)}",
+                    }
+                )
+                expected[video_id] = seconds
+            elif action < 0.9:
+                manager.remove_video_from_stats(video_id)
+                expected.pop(video_id, None)
+            elif action < 0.97:
+                manager.update_quota(rng.randrange(10000), 10000, "2024-01-01T00:00:00")
+            else:
+                manager.flush()
+    except Exception as e:
+        failures.append(f"écrivain {index}: {e!r}")
+
+
+def reader(manager, stop: threading.Event, failures: list):
+    try:
+        while not stop.is_set():
+            snapshot = manager.get_snapshot()
+            if snapshot["video_count"] < 0 or snapshot["total_seconds"] < 0:
+                failures.append("instantané incohérent")
+            if not isinstance(manager.get_current_stats()["quota_usage"], dict):
+                failures.append("quota non sérialisable")
+            videos = manager.get_tracked_videos()
+            if sum(entry["seconds"] for entry in videos.values()) < 0:
+                failures.append("vue incohérente")
+            manager.get_daily_stats(30)
+            manager.get_video_history(20)
+    except Exception as e:
+        failures.append(f"lecteur: {e!r}")
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite", "eventlog"])
+def test_concurrent_mutators_keep_totals_consistent(
+    data_dir, monkeypatch, caplog, backend
+):
+    monkeypatch.setattr(Config, "STATS_BACKEND", backend)
+    caplog.set_level(logging.ERROR)
+    manager = StatisticsManager(Config.STATISTICS_FILE)
+
+    failures = []
+    expected = [{} for _ in range(WRITERS)]
+    stop = threading.Event()
+    writers = [
+        threading.Thread(target=writer, args=(manager, i, expected[i], failures))
+        for i in range(WRITERS)
+    ]
+    readers = [
+        threading.Thread(target=reader, args=(manager, stop, failures))
+        for _ in range(READERS)
+    ]
+    for thread in writers + readers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+    manager.flush()
+
+    assert failures == []
+    assert [r.getMessage() for r in caplog.records if r.levelno >= logging.ERROR] == []
+
+    seconds = {k: v for videos in expected for k, v in videos.items()}
+    totals = (len(seconds), round(sum(seconds.values()) / 60, 2))
+    assert dict(manager.get_tracked_videos()).keys() == seconds.keys()
+    assert manager.get_totals() == totals
+    assert manager.aggregates.verify(manager.stats["tracked_videos"])
+
+    reloaded = StatisticsManager(Config.STATISTICS_FILE)
+    assert reloaded.get_totals() == totals
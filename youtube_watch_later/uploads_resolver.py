@@ -0,0 +1,109 @@
+import json
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+from config import Config
+from video_fetcher import chunk_ids
+
+logger = logging.getLogger(__name__)
+
+
+class UploadsPlaylistResolver:
+    """Cache persistant chaîne -> playlist des uploads (relatedPlaylists.uploads)."""
+
+    def __init__(self, cache_file: str = None):
+        self.cache_file = cache_file or Config.UPLOADS_PLAYLISTS_FILE
+        self._lock = threading.Lock()
+        self.playlists: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        """Charge le cache depuis le disque."""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement du cache des playlists: {str(e)}")
+        return {}
+
+    def _save(self):
+        """Sauvegarde le cache de manière atomique (appelé sous verrou)."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.playlists, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.error(
+                f"Erreur lors de la sauvegarde du cache des playlists: {str(e)}"
+            )
+
+    def get(self, channel_id: str) -> Optional[str]:
+        """Retourne la playlist connue d'une chaîne, sans appel API."""
+        return self.playlists.get(channel_id)
+
+    def resolve_many(
+        self,
+        youtube,
+        channel_ids: List[str],
+        on_request: Optional[Callable[[], None]] = None,
+    ) -> Dict[str, str]:
+        """Résout les playlists des uploads, par paquets de 50 chaînes par appel.
+
+        Un paquet en échec (quota, erreur serveur, délai) est journalisé et
+        ignoré : ses chaînes restent non résolues, les autres sont conservées.
+        """
+        with self._lock:
+            missing = [
+                cid for cid in dict.fromkeys(channel_ids) if cid not in self.playlists
+            ]
+
+        resolved = {}
+        for batch in chunk_ids(missing):
+            try:
+                response = (
+                    youtube.channels()
+                    .list(
+                        part="contentDetails", id=",".join(batch), maxResults=len(batch)
+                    )
+                    .execute()
+                )
+            except Exception as e:
+                logger.error(
+                    f"Erreur lors de la résolution des playlists de {len(batch)} "
+                    f"chaînes: {str(e)}"
+                )
+                continue
+            if on_request:
+                on_request()
+            for channel in response.get("items", []):
+                resolved[channel["id"]] = channel["contentDetails"]["relatedPlaylists"][
+                    "uploads"
+                ]
+
+        with self._lock:
+            if resolved:
+                self.playlists.update(resolved)
+                self._save()
+                logger.info(f"{len(resolved)} playlists d'uploads mises en cache")
+            return {
+                cid: self.playlists[cid] for cid in channel_ids if cid in self.playlists
+            }
+
+    def resolve(
+        self,
+        youtube,
+        channel_id: str,
+        on_request: Optional[Callable[[], None]] = None,
+    ) -> Optional[str]:
+        """Résout la playlist des uploads d'une seule chaîne."""
+        return self.resolve_many(youtube, [channel_id], on_request).get(channel_id)
+
+    def invalidate(self, channel_id: str):
+        """Oublie la playlist d'une chaîne (après un échec de récupération)."""
+        with self._lock:
+            if self.playlists.pop(channel_id, None) is not None:
+                self._save()
+                logger.info(f"Playlist d'uploads invalidée pour la chaîne {channel_id}")
@@ -0,0 +1,199 @@
+import logging
+from typing import Callable, Dict, Iterable, List, Optional
+from config import Config
+from durations import parse_iso_duration
+
+logger = logging.getLogger(__name__)
+
+# Limite imposée par l'API YouTube pour le paramètre id de videos().list
+MAX_IDS_PER_REQUEST = 50
+
+
+def chunk_ids(video_ids: Iterable[str], size: int = MAX_IDS_PER_REQUEST):
+    """Découpe une liste d'IDs en paquets de taille maximale `size`."""
+    batch = []
+    for video_id in video_ids:
+        batch.append(video_id)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def is_short(video: Dict) -> bool:
+    """Indique si une vidéo (ressource videos().list) est un Short."""
+    snippet = video.get("snippet", {})
+    if (
+        "shorts" in snippet.get("customUrl", "").lower()
+        or "shorts" in snippet.get("description", "").lower()
+    ):
+        return True
+
+    # Ignorer les vidéos de courte durée
+    duration = video.get("contentDetails", {}).get("duration", "PT0S")
+    return parse_iso_duration(duration) <= 61
+
+
+def video_to_record(video: Dict) -> Dict:
+    """Réduit une ressource videos().list aux métadonnées utiles à l'application."""
+    duration = video.get("contentDetails", {}).get("duration", "PT0S")
+    return {
+        "id": video["id"],
+        "title": video.get("snippet", {}).get("title", ""),
+        "thumbnails": video.get("snippet", {}).get("thumbnails", {}),
+        "duration": duration,
+        "duration_seconds": parse_iso_duration(duration),
+        "is_short": is_short(video),
+        "statistics": video.get("statistics", {}),
+    }
+
+
+def records_from_details(details: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Convertit des ressources vidéo en métadonnées, en ignorant les invalides."""
+    records = {}
+    for video_id, video in details.items():
+        try:
+            records[video_id] = video_to_record(video)
+        except Exception as e:
+            logger.warning(
+                f"Erreur lors du traitement de la vidéo {video_id}: {str(e)}"
+            )
+    return records
+
+
+def format_video(item: Dict, record: Dict) -> Dict:
+    """Construit le dictionnaire renvoyé au frontend pour une vidéo."""
+    return {
+        "id": record["id"],
+        "title": item["snippet"]["title"],
+        "description": item["snippet"]["description"],
+        "publishedAt": item["snippet"]["publishedAt"],
+        "thumbnail": item["snippet"]["thumbnails"].get("medium", {}).get("url"),
+        "channelTitle": item["snippet"]["channelTitle"],
+        "duration": record["duration"],
+        "viewCount": record["statistics"].get("viewCount", "0"),
+        "likeCount": record["statistics"].get("likeCount", "0"),
+    }
+
+
+class VideoBatchFetcher:
+    """Récupère les détails des vidéos par paquets de 50 IDs par appel API."""
+
+    def __init__(
+        self,
+        youtube,
+        on_request: Optional[Callable[[], None]] = None,
+        batch_size: int = None,
+        http=None,
+        rate_limiter=None,
+        store=None,
+    ):
+        self.youtube = youtube
+        self.on_request = on_request
+        self.http = http
+        self.rate_limiter = rate_limiter
+        self.store = store
+        self.batch_size = min(
+            batch_size or Config.VIDEOS_BATCH_SIZE, MAX_IDS_PER_REQUEST
+        )
+
+    def _execute(self, request):
+        """Exécute une requête en respectant le limiteur de débit."""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        response = request.execute(http=self.http)
+        if self.on_request:
+            self.on_request()
+        return response
+
+    def fetch_details(
+        self, video_ids: List[str], part: str = "snippet,contentDetails,statistics"
+    ) -> Dict[str, Dict]:
+        """Récupère les détails de plusieurs vidéos, indexés par ID."""
+        details = {}
+        # Dédoublonner en conservant l'ordre
+        unique_ids = list(dict.fromkeys(video_ids))
+
+        for batch in chunk_ids(unique_ids, self.batch_size):
+            response = self._execute(
+                self.youtube.videos().list(part=part, id=",".join(batch))
+            )
+            for video in response.get("items", []):
+                details[video["id"]] = video
+
+        return details
+
+    def get_records(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Métadonnées des vidéos, lues via le store partagé s'il est configuré."""
+        if self.store:
+            return self.store.get_many(video_ids, self)
+        return records_from_details(self.fetch_details(video_ids))
+
+    def list_playlist_items(
+        self, playlist_id: str, max_results: int, page_token: str = None
+    ) -> Dict:
+        """Récupère une page de playlistItems."""
+        return self._execute(
+            self.youtube.playlistItems().list(
+                part="snippet,contentDetails",
+                playlistId=playlist_id,
+                maxResults=min(max_results, MAX_IDS_PER_REQUEST),
+                pageToken=page_token,
+            )
+        )
+
+    def list_playlist_items_since(
+        self, playlist_id: str, watermark: Optional[Dict], max_items: int
+    ) -> List[Dict]:
+        """Parcourt une playlist d'uploads jusqu'au dernier élément déjà vu.
+
+        Sans marqueur, seule la première page (max_items éléments) est lue.
+        """
+        items = []
+        page_token = None
+        while len(items) < max_items:
+            response = self.list_playlist_items(
+                playlist_id, max_items - len(items), page_token
+            )
+            for item in response.get("items", []):
+                if watermark and (
+                    item["snippet"]["resourceId"]["videoId"] == watermark["video_id"]
+                    or item["snippet"]["publishedAt"] <= watermark["published_at"]
+                ):
+                    return items
+                items.append(item)
+
+            page_token = response.get("nextPageToken")
+            if not watermark or not page_token:
+                break
+        return items[:max_items]
+
+    def get_playlist_videos(self, playlist_id: str, max_results: int) -> List[Dict]:
+        """Récupère les vidéos récentes d'une playlist en excluant les Shorts."""
+        response = self.list_playlist_items(playlist_id, max_results)
+        return self.build_videos(response.get("items", []))
+
+    def build_videos(self, items: List[Dict]) -> List[Dict]:
+        """Résout les détails des éléments de playlist et exclut les Shorts."""
+        video_ids = [item["snippet"]["resourceId"]["videoId"] for item in items]
+        records = self.get_records(video_ids)
+
+        videos = []
+        for item in items:
+            video_id = item["snippet"]["resourceId"]["videoId"]
+            record = records.get(video_id)
+            if not record:
+                continue
+
+            try:
+                if record["is_short"]:
+                    continue
+                videos.append(format_video(item, record))
+            except Exception as e:
+                logger.warning(
+                    f"Erreur lors du traitement de la vidéo {video_id}: {str(e)}"
+                )
+                continue
+
+        return videos
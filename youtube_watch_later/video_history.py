@@ -0,0 +1,137 @@
+import json
+import logging
+import os
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class VideoHistory:
+    """Historique des vidéos ajoutées, dans un tampon circulaire borné.
+
+    L'ajout est en O(1) (la plus ancienne entrée est écrasée) et, si un
+    fichier est fourni, seule la nouvelle entrée y est ajoutée ; le
+    fichier est compacté lorsqu'il dépasse le double de la capacité.
+    Chaque entrée porte un numéro de séquence servant de curseur ; l'accès
+    par position est en O(1), une page se trouve en O(log n + taille).
+    """
+
+    def __init__(
+        self,
+        max_items: int = None,
+        history_file: str = None,
+        entries: Optional[List[Dict]] = None,
+    ):
+        self.max_items = max_items or Config.HISTORY_MAX_ITEMS
+        self.history_file = history_file
+        self._items: List[Dict] = []
+        self._head = 0  # Position de la plus ancienne entrée une fois plein
+        self._lock = threading.Lock()
+        self._lines = 0
+        self._last_seq = 0
+
+        if history_file and os.path.exists(history_file):
+            self._load()
+        elif entries:
+            # Ancien format : liste du plus récent au plus ancien
+            for entry in reversed(entries):
+                self._push(dict(entry))
+            if history_file:
+                self._rewrite()
+
+    def _push(self, entry: Dict) -> Dict:
+        seq = entry.get("seq")
+        if not isinstance(seq, int) or seq <= self._last_seq:
+            seq = self._last_seq + 1
+        entry["seq"] = self._last_seq = seq
+        if len(self._items) < self.max_items:
+            self._items.append(entry)
+        else:
+            self._items[self._head] = entry
+            self._head = (self._head + 1) % self.max_items
+        return entry
+
+    def _at(self, index: int) -> Dict:
+        """Entrée n° `index`, de la plus ancienne à la plus récente."""
+        return self._items[(self._head + index) % len(self._items)]
+
+    def _ordered(self) -> List[Dict]:
+        """Entrées de la plus ancienne à la plus récente."""
+        return self._items[self._head :] + self._items[: self._head]
+
+    def _load(self):
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._lines += 1
+                    try:
+                        self._push(json.loads(line))
+                    except ValueError:
+                        # Ligne tronquée par un arrêt brutal : ignorée
+                        continue
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement de l'historique: {str(e)}")
+
+    def _rewrite(self):
+        """Réécrit le fichier avec les seules entrées conservées (sous verrou)."""
+        try:
+            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+            tmp_file = f"{self.history_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                for entry in self._ordered():
+                    f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            os.replace(tmp_file, self.history_file)
+            self._lines = len(self._items)
+        except Exception as e:
+            logger.error(f"Erreur lors de la compaction de l'historique: {str(e)}")
+
+    def append(self, entry: Dict) -> Dict:
+        """Ajoute une entrée ; retourne l'entrée avec son numéro de séquence."""
+        with self._lock:
+            entry = self._push(dict(entry))
+            if self.history_file:
+                try:
+                    with open(self.history_file, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+                    self._lines += 1
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'écriture de l'historique: {str(e)}")
+                if self._lines > 2 * self.max_items:
+                    self._rewrite()
+            return entry
+
+    def page(self, limit: int = 50, cursor: Optional[int] = None) -> Dict:
+        """Page de l'historique, du plus récent au plus ancien.
+
+        `cursor` est le `next_cursor` de la page précédente : seules les
+        entrées plus anciennes sont renvoyées.
+        """
+        with self._lock:
+            end = len(self._items)
+            if cursor is not None:
+                end = bisect_left(
+                    range(end), cursor, key=lambda index: self._at(index)["seq"]
+                )
+            start = max(0, end - limit)
+            items = [self._at(i) for i in range(end - 1, start - 1, -1)]
+        return {
+            "items": items,
+            "next_cursor": items[-1]["seq"] if items and start > 0 else None,
+        }
+
+    def to_list(self) -> List[Dict]:
+        """Entrées du plus récent au plus ancien (sérialisation JSON)."""
+        with self._lock:
+            return self._ordered()[::-1]
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.to_list())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self.to_list()[index]
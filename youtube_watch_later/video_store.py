@@ -0,0 +1,160 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from config import Config
+from video_fetcher import records_from_details
+
+logger = logging.getLogger(__name__)
+
+
+class VideoMetadataStore:
+    """Métadonnées des vidéos partagées par tout le processus.
+
+    Un LRU borné en mémoire précède une table SQLite. Les champs immuables
+    (durée, classification Short, titre, miniatures) et les statistiques
+    (vues, likes) ont chacun leur propre durée de validité.
+    """
+
+    def __init__(
+        self,
+        db_file: str = None,
+        max_items: int = None,
+        static_ttl: int = None,
+        stats_ttl: int = None,
+    ):
+        self.db_file = db_file or Config.VIDEO_METADATA_DB
+        self.max_items = max_items or Config.VIDEO_CACHE_SIZE
+        self.static_ttl = static_ttl or Config.VIDEO_STATIC_TTL
+        self.stats_ttl = stats_ttl or Config.VIDEO_STATS_TTL
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS video_metadata (
+                video_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                stats_at REAL NOT NULL
+            )""")
+        self._conn.commit()
+
+    def _remember(self, video_id: str, entry: Dict):
+        """Place une entrée en tête du LRU (appelé sous verrou)."""
+        self._cache[video_id] = entry
+        self._cache.move_to_end(video_id)
+        while len(self._cache) > self.max_items:
+            self._cache.popitem(last=False)
+
+    def _is_fresh(self, entry: Dict, include_statistics: bool, now: float) -> bool:
+        if now - entry["fetched_at"] > self.static_ttl:
+            return False
+        return not include_statistics or now - entry["stats_at"] <= self.stats_ttl
+
+    def _lookup(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Cherche les entrées en mémoire puis sur disque (appelé sous verrou)."""
+        found = {}
+        missing = []
+        for video_id in video_ids:
+            entry = self._cache.get(video_id)
+            if entry:
+                self._cache.move_to_end(video_id)
+                found[video_id] = entry
+            else:
+                missing.append(video_id)
+
+        for start in range(0, len(missing), 500):
+            batch = missing[start : start + 500]
+            rows = self._conn.execute(
+                "SELECT video_id, data, fetched_at, stats_at FROM video_metadata "
+                f"WHERE video_id IN ({','.join('?' * len(batch))})",
+                batch,
+            ).fetchall()
+            for video_id, data, fetched_at, stats_at in rows:
+                entry = {
+                    "record": json.loads(data),
+                    "fetched_at": fetched_at,
+                    "stats_at": stats_at,
+                }
+                self._remember(video_id, entry)
+                found[video_id] = entry
+        return found
+
+    def put_many(self, records: Dict[str, Dict]):
+        """Enregistre des métadonnées fraîchement récupérées de l'API."""
+        now = time.time()
+        with self._lock:
+            rows = []
+            for video_id, record in records.items():
+                self._remember(
+                    video_id, {"record": record, "fetched_at": now, "stats_at": now}
+                )
+                rows.append((video_id, json.dumps(record), now, now))
+            try:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO video_metadata VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors de l'écriture des métadonnées: {str(e)}")
+
+    def get_many(
+        self, video_ids: List[str], fetcher=None, include_statistics: bool = True
+    ) -> Dict[str, Dict]:
+        """Retourne les métadonnées des vidéos, en récupérant les manquantes.
+
+        Les vidéos absentes ou expirées sont demandées à `fetcher`
+        (VideoBatchFetcher) en un minimum d'appels groupés.
+        """
+        now = time.time()
+        unique_ids = list(dict.fromkeys(video_ids))
+        with self._lock:
+            entries = self._lookup(unique_ids)
+
+        records = {}
+        stale = []
+        for video_id in unique_ids:
+            entry = entries.get(video_id)
+            if entry and self._is_fresh(entry, include_statistics, now):
+                records[video_id] = entry["record"]
+            else:
+                stale.append(video_id)
+
+        with self._lock:
+            self.hits += len(records)
+            self.misses += len(stale)
+
+        if stale and fetcher is not None:
+            fetched = records_from_details(fetcher.fetch_details(stale))
+            self.put_many(fetched)
+            records.update(fetched)
+
+        return records
+
+    def get(
+        self, video_id: str, fetcher=None, include_statistics: bool = True
+    ) -> Optional[Dict]:
+        """Retourne les métadonnées d'une vidéo."""
+        return self.get_many([video_id], fetcher, include_statistics).get(video_id)
+
+    def get_stats(self) -> Dict:
+        """Compteurs du store."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "cached_items": len(self._cache),
+                "max_items": self.max_items,
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,164 @@
+import sys
+from array import array
+from collections.abc import MutableMapping
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+from durations import seconds_to_minutes
+from stats_aggregates import entry_seconds
+from rollup_index import RollupIndex
+from video_history import VideoHistory
+
+EPOCH = datetime(1970, 1, 1)
+NO_CHANNEL = -1
+
+
+def iso_to_micros(value: Optional[str]) -> int:
+    """Date ISO (sans fuseau) -> microsecondes depuis l'epoch, sans perte."""
+    if not value:
+        return 0
+    delta = datetime.fromisoformat(value).replace(tzinfo=None) - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def micros_to_iso(value: int) -> str:
+    return (EPOCH + timedelta(microseconds=value)).isoformat() if value else ""
+
+
+class TrackedVideoTable(MutableMapping):
+    """Table compacte des vidéos suivies, stockée en colonnes.
+
+    Durées (secondes entières) et dates d'ajout sont des tableaux typés,
+    l'identifiant de chaîne
+    est interné et les titres sont rangés dans une table à part. La table
+    se manipule comme le dictionnaire {video_id: {...}} qu'elle remplace ;
+    chaque lecture reconstruit l'entrée, la modifier ne change pas la table.
+    """
+
+    def __init__(self, videos: Optional[Dict[str, Dict]] = None):
+        self._rows: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self._seconds = array("q")
+        self._added_at = array("q")
+        self._channels = array("i")
+        self._titles: List[Optional[str]] = []
+        self._channel_ids: List[str] = []
+        self._channel_index: Dict[str, int] = {}
+        self.version = 0  # Incrémenté à chaque modification
+        for video_id, entry in (videos or {}).items():
+            self[video_id] = entry
+
+    def _intern_channel(self, channel_id: Optional[str]) -> int:
+        if not channel_id:
+            return NO_CHANNEL
+        index = self._channel_index.get(channel_id)
+        if index is None:
+            index = len(self._channel_ids)
+            self._channel_ids.append(sys.intern(channel_id))
+            self._channel_index[channel_id] = index
+        return index
+
+    def __setitem__(self, video_id: str, entry: Dict):
+        seconds = entry_seconds(entry)
+        added_at = iso_to_micros(entry.get("added_at"))
+        channel = self._intern_channel(entry.get("channel_id"))
+        title = entry.get("title")
+
+        self.version += 1
+        row = self._rows.get(video_id)
+        if row is None:
+            self._rows[video_id] = len(self._ids)
+            self._ids.append(video_id)
+            self._seconds.append(seconds)
+            self._added_at.append(added_at)
+            self._channels.append(channel)
+            self._titles.append(title)
+        else:
+            self._seconds[row] = seconds
+            self._added_at[row] = added_at
+            self._channels[row] = channel
+            self._titles[row] = title
+
+    def __getitem__(self, video_id: str) -> Dict:
+        return self._entry(self._rows[video_id])
+
+    def __delitem__(self, video_id: str):
+        # Déplacer la dernière ligne dans l'emplacement libéré : O(1)
+        row = self._rows.pop(video_id)
+        self.version += 1
+        last = len(self._ids) - 1
+        if row != last:
+            moved = self._ids[last]
+            self._rows[moved] = row
+            self._ids[row] = moved
+            self._seconds[row] = self._seconds[last]
+            self._added_at[row] = self._added_at[last]
+            self._channels[row] = self._channels[last]
+            self._titles[row] = self._titles[last]
+        self._ids.pop()
+        self._seconds.pop()
+        self._added_at.pop()
+        self._channels.pop()
+        self._titles.pop()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ids))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, video_id) -> bool:
+        return video_id in self._rows
+
+    def _entry(self, row: int) -> Dict:
+        channel = self._channels[row]
+        seconds = self._seconds[row]
+        return {
+            "seconds": seconds,
+            "duration": seconds_to_minutes(seconds),  # Minutes, pour l'affichage
+            "added_at": micros_to_iso(self._added_at[row]),
+            "title": self._titles[row],
+            "channel_id": self._channel_ids[channel] if channel != NO_CHANNEL else None,
+        }
+
+    def copy(self) -> "TrackedVideoTable":
+        """Copie indépendante : quelques copies de tableaux, sans reconstruire les entrées."""
+        clone = TrackedVideoTable.__new__(TrackedVideoTable)
+        clone._rows = dict(self._rows)
+        clone._ids = list(self._ids)
+        clone._seconds = self._seconds[:]
+        clone._added_at = self._added_at[:]
+        clone._channels = self._channels[:]
+        clone._titles = list(self._titles)
+        clone._channel_ids = list(self._channel_ids)
+        clone._channel_index = dict(self._channel_index)
+        clone.version = self.version
+        return clone
+
+    def rows(self) -> Iterator[tuple]:
+        """Parcours rapide : (video_id, secondes, ajout en µs epoch, chaîne)."""
+        channel_ids = self._channel_ids
+        for video_id, seconds, added_at, channel in zip(
+            self._ids, self._seconds, self._added_at, self._channels
+        ):
+            yield video_id, seconds, added_at, (
+                channel_ids[channel] if channel != NO_CHANNEL else None
+            )
+
+    def total_seconds(self) -> int:
+        """Somme des durées, directement sur la colonne."""
+        return sum(self._seconds)
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Dictionnaire équivalent (sérialisation JSON)."""
+        return {video_id: self._entry(row) for row, video_id in enumerate(self._ids)}
+
+
+def json_default(value):
+    """Hook `default` de json.dump pour les structures compactes."""
+    if isinstance(value, TrackedVideoTable):
+        return value.to_dict()
+    if isinstance(value, VideoHistory):
+        return value.to_list()
+    if isinstance(value, RollupIndex):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
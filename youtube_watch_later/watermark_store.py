@@ -0,0 +1,73 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelWatermarkStore:
+    """Dernière vidéo vue par chaîne (publishedAt + ID), persistée sur disque."""
+
+    def __init__(self, watermarks_file: str = None):
+        self.watermarks_file = watermarks_file or Config.CHANNEL_WATERMARKS_FILE
+        self._lock = threading.Lock()
+        self.watermarks: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        try:
+            if os.path.exists(self.watermarks_file):
+                with open(self.watermarks_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement des marqueurs: {str(e)}")
+        return {}
+
+    def _save(self):
+        """Écriture atomique : fichier temporaire puis renommage (sous verrou)."""
+        try:
+            os.makedirs(os.path.dirname(self.watermarks_file), exist_ok=True)
+            tmp_file = f"{self.watermarks_file}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self.watermarks, f, separators=(",", ":"))
+            os.replace(tmp_file, self.watermarks_file)
+        except Exception as e:
+            logger.error(f"Erreur lors de la sauvegarde des marqueurs: {str(e)}")
+
+    def get(self, channel_id: str) -> Optional[Dict]:
+        """Retourne le marqueur d'une chaîne, ou None si elle n'a jamais été vue."""
+        return self.watermarks.get(channel_id)
+
+    def update(self, channel_id: str, video_id: str, published_at: str):
+        """Avance le marqueur d'une chaîne."""
+        self.update_many({channel_id: (video_id, published_at)})
+
+    def update_many(self, marks: Dict[str, tuple]):
+        """Avance plusieurs marqueurs en une seule écriture."""
+        with self._lock:
+            changed = False
+            for channel_id, (video_id, published_at) in marks.items():
+                current = self.watermarks.get(channel_id)
+                if current and current["published_at"] >= published_at:
+                    continue
+                self.watermarks[channel_id] = {
+                    "video_id": video_id,
+                    "published_at": published_at,
+                    "updated_at": datetime.now().isoformat(),
+                }
+                changed = True
+            if changed:
+                self._save()
+
+    def prune(self, channel_ids: List[str]):
+        """Supprime les marqueurs des chaînes qui ne sont plus suivies."""
+        keep = set(channel_ids)
+        with self._lock:
+            removed = [cid for cid in self.watermarks if cid not in keep]
+            for channel_id in removed:
+                del self.watermarks[channel_id]
+            if removed:
+                self._save()
@@ -0,0 +1,352 @@
+"""Serveur local imitant le sous-ensemble de l'API YouTube Data v3 utilisé par l'application.
+
+Permet de tester la charge et de profiler les routes sans consommer de quota :
+
+    python youtube_standin.py --channels 5000 --videos-per-channel 10 --latency 0.05
+
+puis lancer l'application avec YOUTUBE_API_ENDPOINT=http://127.0.0.1:8090.
+"""
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+from flask import Flask, jsonify, request, Response
+
+MAX_RESULTS = 50
+WATCH_LATER_PLAYLIST_ID = "PLstandinwatchlater"
+
+
+class StandinSettings:
+    """Paramètres d'injection de latence et d'erreurs."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        quota_exceeded_rate: float = 0.0,
+        quota_limit: int = 10000,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.quota_exceeded_rate = quota_exceeded_rate
+        self.quota_limit = quota_limit
+
+
+class StandinDataset:
+    """Jeu de données synthétique et déterministe : chaînes, vidéos, playlists."""
+
+    def __init__(self, channels: int = 500, videos_per_channel: int = 20, seed=42):
+        rng = random.Random(seed)
+        now = datetime(2024, 1, 1)
+        self.channels: Dict[str, Dict] = {}
+        self.videos: Dict[str, Dict] = {}
+        self.uploads: Dict[str, List[str]] = {}
+        self.playlists: Dict[str, Dict] = {
+            WATCH_LATER_PLAYLIST_ID: {"title": "Watch Later Pro", "items": []}
+        }
+        self._lock = threading.Lock()
+        self._next_item = 0
+
+        for c in range(channels):
+            channel_id = f"UC{c:022d}"
+            self.channels[channel_id] = {
+                "title": f"Chaîne {c}",
+                "description": f"Description de la chaîne {c} " * 5,
+                "subscriberCount": str(rng.randint(100, 5_000_000)),
+            }
+            video_ids = []
+            published = now - timedelta(hours=rng.randint(0, 48))
+            for v in range(videos_per_channel):
+                video_id = hashlib.sha1(f"{channel_id}-{v}".encode()).hexdigest()[:11]
+                # Environ 10 % de Shorts
+                seconds = (
+                    rng.randint(15, 59)
+                    if rng.random() < 0.1
+                    else rng.randint(120, 7200)
+                )
+                self.videos[video_id] = {
+                    "channel_id": channel_id,
+                    "title": f"Vidéo {v} de la chaîne {c}",
+                    "description": f"Description de la vidéo {v} " * 10,
+                    "publishedAt": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "duration": f"PT{seconds // 3600}H{seconds % 3600 // 60}M{seconds % 60}S",
+                    "viewCount": str(rng.randint(0, 10_000_000)),
+                    "likeCount": str(rng.randint(0, 100_000)),
+                }
+                video_ids.append(video_id)
+                published -= timedelta(hours=rng.randint(1, 24 * 7))
+            self.uploads[f"UU{channel_id[2:]}"] = video_ids
+
+    def new_item_id(self) -> str:
+        with self._lock:
+            self._next_item += 1
+            return f"PLI{self._next_item:012d}"
+
+
+def _thumbnails(key: str) -> Dict:
+    return {
+        size: {"url": f"https://i.ytimg.com/vi/{key}/{size}.jpg"}
+        for size in ("default", "medium", "high")
+    }
+
+
+def _paginate(items: List, max_results: int, page_token: str):
+    start = int(page_token or 0)
+    end = start + max_results
+    page = {"items": items[start:end], "pageInfo": {"totalResults": len(items)}}
+    if end < len(items):
+        page["nextPageToken"] = str(end)
+    return page
+
+
+def _error(code: int, reason: str, message: str):
+    body = {
+        "error": {
+            "code": code,
+            "message": message,
+            "errors": [{"reason": reason, "domain": "youtube.standin"}],
+        }
+    }
+    return jsonify(body), code
+
+
+def create_standin_app(dataset: StandinDataset, settings: StandinSettings) -> Flask:
+    """Crée l'application Flask servant l'API simulée."""
+    app = Flask(__name__)
+    state = {"quota_used": 0, "requests": 0}
+    lock = threading.Lock()
+
+    def max_results() -> int:
+        return min(int(request.args.get("maxResults", 5)), MAX_RESULTS)
+
+    def ids() -> List[str]:
+        return [i for i in request.args.get("id", "").split(",") if i]
+
+    @app.before_request
+    def inject_faults():
+        if not request.path.startswith("/youtube/v3/"):
+            return None
+        if settings.latency:
+            time.sleep(settings.latency)
+
+        cost = 1 if request.method == "GET" else 50
+        with lock:
+            state["requests"] += 1
+            exhausted = state["quota_used"] + cost > settings.quota_limit
+            if not exhausted:
+                state["quota_used"] += cost
+
+        if exhausted or random.random() < settings.quota_exceeded_rate:
+            return _error(
+                403, "quotaExceeded", "The request cannot be completed (quota)."
+            )
+        if random.random() < settings.error_rate:
+            return _error(503, "backendError", "Backend Error")
+        return None
+
+    @app.after_request
+    def add_etag(response):
+        # ETag faible calculé sur le corps, avec support de If-None-Match
+        if request.method == "GET" and response.status_code == 200:
+            etag = '"' + hashlib.md5(response.get_data()).hexdigest() + '"'
+            if request.headers.get("If-None-Match") == etag:
+                return Response(status=304, headers={"ETag": etag})
+            response.headers["ETag"] = etag
+        return response
+
+    @app.route("/youtube/v3/channels")
+    def channels():
+        channel_ids = ids() or list(dataset.channels)[:1]
+        items = [
+            {
+                "kind": "youtube#channel",
+                "id": cid,
+                "snippet": {
+                    "title": dataset.channels[cid]["title"],
+                    "description": dataset.channels[cid]["description"],
+                    "thumbnails": _thumbnails(cid),
+                },
+                "contentDetails": {"relatedPlaylists": {"uploads": f"UU{cid[2:]}"}},
+                "statistics": {
+                    "subscriberCount": dataset.channels[cid]["subscriberCount"],
+                    "videoCount": str(len(dataset.uploads[f"UU{cid[2:]}"])),
+                },
+            }
+            for cid in channel_ids
+            if cid in dataset.channels
+        ]
+        return jsonify({"kind": "youtube#channelListResponse", "items": items})
+
+    @app.route("/youtube/v3/subscriptions")
+    def subscriptions():
+        items = [
+            {
+                "kind": "youtube#subscription",
+                "id": f"SUB{cid}",
+                "snippet": {
+                    "title": channel["title"],
+                    "description": channel["description"],
+                    "resourceId": {"kind": "youtube#channel", "channelId": cid},
+                    "thumbnails": _thumbnails(cid),
+                },
+            }
+            for cid, channel in dataset.channels.items()
+        ]
+        page = _paginate(items, max_results(), request.args.get("pageToken"))
+        return jsonify({"kind": "youtube#subscriptionListResponse", **page})
+
+    @app.route("/youtube/v3/playlists", methods=["GET", "POST"])
+    def playlists():
+        if request.method == "POST":
+            body = request.get_json(silent=True) or {}
+            playlist_id = f"PL{dataset.new_item_id()}"
+            title = body.get("snippet", {}).get("title", "Sans titre")
+            dataset.playlists[playlist_id] = {"title": title, "items": []}
+            return jsonify({"id": playlist_id, "snippet": {"title": title}})
+
+        items = [
+            {"id": pid, "snippet": {"title": p["title"]}}
+            for pid, p in dataset.playlists.items()
+            if not ids() or pid in ids()
+        ]
+        return jsonify({"kind": "youtube#playlistListResponse", "items": items})
+
+    def _playlist_item(playlist_id: str, item_id: str, video_id: str) -> Dict:
+        video = dataset.videos[video_id]
+        return {
+            "kind": "youtube#playlistItem",
+            "id": item_id,
+            "snippet": {
+                "playlistId": playlist_id,
+                "title": video["title"],
+                "description": video["description"],
+                "publishedAt": video["publishedAt"],
+                "channelTitle": dataset.channels[video["channel_id"]]["title"],
+                "thumbnails": _thumbnails(video_id),
+                "resourceId": {"kind": "youtube#video", "videoId": video_id},
+            },
+            "contentDetails": {
+                "videoId": video_id,
+                "videoPublishedAt": video["publishedAt"],
+            },
+        }
+
+    @app.route("/youtube/v3/playlistItems", methods=["GET", "POST", "DELETE"])
+    def playlist_items():
+        if request.method == "POST":
+            snippet = (request.get_json(silent=True) or {}).get("snippet", {})
+            playlist = dataset.playlists.get(snippet.get("playlistId"))
+            video_id = snippet.get("resourceId", {}).get("videoId")
+            if playlist is None or video_id not in dataset.videos:
+                return _error(404, "notFound", "Playlist or video not found.")
+            item_id = dataset.new_item_id()
+            playlist["items"].append((item_id, video_id))
+            return jsonify(_playlist_item(snippet["playlistId"], item_id, video_id))
+
+        if request.method == "DELETE":
+            for playlist in dataset.playlists.values():
+                before = len(playlist["items"])
+                playlist["items"] = [
+                    entry for entry in playlist["items"] if entry[0] not in ids()
+                ]
+                if len(playlist["items"]) != before:
+                    return Response(status=204)
+            return _error(404, "playlistItemNotFound", "Playlist item not found.")
+
+        playlist_id = request.args.get("playlistId", "")
+        if playlist_id in dataset.uploads:
+            entries = [
+                (f"UPI{video_id}", video_id)
+                for video_id in dataset.uploads[playlist_id]
+            ]
+        elif playlist_id in dataset.playlists:
+            entries = dataset.playlists[playlist_id]["items"]
+        else:
+            return _error(404, "playlistNotFound", "Playlist not found.")
+
+        items = [_playlist_item(playlist_id, i, v) for i, v in entries]
+        page = _paginate(items, max_results(), request.args.get("pageToken"))
+        return jsonify({"kind": "youtube#playlistItemListResponse", **page})
+
+    @app.route("/youtube/v3/videos")
+    def videos():
+        video_ids = ids()
+        if len(video_ids) > MAX_RESULTS:
+            return _error(400, "invalidParameter", "Too many video IDs.")
+        items = []
+        for video_id in video_ids:
+            video = dataset.videos.get(video_id)
+            if not video:
+                continue
+            items.append(
+                {
+                    "kind": "youtube#video",
+                    "id": video_id,
+                    "snippet": {
+                        "title": video["title"],
+                        "description": video["description"],
+                        "publishedAt": video["publishedAt"],
+                        "channelId": video["channel_id"],
+                        "channelTitle": dataset.channels[video["channel_id"]]["title"],
+                        "thumbnails": _thumbnails(video_id),
+                    },
+                    "contentDetails": {"duration": video["duration"]},
+                    "statistics": {
+                        "viewCount": video["viewCount"],
+                        "likeCount": video["likeCount"],
+                    },
+                }
+            )
+        return jsonify({"kind": "youtube#videoListResponse", "items": items})
+
+    @app.route("/standin/stats")
+    def stats():
+        with lock:
+            return jsonify(dict(state))
+
+    return app
+
+
+def build_standin_client(endpoint: str):
+    """Construit un client googleapiclient pointant vers le serveur simulé."""
+    from googleapiclient.discovery import build
+
+    return build(
+        "youtube",
+        "v3",
+        developerKey="standin",
+        client_options={"api_endpoint": endpoint},
+        static_discovery=True,
+        cache_discovery=False,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur local simulant l'API YouTube")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--channels", type=int, default=500)
+    parser.add_argument("--videos-per-channel", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Secondes")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--quota-exceeded-rate", type=float, default=0.0)
+    parser.add_argument("--quota-limit", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    dataset = StandinDataset(args.channels, args.videos_per_channel, args.seed)
+    settings = StandinSettings(
+        args.latency, args.error_rate, args.quota_exceeded_rate, args.quota_limit
+    )
+    print(
+        f"API simulée: {len(dataset.channels)} chaînes, {len(dataset.videos)} vidéos "
+        f"sur http://127.0.0.1:{args.port}"
+    )
+    create_standin_app(dataset, settings).run(port=args.port, threaded=True)
+
+
+if __name__ == "__main__":
+    main()